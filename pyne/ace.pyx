@@ -18,6 +18,7 @@ generates ACE-format cross sections.
 
 from __future__ import division, unicode_literals
 import io
+import mmap
 import struct
 from warnings import warn
 from pyne.utils import QAWarning
@@ -30,6 +31,7 @@ from bisect import bisect_right
 from pyne cimport nucname
 from pyne import nucname
 from pyne.rxname import label
+from pyne.ace_cache import AceCache
 
 # fromstring func should depend on numpy verison
 from pyne._utils import fromstring_split, fromstring_token
@@ -120,6 +122,10 @@ class Library(object):
     ----------
     filename : str
         Path of the ACE library file to load.
+    cache : AceCache, str, or None, optional
+        Cache of parsed tables, or the path to its directory, used for ASCII
+        libraries. Tables are loaded from the cache when it holds all of
+        those requested, and stored in it after being parsed otherwise.
 
     Attributes
     ----------
@@ -128,12 +134,26 @@ class Library(object):
     tables : dict
         Dictionary whose keys are the names of the ACE tables and whose
         values are the instances of subclasses of AceTable (e.g. NeutronTable)
+    offsets : dict
+        Dictionary whose keys are the names of the tables seen while reading
+        a binary library and whose values are their byte offsets in the file
     verbose : bool
         Determines whether output is printed to the stdout when reading a
         Library
+
+    Notes
+    -----
+    The file, and the memory map of a lazily read binary library, stay open
+    until close() is called or the library is garbage collected. Libraries
+    may also be used as context managers.
     """
 
-    def __init__(self, filename):
+    def __init__(self, filename, cache=None):
+        self.filename = filename
+        if isinstance(cache, basestring):
+            cache = AceCache(cache)
+        self.cache = cache
+
         # Determine whether file is ASCII or binary
         self.f = None
         try:
@@ -157,9 +177,12 @@ class Library(object):
         # Set verbosity
         self.verbose = False
         self.tables = {}
+        self.offsets = {}
+        self._mmap = None
+        self._mapped = []  # names of tables whose xss views self._mmap
 
-    def read(self, table_names=None):
-        """read(table_names=None)
+    def read(self, table_names=None, lazy=False):
+        """read(table_names=None, lazy=False)
 
         Read through and parse the ACE-format library.
 
@@ -168,6 +191,11 @@ class Library(object):
         table_names : None, str, or iterable, optional
             Tables from the file to read in.  If None, reads in all of the
             tables. If str, reads in only the single table of a matching name.
+        lazy : bool, optional
+            If True, the data blocks of each table (cross sections, nu,
+            angular and energy distributions, etc.) are only parsed when their
+            attributes are first accessed, and the XSS arrays of binary
+            libraries are copy-on-write views of the memory-mapped file.
         """
         if isinstance(table_names, basestring):
             table_names = [table_names]
@@ -175,12 +203,49 @@ class Library(object):
         if table_names is not None:
             table_names = set(table_names)
 
+        seen = set(self.tables)
+        use_cache = self.cache is not None and not self.binary
+        if use_cache and self.cache.has_tables(self.filename, table_names):
+            try:
+                self._read_cache(table_names, lazy)
+                return
+            except (IOError, OSError):
+                # another process sharing the cache evicted the entry
+                self.cache.evict(self.cache.key(self.filename))
+
         if self.binary:
-            self._read_binary(table_names)
+            self._read_binary(table_names, lazy=lazy)
         else:
-            self._read_ascii(table_names)
+            self._read_ascii(table_names, lazy=lazy)
+
+        if use_cache:
+            tables = [table for name, table in self.tables.items()
+                      if name not in seen]
+            self.cache.store(self.filename, tables,
+                             complete=table_names is None)
+
+    def _read_cache(self, table_names, lazy=False):
+        for data in self.cache.load(self.filename, table_names):
+            name = data['name']
+            table = table_types[name[-1]](name, data['awr'], data['temp'])
+            if self.verbose:
+                temp_in_K = round(data['temp'] * 1e6 / 8.617342e-5)
+                print("Loading nuclide {0} at {1} K".format(name, temp_in_K))
+            self.tables[name] = table
+            if data['comment'] is not None:
+                table.comment = data['comment']
+            table.nxs = data['nxs']
+            table.jxs = data['jxs']
+            table.xss = data['xss']
+            if lazy:
+                table._defer()
+            else:
+                table._read_all()
 
-    def _read_binary(self, table_names, recl_length=4096, entries=512):
+    def _read_binary(self, table_names, recl_length=4096, entries=512,
+                     lazy=False):
+        if lazy and self._mmap is None:
+            self._mmap = mmap.mmap(self.f.fileno(), 0, access=mmap.ACCESS_COPY)
         while True:
             start_position = self.f.tell()
 
@@ -207,6 +272,7 @@ class Library(object):
 
             # name is bytes, make it a string
             name = name.decode()
+            self.offsets[name] = start_position
             # verify that we are supposed to read this table in
             if (table_names is not None) and (name not in table_names):
                 self.f.seek(start_position + recl_length*(n_records + 1))
@@ -230,11 +296,6 @@ class Library(object):
             # Read JXS
             table.jxs = list(struct.unpack(str('=32i'), self.f.read(128)))
 
-            # Read XSS
-            self.f.seek(start_position + recl_length)
-            table.xss = list(struct.unpack(str('={0}d'.format(length)),
-                                           self.f.read(length*8)))
-
             # Insert empty object at beginning of NXS, JXS, and XSS
             # arrays so that the indexing will be the same as
             # Fortran. This makes it easier to follow the ACE format
@@ -246,16 +307,32 @@ class Library(object):
             table.jxs.insert(0, 0)
             table.jxs = np.array(table.jxs, dtype=int)
 
-            table.xss.insert(0, 0.0)
-            table.xss = np.array(table.xss, dtype=float)
+            # Read XSS
+            if lazy:
+                # View XSS in place, starting one value early in the padding
+                # of the first record for the Fortran indexing
+                table.xss = np.frombuffer(self._mmap, dtype=float,
+                                          count=length + 1,
+                                          offset=start_position + recl_length - 8)
+                table.xss[0] = 0.0
+                self._mapped.append(name)
+            else:
+                self.f.seek(start_position + recl_length)
+                table.xss = list(struct.unpack(str('={0}d'.format(length)),
+                                               self.f.read(length*8)))
+                table.xss.insert(0, 0.0)
+                table.xss = np.array(table.xss, dtype=float)
 
             # Read all data blocks
-            table._read_all()
+            if lazy:
+                table._defer()
+            else:
+                table._read_all()
 
             # Advance to next record
             self.f.seek(start_position + recl_length*(n_records + 1))
 
-    def _read_ascii(self, table_names):
+    def _read_ascii(self, table_names, lazy=False):
         cdef list lines, rawdata
 
         f = self.f
@@ -353,7 +430,10 @@ class Library(object):
                 table.xss = fromstring_token(datastr, inplace=True, maxsize=4*n_lines+1)
 
             # Read all data blocks
-            table._read_all()
+            if lazy:
+                table._defer()
+            else:
+                table._read_all()
             lines = [f.readline() for i in range(13)]
 
         f.seek(0)
@@ -371,22 +451,88 @@ class Library(object):
         """
         return self.tables.get(name, None)
 
-    def __del__(self):
+    def close(self):
+        """Closes the library file and the memory map of a lazily read binary
+        library. The XSS arrays viewing the map are copied into memory first,
+        so that the unread data blocks of their tables can still be read.
+        """
+        if self._mmap is not None:
+            for name in self._mapped:
+                table = self.tables.get(name)
+                if table is not None:
+                    table.xss = np.array(table.xss)
+            self._mapped = []
+            try:
+                self._mmap.close()
+            except BufferError:
+                # other views of the map are alive; it is released with them
+                pass
+            self._mmap = None
         if self.f is not None:
             self.f.close()
 
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __del__(self):
+        if getattr(self, '_mmap', None) is not None:
+            self.close()
+        elif getattr(self, 'f', None) is not None:
+            self.f.close()
+
 
 class AceTable(object):
     """Abstract superclass of all other classes for cross section tables."""
 
+    # Groups of reader methods which may be deferred until one of the
+    # attributes they set is accessed, and the group setting each attribute
+    _lazy_groups = {}
+    _lazy_attrs = {}
+
     def __init__(self, name, awr, temp):
         self.name = name
         self.awr = awr
         self.temp = temp
 
+    def __getattr__(self, name):
+        # only called when the attribute is not found normally
+        group = self._lazy_attrs.get(name)
+        if group is not None and group in self.__dict__.get('_unread', ()):
+            self._read_group(group)
+            return getattr(self, name)
+        raise AttributeError("{0!r} object has no attribute "
+                             "{1!r}".format(type(self).__name__, name))
+
     def _read_all(self):
         raise NotImplementedError
 
+    def _defer(self):
+        """Defers reading the data blocks until their attributes are
+        accessed. Tables without deferrable groups are read immediately.
+        """
+        if len(self._lazy_groups) == 0:
+            self._read_all()
+            return
+        self._unread = set(self._lazy_groups)
+        for name in self._lazy_attrs:
+            self.__dict__.pop(name, None)
+
+    def _read_group(self, group):
+        """Runs the reader methods of a deferred group, once. Groups with the
+        same reader methods are read together.
+        """
+        if group not in self.__dict__.get('_unread', ()):
+            return
+        readers = self._lazy_groups[group]
+        for other in list(self._unread):
+            if self._lazy_groups[other] == readers:
+                self._unread.discard(other)
+        for reader in readers:
+            getattr(self, reader)()
+
 
 class NeutronTable(AceTable):
     """A NeutronTable object contains continuous-energy neutron interaction data
@@ -458,6 +604,38 @@ class NeutronTable(AceTable):
 
     """
 
+    # The NU and DLW blocks both set the e_dist_* attributes through
+    # _get_energy_distribution(), so they are read together and in the same
+    # order as the eager reader.
+    _lazy_groups = {
+        'cross_sections': ('_read_cross_sections',),
+        'nu': ('_read_nu', '_read_energy_distributions'),
+        'angular': ('_read_angular_distributions',),
+        'energy_dist': ('_read_nu', '_read_energy_distributions'),
+        'photon': ('_read_gpd', '_read_mtrp', '_read_lsigp', '_read_sigp',
+                   '_read_landp', '_read_andp', '_read_yp'),
+        'fission': ('_read_fis',),
+        'unr': ('_read_unr',),
+        }
+    _lazy_attrs = dict(
+        [(attr, 'cross_sections') for attr in ('energy', 'sigma_t', 'sigma_a',
+                                                'heating', 'reactions')] +
+        [(attr, 'nu') for attr in ('nu_t_type', 'nu_t_energy', 'nu_t_value',
+                                   'nu_p_type', 'nu_p_energy', 'nu_p_value',
+                                   'nu_d_energy', 'nu_d_value',
+                                   'nu_d_precursor_const',
+                                   'nu_d_precursor_energy',
+                                   'nu_d_precursor_prob', 'nu_d_energy_dist')] +
+        [(attr, 'energy_dist') for attr in ('e_dist_energy_out1',
+                                            'e_dist_energy_out2',
+                                            'e_dist_energy_outNE',
+                                            'e_dist_LP', 'e_dist_EG')] +
+        [(attr, 'photon') for attr in ('sigma_photon', 'photon_reactions',
+                                       'sigma', 'a_dist_energy_in',
+                                       'a_dist_mu_out', 'MT_for_photon_yield')] +
+        [(attr, 'fission') for attr in ('IE_fission', 'sigma_f')] +
+        [(attr, 'unr') for attr in ('urr_energy', 'urr_table')])
+
     def __init__(self, name, awr, temp):
         super(NeutronTable, self).__init__(name, awr, temp)
         self.reactions = OrderedDict()
@@ -509,6 +687,7 @@ class NeutronTable(AceTable):
         self.energy, self.sigma_t, self.sigma_a, sigma_el, self.heating = arr
 
         # Create elastic scattering reaction
+        self.reactions = OrderedDict()
         elastic_scatter = Reaction(2, self)
         elastic_scatter.Q = 0.0
         elastic_scatter.IE = 0
@@ -1210,7 +1389,7 @@ class NeutronTable(AceTable):
         NMT = self.nxs[6]
         mts = np.asarray(self.xss[LMT:LMT+NMT], dtype=int)
         rxs = [(mt, Reaction(mt, self)) for mt in mts]
-        self.photon_reactions.update(rxs)
+        self.photon_reactions = OrderedDict(rxs)
 
     def _read_lsigp(self):
         """Determine location of cross sections for each photon-producing reaction
@@ -1556,6 +1735,22 @@ class Reaction(object):
         self.IE = 0        # Energy grid index
         self.sigma = []    # Cross section values
 
+    # Attributes set by deferred groups of reader methods of the table
+    _lazy_attrs = {'ang_energy_in': 'angular', 'ang_cos': 'angular',
+                   'ang_pdf': 'angular', 'ang_cdf': 'angular',
+                   'energy_dist': 'energy_dist'}
+
+    def __getattr__(self, name):
+        # only called when the attribute is not found normally
+        group = Reaction._lazy_attrs.get(name)
+        table = self.__dict__.get('table')
+        if group is not None and table is not None and \
+           group in table.__dict__.get('_unread', ()):
+            table._read_group(group)
+            return getattr(self, name)
+        raise AttributeError("'Reaction' object has no attribute "
+                             "{0!r}".format(name))
+
     def broaden(self, T_high):
         pass
 
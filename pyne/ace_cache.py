@@ -0,0 +1,296 @@
+#!/usr/bin/env python
+"""An on-disk cache of the NXS, JXS, and XSS arrays of parsed ACE tables, so
+that ASCII ACE libraries need to be parsed only once. Arrays are stored as
+.npy files and memory-mapped when loaded. This module also provides a command
+line interface to prebuild the cache for all of the ASCII libraries in an
+MCNP xsdir file.
+"""
+from __future__ import division, print_function
+import os
+import json
+import shutil
+import hashlib
+from contextlib import contextmanager
+from warnings import warn
+from pyne.utils import QAWarning
+
+import numpy as np
+
+try:
+    import argparse
+except ImportError:
+    from . import _argparse as argparse
+
+warn(__name__ + " is not yet QA compliant.", QAWarning)
+
+_replace = getattr(os, 'replace', os.rename)
+
+
+def file_hash(filename, blocksize=2**20):
+    """Returns the SHA-1 hex digest of the contents of a file."""
+    sha = hashlib.sha1()
+    with open(filename, 'rb') as f:
+        block = f.read(blocksize)
+        while block:
+            sha.update(block)
+            block = f.read(blocksize)
+    return sha.hexdigest()
+
+
+class AceCache(object):
+    """A directory of parsed ACE tables. Each ACE file has an entry keyed by
+    its absolute path, size, and modification time, holding the tables read
+    from it and the SHA-1 hash of its contents. Entries are evicted in least
+    recently used order once the cache is larger than max_size; the
+    modification time of an entry's directory serves as its access time, so
+    loading never rewrites the index and works on read-only caches.
+
+    Several processes may share a cache: table files are written under
+    temporary names and renamed into place, and the index on disk is merged
+    into this one before it is written.
+
+    Parameters
+    ----------
+    directory : str
+        Path to the cache directory, created if it does not exist.
+    max_size : int or None, optional
+        Maximum size of the cached arrays [bytes]. None means no limit.
+    verify : bool, optional
+        Check the content hash of ACE files against that of their entry
+        before loading from it.
+
+    Attributes
+    ----------
+    index : dict
+        Maps entry keys to their metadata: source path, size, mtime, sha1,
+        the tables they hold, whether they hold every table in the file, and
+        their size in bytes.
+    """
+
+    def __init__(self, directory, max_size=None, verify=False):
+        self.directory = os.path.abspath(directory)
+        self.max_size = max_size
+        self.verify = verify
+        if not os.path.isdir(self.directory):
+            os.makedirs(self.directory)
+        self._index_file = os.path.join(self.directory, 'index.json')
+        self.index = self._read_index()
+
+    def key(self, filename):
+        """Returns the entry key for an ACE file."""
+        path = os.path.abspath(filename)
+        st = os.stat(path)
+        ident = '{0}|{1}|{2!r}'.format(path, st.st_size, st.st_mtime)
+        return hashlib.sha1(ident.encode('utf-8')).hexdigest()
+
+    def _read_index(self):
+        try:
+            with open(self._index_file, 'r') as f:
+                return json.load(f)
+        except (IOError, OSError, ValueError):
+            return {}
+
+    def _write_index(self):
+        tmp = self._index_file + '.tmp'
+        with open(tmp, 'w') as f:
+            json.dump(self.index, f)
+        _replace(tmp, self._index_file)
+
+    def _table_path(self, key, name, suffix):
+        return os.path.join(self.directory, key, name + suffix)
+
+    def _atime(self, key):
+        """Returns the last access time of an entry."""
+        try:
+            return os.path.getmtime(os.path.join(self.directory, key))
+        except OSError:
+            return 0.0
+
+    def _touch(self, key):
+        """Records an access to an entry, if the cache is writable."""
+        try:
+            os.utime(os.path.join(self.directory, key), None)
+        except OSError:
+            pass
+
+    def entry(self, filename):
+        """Returns the metadata of the entry for an ACE file, or None if it
+        is not cached or, when verifying, its contents have changed.
+        """
+        key = self.key(filename)
+        meta = self.index.get(key)
+        if meta is None:
+            return None
+        if self.verify and meta['sha1'] != file_hash(filename):
+            self.evict(key)
+            return None
+        return meta
+
+    def has_tables(self, filename, table_names=None):
+        """Whether the given tables of an ACE file are cached. If
+        table_names is None, whether every table in the file is.
+        """
+        meta = self.entry(filename)
+        if meta is None:
+            return False
+        if table_names is None:
+            return meta['complete']
+        return set(table_names) <= set(meta['tables'])
+
+    def load(self, filename, table_names=None):
+        """Loads cached tables of an ACE file.
+
+        Parameters
+        ----------
+        filename : str
+            Path to the ACE file.
+        table_names : set of str or None, optional
+            Tables to load, or None for all of the cached tables.
+
+        Returns
+        -------
+        tables : list of dicts
+            The name, awr, temp, comment, nxs, jxs, and xss of each table.
+            The xss arrays are read-only memory maps.
+        """
+        key = self.key(filename)
+        meta = self.index[key]
+        names = meta['tables'] if table_names is None else table_names
+        tables = []
+        for name in names:
+            with open(self._table_path(key, name, '.json'), 'r') as f:
+                data = json.load(f)
+            data['nxs'] = np.load(self._table_path(key, name, '.nxs.npy'))
+            data['jxs'] = np.load(self._table_path(key, name, '.jxs.npy'))
+            data['xss'] = np.load(self._table_path(key, name, '.xss.npy'),
+                                  mmap_mode='r')
+            tables.append(data)
+        self._touch(key)
+        return tables
+
+    def store(self, filename, tables, complete=False):
+        """Stores parsed tables of an ACE file, then evicts least recently
+        used entries if the cache is over its size limit.
+
+        Parameters
+        ----------
+        filename : str
+            Path to the ACE file.
+        tables : iterable of AceTable
+            Tables read from this file, with their nxs, jxs, and xss arrays.
+        complete : bool, optional
+            Whether these are all of the tables in the file.
+        """
+        # pick up entries stored by other processes sharing the cache
+        for k, m in self._read_index().items():
+            self.index.setdefault(k, m)
+        key = self.key(filename)
+        meta = self.index.get(key)
+        if meta is None:
+            st = os.stat(filename)
+            meta = {'source': os.path.abspath(filename), 'size': st.st_size,
+                    'mtime': st.st_mtime, 'sha1': file_hash(filename),
+                    'tables': [], 'complete': False, 'nbytes': 0}
+        # the directory may exist without an index entry, e.g. after a crash
+        # or while another process fills it
+        entry_dir = os.path.join(self.directory, key)
+        if not os.path.isdir(entry_dir):
+            try:
+                os.makedirs(entry_dir)
+            except OSError:
+                if not os.path.isdir(entry_dir):
+                    raise
+        for table in tables:
+            if table.name in meta['tables']:
+                continue
+            data = {'name': table.name, 'awr': table.awr, 'temp': table.temp,
+                    'comment': getattr(table, 'comment', None)}
+            with self._atomic_open(key, table.name, '.json', 'w') as f:
+                json.dump(data, f)
+            for attr in ('nxs', 'jxs', 'xss'):
+                arr = np.asarray(getattr(table, attr))
+                with self._atomic_open(key, table.name,
+                                       '.{0}.npy'.format(attr), 'wb') as f:
+                    np.save(f, arr)
+                meta['nbytes'] += arr.nbytes
+            meta['tables'].append(table.name)
+        meta['complete'] = meta['complete'] or complete
+        self.index[key] = meta
+        self._touch(key)
+        self.prune(keep=key)
+        self._write_index()
+
+    @contextmanager
+    def _atomic_open(self, key, name, suffix, mode):
+        """Opens a temporary file which replaces the table file on close, so
+        that readers never see a partly written file.
+        """
+        path = self._table_path(key, name, suffix)
+        tmp = '{0}.{1}.tmp'.format(path, os.getpid())
+        with open(tmp, mode) as f:
+            yield f
+        _replace(tmp, path)
+
+    def evict(self, key):
+        """Removes an entry from the cache."""
+        shutil.rmtree(os.path.join(self.directory, key), ignore_errors=True)
+        # keep entries stored by other processes sharing the cache
+        for k, m in self._read_index().items():
+            self.index.setdefault(k, m)
+        self.index.pop(key, None)
+        self._write_index()
+
+    def nbytes(self):
+        """Returns the total size of the cached arrays [bytes]."""
+        return sum(meta['nbytes'] for meta in self.index.values())
+
+    def prune(self, keep=None):
+        """Evicts least recently used entries, other than keep, until the
+        cache is no larger than max_size.
+        """
+        if self.max_size is None:
+            return
+        lru = sorted(self.index, key=self._atime)
+        for key in lru:
+            if self.nbytes() <= self.max_size:
+                break
+            if key != keep:
+                self.evict(key)
+
+    def clear(self):
+        """Removes every entry from the cache."""
+        for key in list(self.index):
+            self.evict(key)
+
+
+def main():
+    from pyne import ace
+    from pyne.mcnp import Xsdir
+    argparser = argparse.ArgumentParser(description="prebuild the parsed ACE "
+                                        "table cache for the ASCII libraries "
+                                        "listed in an MCNP xsdir file")
+    argparser.add_argument("xsdir", help="MCNP xsdir file")
+    argparser.add_argument("cache_dir", help="cache directory")
+    argparser.add_argument("-m", "--max-size", type=float, default=None,
+            help="maximum cache size in MB (default is unlimited)")
+    args = argparser.parse_args()
+
+    max_size = None if args.max_size is None else int(args.max_size * 2**20)
+    cache = AceCache(args.cache_dir, max_size=max_size)
+    xsdir = Xsdir(args.xsdir)
+    datapath = getattr(xsdir, 'datapath', None) or xsdir.directory
+    filenames = []
+    for table in xsdir:
+        filename = os.path.join(datapath, table.filename)
+        if table.filetype == 1 and filename not in filenames and \
+           os.path.isfile(filename):
+            filenames.append(filename)
+    for filename in filenames:
+        if cache.has_tables(filename):
+            continue
+        print("Caching {0}".format(filename))
+        lib = ace.Library(filename, cache=cache)
+        lib.read(lazy=True)
+
+if __name__ == '__main__':
+    main()
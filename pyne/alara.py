@@ -8,6 +8,8 @@ from pyne.utils import QAWarning, to_sec
 
 import numpy as np
 import tables as tb
+from scipy import sparse
+from scipy.sparse.linalg import splu
 
 warn(__name__ + " is not yet QA compliant.", QAWarning)
 
@@ -23,12 +25,11 @@ except ImportError:
                   "Some aspects of the alara module may be incomplete.",
                   QAWarning)
 
-from pyne.mesh import Mesh, MeshError
+from pyne.mesh import Mesh, MeshError, CellFracs
 from pyne.material import Material, from_atom_frac
 from pyne import nucname
 from pyne.nucname import serpent, alara, znum, anum
 from pyne.data import N_A, decay_const, decay_children, branch_ratio
-from pyne.xs.data_source import SimpleDataSource
 
 
 def mesh_to_fluxin(flux_mesh, flux_tag, fluxin="fluxin.out",
@@ -289,7 +290,7 @@ def record_to_geom(mesh, cell_fracs, cell_mats, geom_file, matlib_file,
     ----------
     mesh : PyNE Mesh object
         The Mesh object for which the geometry is discretized.
-    cell_fracs : structured array
+    cell_fracs : structured array or CellFracs
         The output from dagmc.discretize_geom(). A sorted, one dimensional
         array, each entry containing the following fields:
 
@@ -328,12 +329,14 @@ def record_to_geom(mesh, cell_fracs, cell_mats, geom_file, matlib_file,
 
     unique_mixtures = []
     if not sub_voxel:
+        if not isinstance(cell_fracs, CellFracs):
+            cell_fracs = CellFracs(cell_fracs, len(mesh))
         for i, mat, ve in mesh:
             volume += '    {0: 1.6E}    zone_{1}\n'.format(
                 mesh.elem_volume(ve), i)
 
             ve_mixture = {}
-            for row in cell_fracs[cell_fracs['idx'] == i]:
+            for row in cell_fracs[i]:
                 cell_mat = cell_mats[row['cell']]
                 name = cell_mat.metadata['name']
                 if _is_void(name):
@@ -355,6 +358,8 @@ def record_to_geom(mesh, cell_fracs, cell_mats, geom_file, matlib_file,
             mat_loading += '    zone_{0}    mix_{1}\n'.format(i,
                             unique_mixtures.index(ve_mixture))
     else:
+        if isinstance(cell_fracs, CellFracs):
+            cell_fracs = cell_fracs.cell_fracs
         ves = list(mesh.iter_ve())
         sve_count = 0
         for row in cell_fracs:
@@ -644,123 +649,151 @@ def phtn_src_energy_bounds(input_file):
     return e_bounds
 
 
-def _build_matrix(N):
-    """ This function  builds burnup matrix, A. Decay only.
-    """
+def _nuc_ids(N):
+    """Returns the ids of the nuclides in N, which may be names or ids."""
+    return [nucname.id(nuc) if isinstance(nuc, basestring) else nuc
+            for nuc in N]
 
-    A = np.zeros((len(N), len(N)))
 
-    # convert N to id form
-    N_id = []
-    for i in range(len(N)):
-        if isinstance(N[i], str):
-            ID = nucname.id(N[i])
-        else:
-            ID = N[i]
-        N_id.append(ID)
-
-    sds = SimpleDataSource()
+def _build_matrix(N):
+    """ This function  builds burnup matrix, A, as a sparse CSC matrix. Decay
+    only.
+    """
+    N_id = _nuc_ids(N)
+    index = dict((nuc, i) for i, nuc in enumerate(N_id))
+    rows = []
+    cols = []
+    vals = []
+
+    # Decay, from each parent to those of its children under consideration
+    for k, parent in enumerate(N_id):
+        lam = decay_const(parent)
+        rows.append(k)
+        cols.append(k)
+        vals.append(-lam)
+        if lam == 0.0:
+            continue
+        for child in decay_children(parent):
+            i = index.get(child)
+            if i is not None:
+                rows.append(i)
+                cols.append(k)
+                vals.append(branch_ratio(parent, child)*lam)
+    # duplicate entries are summed
+    A = sparse.coo_matrix((vals, (rows, cols)), shape=(len(N), len(N)))
+    return A.tocsc()
+
+_CRAM14_THETA = np.array([-8.8977731864688888199 + 16.630982619902085304j,
+                          -3.7032750494234480603 + 13.656371871483268171j,
+                          -.2087586382501301251 + 10.991260561901260913j,
+                          3.9933697105785685194 + 6.0048316422350373178j,
+                          5.0893450605806245066 + 3.5888240290270065102j,
+                          5.6231425727459771248 + 1.1940690463439669766j,
+                          2.2697838292311127097 + 8.4617379730402214019j])
+
+_CRAM14_ALPHA = np.array([-.000071542880635890672853 + .00014361043349541300111j,
+                          .0094390253107361688779 - .01784791958483017511j,
+                          -.37636003878226968717 + .33518347029450104214j,
+                          -23.498232091082701191 - 5.8083591297142074004j,
+                          46.933274488831293047 + 45.643649768827760791j,
+                          -27.875161940145646468 - 102.14733999056451434j,
+                          4.8071120988325088907 - 1.3209793837428723881j])
+
+_CRAM14_ALPHA_0 = np.array([1.8321743782540412751e-14])
+
+_CRAM16_THETA = np.array([-10.843917078696988026 + 19.277446167181652284j,
+                          -5.2649713434426468895 + 16.220221473167927305j,
+                          5.9481522689511774808 + 3.5874573620183222829j,
+                          3.5091036084149180974 + 8.4361989858843750826j,
+                          6.4161776990994341923 + 1.1941223933701386874j,
+                          1.4193758971856659786 + 10.925363484496722585j,
+                          4.9931747377179963991 + 5.9968817136039422260j,
+                          -1.4139284624888862114 + 13.497725698892745389j])
+
+_CRAM16_ALPHA = np.array([-.0000005090152186522491565 - .00002422001765285228797j,
+                          .00021151742182466030907 + .0043892969647380673918j,
+                          113.39775178483930527 + 101.9472170421585645j,
+                          15.059585270023467528 - 5.7514052776421819979j,
+                          -64.500878025539646595 - 224.59440762652096056j,
+                          -1.4793007113557999718 + 1.7686588323782937906j,
+                          -62.518392463207918892 - 11.19039109428322848j,
+                          .041023136835410021273 - .15743466173455468191j])
+
+_CRAM16_ALPHA_0 = np.array([2.1248537104952237488e-16])
+
+_CRAM_COEFFS = {14: (_CRAM14_THETA, _CRAM14_ALPHA, _CRAM14_ALPHA_0),
+                16: (_CRAM16_THETA, _CRAM16_ALPHA, _CRAM16_ALPHA_0)}
+
+# LU factorizations of the shifted systems, keyed by (nuclides, t, order)
+CRAM_CACHE_SIZE = 16
+_cram_lu_cache = collections.OrderedDict()
+
+
+def clear_cram_cache():
+    """Discards the cached LU factorizations used by cram()."""
+    _cram_lu_cache.clear()
+
+
+def _factorize(A, t, theta):
+    """Returns the sparse LU factorizations of A*t - theta_j*I for each of
+    the poles theta_j.
+    """
+    At = sparse.csc_matrix(A*t, dtype=complex)
+    I = sparse.identity(At.shape[0], dtype=complex, format='csc')
+    return [splu(sparse.csc_matrix(At - th*I)) for th in theta]
 
-    # Decay
-    for i in range(len(N)):
-        A[i, i] -= decay_const(N_id[i])
 
-        # Find decay parents
-        for k in range(len(N)):
-            if N_id[i] in decay_children(N_id[k]):
-                A[i, k] += branch_ratio(N_id[k], N_id[i])*decay_const(N_id[k])
-    return A
+def _rat_apprx(lus, alpha, alpha_0, n_0):
+    """Evaluates the CRAM rational approximation from the factorized shifted
+    systems. n_0 may be a vector or a matrix whose columns are initial
+    composition vectors.
+    """
+    n_0 = np.asarray(n_0)
+    n = np.zeros(n_0.shape, dtype=complex)
+    b = n_0.astype(complex)
+    for lu, a in zip(lus, alpha):
+        n += lu.solve(a*b)
+    n = 2*n.real
+    n = n + alpha_0*n_0
+    return n
 
 def _rat_apprx_14(A, t, n_0):
     """ CRAM of order 14
 
     Parameters
     ---------
-    A : numpy array
+    A : numpy array or scipy sparse matrix
         Burnup matrix
     t : float
         Time step
     n_0: numpy array
         Inital composition vector
     """
-
-    theta = np.array([ -8.8977731864688888199 + 16.630982619902085304j,
-                   -3.7032750494234480603 + 13.656371871483268171j,
-                   -.2087586382501301251 + 10.991260561901260913j,
-                   3.9933697105785685194 + 6.0048316422350373178j,
-                   5.0893450605806245066 + 3.5888240290270065102j,
-                   5.6231425727459771248 + 1.1940690463439669766j,
-                   2.2697838292311127097 + 8.4617379730402214019j])
-
-    alpha = np.array([-.000071542880635890672853 + .00014361043349541300111j,
-                   .0094390253107361688779 - .01784791958483017511j,
-                   -.37636003878226968717 + .33518347029450104214j,
-                   -23.498232091082701191 - 5.8083591297142074004j,
-                   46.933274488831293047 + 45.643649768827760791j,
-                   -27.875161940145646468 - 102.14733999056451434j,
-                   4.8071120988325088907 - 1.3209793837428723881j])
-
-    alpha_0 = np.array([1.8321743782540412751e-14])
-
-    s = 7
-    A = A*t
-    n = 0*n_0
-
-    for j in range(7):
-        n = n + np.linalg.solve(A - theta[j] * np.identity(np.shape(A)[0]), alpha[j]*n_0)
-
-    n = 2*n.real
-    n = n + alpha_0*n_0
-
-    return n
+    lus = _factorize(A, t, _CRAM14_THETA)
+    return _rat_apprx(lus, _CRAM14_ALPHA, _CRAM14_ALPHA_0, n_0)
 
 def _rat_apprx_16(A, t, n_0):
     """ CRAM of order 16
 
     Parameters
     ---------
-    A : numpy array
+    A : numpy array or scipy sparse matrix
         Burnup matrix
     t : float
         Time step
     n_0: numpy array
         Inital composition vector
     """
-    theta = np.array([ -10.843917078696988026 + 19.277446167181652284j,
-                   -5.2649713434426468895 + 16.220221473167927305j,
-                   5.9481522689511774808 + 3.5874573620183222829j,
-                   3.5091036084149180974 + 8.4361989858843750826j,
-                   6.4161776990994341923 + 1.1941223933701386874j,
-                   1.4193758971856659786 + 10.925363484496722585j,
-                   4.9931747377179963991 + 5.9968817136039422260j,
-                   -1.4139284624888862114 + 13.497725698892745389j])
-
-    alpha = np.array([ -.0000005090152186522491565 - .00002422001765285228797j,
-                      .00021151742182466030907 + .0043892969647380673918j,
-                      113.39775178483930527 + 101.9472170421585645j,
-                      15.059585270023467528 - 5.7514052776421819979j,
-                      -64.500878025539646595 - 224.59440762652096056j,
-                      -1.4793007113557999718 + 1.7686588323782937906j,
-                      -62.518392463207918892 - 11.19039109428322848j,
-                      .041023136835410021273 - .15743466173455468191j])
-
-    alpha_0 = np.array([2.1248537104952237488e-16])
-
-
-    s = 8
-    A = A*t
-    n = 0*n_0
-
-    for j in range(8):
-        n = n + np.linalg.solve(A - theta[j] * np.identity(np.shape(A)[0]), alpha[j]*n_0)
-
-    n = 2*n.real
-    n = n + alpha_0*n_0
-    return n
+    lus = _factorize(A, t, _CRAM16_THETA)
+    return _rat_apprx(lus, _CRAM16_ALPHA, _CRAM16_ALPHA_0, n_0)
 
 def cram(N, t, n_0, order):
     """ This function returns matrix exponential solution n using CRAM14 or CRAM16
 
+    The decay matrix is built sparsely and the LU factorizations of its
+    shifted systems are cached by nuclides, time step, and order (up to
+    CRAM_CACHE_SIZE entries), so repeated cooling steps reuse them.
+
     Parameters
     ----------
     N : list or array
@@ -768,23 +801,25 @@ def cram(N, t, n_0, order):
     t : float
         Time step
     n_0 : list or array
-        Nuclide concentration vector
+        Nuclide concentration vector, or a matrix whose columns are
+        concentration vectors
     order : int
         Order of method. Only 14 and 16 are supported.
     """
-
-    n_0 = np.array(n_0)
-    A = _build_matrix(N)
-
-    if order == 14:
-        return _rat_apprx_14(A, t, n_0)
-
-    elif order == 16:
-        return _rat_apprx_16(A, t, n_0)
-
-    else:
+    if order not in _CRAM_COEFFS:
         msg = 'Rational approximation of degree {0} is not supported.'.format(order)
         raise ValueError(msg)
+    theta, alpha, alpha_0 = _CRAM_COEFFS[order]
+    n_0 = np.array(n_0)
+
+    key = (tuple(_nuc_ids(N)), t, order)
+    lus = _cram_lu_cache.pop(key, None)
+    if lus is None:
+        lus = _factorize(_build_matrix(N), t, theta)
+    _cram_lu_cache[key] = lus
+    while len(_cram_lu_cache) > CRAM_CACHE_SIZE:
+        _cram_lu_cache.popitem(last=False)
+    return _rat_apprx(lus, alpha, alpha_0, n_0)
 
 def _output_flux(ve, tag_flux,output,start,stop,direction):
     """
@@ -29,10 +29,11 @@ Report LA-5324-MS_.
 """
 
 from __future__ import division
+import os
 from warnings import warn
 import numpy as np
 
-from pyne.utils import QAWarning
+from pyne.utils import QAWarning, INDEX_SUFFIX, save_index, load_index
 from pyne.binaryreader import _BinaryReader, _FortranRecord
 
 warn(__name__ + " is not yet QA compliant.", QAWarning)
@@ -61,7 +62,8 @@ class Isotxs(_BinaryReader):
         File identification string
 
       **nuclides** : list of _Nuclides
-        List of individual nuclides in the ISOTXS file.
+        List of individual nuclides in the ISOTXS file. Empty when the file
+        was read lazily; use nuclide() or iterate over the Isotxs instead.
 
       **vel** : float
         Mean neutron velocity in each group.
@@ -79,9 +81,27 @@ class Isotxs(_BinaryReader):
         # Initialize attributes
         self.fc = {}       # file control info
         self.nuclides = [] #: List of nuclides in ISOTXS file.
+        self.index_file = self.f.name + INDEX_SUFFIX
+        self._records = None  # byte offsets of nuclide records, if lazy
+        self._lazy_nuclides = {}
+        self._lazy_params = {}
 
-    def read(self):
-        """Read through and parse the ISOTXS file."""
+    def read(self, lazy=False, index=False):
+        """Read through and parse the ISOTXS file.
+
+        Parameters
+        ----------
+        lazy : bool, optional
+            Only read the file-wide records and the byte offsets of the
+            nuclide records. Nuclides are then read on demand by nuclide(),
+            nuclide_xs(), and nuclide_scatter().
+        index : bool, optional
+            When reading lazily, load the record offsets from the index file
+            (filename + INDEX_SUFFIX) if the file is unchanged since it was
+            saved, and save a new index otherwise. The index is written next
+            to the ISOTXS file, so this is off by default.
+
+        """
 
         self._read_file_ID()
         self._read_file_control()
@@ -93,29 +113,245 @@ class Isotxs(_BinaryReader):
         if self.fc['ichidst']>1:
             self._read_chi_data()
 
+        if lazy:
+            if not (index and self._load_index()):
+                self._index_records()
+                if index:
+                    self._save_index()
+            return
+
         # Read nuclide data
         for nucName in self.nucNames:
-            # Create nuclide object
-            nuc = _Nuclide(nucName)
-            
-            # Read nuclide name and global data
+            self.nuclides.append(self._read_nuclide(nucName))
+
+    def _read_nuclide(self, nucName):
+        """Reads all of the records of the nuclide starting at the current
+        position in the file.
+        """
+
+        # Create nuclide object
+        nuc = _Nuclide(nucName)
+
+        # Read nuclide name and global data
+        self._read_nuclide_data(nuc)
+
+        # Read nuclide cross sections
+        self._read_nuclide_xs(nuc)
+
+        # Read nuclide chi data if present
+        if nuc.libParams['chiFlag']>1:
+            self._read_nuclide_chi(nuc)
+
+        # Read nuclide scattering matrix
+        for block in range(self.fc['nscmax']):
+            for subBlock in range(self.fc['nsblok']):
+                if nuc.libParams['ords'][block] > 0:
+                    self._read_nuclide_scatter(nuc, block, subBlock)
+        return nuc
+
+    def _index_records(self):
+        """Records the byte offset of every record following the current
+        position in the file, reading only the record lengths.
+        """
+        start = self.f.tell()
+        self.f.seek(0, os.SEEK_END)
+        end = self.f.tell()
+        self._records = []
+        pos = start
+        while pos < end:
+            self._records.append(pos)
+            self.f.seek(pos)
+            pos += self.get_int() + 2*self.int_size
+
+    def _save_index(self):
+        """Saves the record offsets to self.index_file."""
+        save_index(self.f.name, {'records': self._records}, self.index_file)
+
+    def _load_index(self):
+        """Loads the record offsets from self.index_file.
+
+        Returns
+        -------
+        loaded : bool
+            False if there is no index or the file has changed since it was
+            saved.
+        """
+        idx = load_index(self.f.name, self.index_file)
+        if idx is None:
+            return False
+        self._records = idx['records']
+        return True
+
+    def _nuclide_index(self, key):
+        """Returns the index of a nuclide given its index or name."""
+        if isinstance(key, int):
+            return key
+        if key not in self.nucNames:
+            raise KeyError("nuclide {0!r} not in ISOTXS file".format(key))
+        return self.nucNames.index(key)
+
+    def _seek_record(self, i, rec=0):
+        """Moves to the rec-th record of the i-th nuclide."""
+        if self._records is None:
+            raise ValueError("nuclide records are only indexed when the "
+                             "file is read with lazy=True")
+        self.f.seek(self._records[self.locs[i] + rec])
+
+    def nuclide(self, key):
+        """Returns a nuclide, reading it from the file first when the file
+        was read lazily.
+
+        Parameters
+        ----------
+        key : int or str
+            Index or name of the nuclide.
+
+        Returns
+        -------
+        nuc : _Nuclide
+            Object containing microscopic cross sections and other data.
+
+        """
+        i = self._nuclide_index(key)
+        if self._records is None:
+            return self.nuclides[i]
+        if i not in self._lazy_nuclides:
+            self._seek_record(i)
+            self._lazy_nuclides[i] = self._read_nuclide(self.nucNames[i])
+        return self._lazy_nuclides[i]
+
+    def _nuclide_params(self, i):
+        """Returns a nuclide with only its libParams read."""
+        if self._records is None:
+            return self.nuclides[i]
+        if i in self._lazy_nuclides:
+            return self._lazy_nuclides[i]
+        if i not in self._lazy_params:
+            nuc = _Nuclide(self.nucNames[i])
+            self._seek_record(i)
             self._read_nuclide_data(nuc)
+            self._lazy_params[i] = nuc
+        return self._lazy_params[i]
 
-            # Read nuclide cross sections
-            self._read_nuclide_xs(nuc)   
+    def nuclide_xs(self, key):
+        """Reads the principal cross sections of a single nuclide as arrays.
+        The file must have been read lazily.
 
-            # Read nuclide chi data if present
-            if nuc.libParams['chiFlag']>1:
-                self._read_nuclide_chi(nuc)
-                
-            # Read nuclide scattering matrix
-            for block in range(self.fc['nscmax']):
-                for subBlock in range(self.fc['nsblok']):
-                    if nuc.libParams['ords'][block] > 0:
-                        self._read_nuclide_scatter(nuc, block, subBlock)
+        Parameters
+        ----------
+        key : int or str
+            Index or name of the nuclide.
+
+        Returns
+        -------
+        xs : dict of arrays
+            Maps the cross section types of _Nuclide.micros to arrays indexed
+            by group. The 'transport', 'total', and 'strpd' arrays are two
+            dimensional, indexed by Legendre order (or direction) then group.
+
+        """
+        i = self._nuclide_index(key)
+        params = self._nuclide_params(i).libParams
+        ng = self.fc['ngroup']
+        self._seek_record(i, 1)
+        data = np.frombuffer(self.get_fortran_record().data, dtype=np.float32)
+        data = data.astype(np.float64)
+
+        xs = {}
+        pos = 0
+        for xstype, n in [('transport', params['ltrn']),
+                          ('total', params['ltot'])]:
+            xs[xstype] = data[pos:pos + n*ng].reshape(n, ng)
+            pos += n*ng
+        xstypes = ['n,g']
+        if params['fisFlag'] > 0:
+            xstypes += ['fis', 'nu']
+        if params['chiFlag'] == 1:
+            xstypes.append('chi')
+        for xstype in xstypes:
+            xs[xstype] = data[pos:pos + ng]
+            pos += ng
+        if params['chiFlag'] != 1 and params['fisFlag'] > 0:
+            assert self.fc['ichidst'] == 1, "Fissile nuclide %s in library but no individual or global chi!" % self.nucNames[i]
+            xs['chi'] = np.array(self.chi, dtype=np.float64)
+        for xstype in ['nalph','np','n2n','nd','nt']:
+            if params[xstype]:
+                xs[xstype] = data[pos:pos + ng]
+                pos += ng
+        if params['strpd'] > 0:
+            n = params['strpd']
+            xs['strpd'] = data[pos:pos + n*ng].reshape(n, ng)
+        return xs
+
+    def nuclide_scatter(self, key, block=0, order=0, sparse=False):
+        """Reads one scattering matrix of a single nuclide. The file must have
+        been read lazily.
+
+        Parameters
+        ----------
+        key : int or str
+            Index or name of the nuclide.
+        block : int, optional
+            Scattering block, whose type is given by libParams['scatFlag'].
+        order : int, optional
+            Legendre order of the scattering matrix.
+        sparse : bool, optional
+            Return a scipy.sparse CSR matrix rather than a dense array.
 
-            # Add nuclide to dictionary
-            self.nuclides.append(nuc)
+        Returns
+        -------
+        scat : ndarray or scipy.sparse.csr_matrix
+            Matrix of shape (ngroup, ngroup) whose element [g, g'] is the
+            cross section for scattering from group g' to group g, as in
+            _Nuclide.micros['scat', block, g, g', order].
+
+        """
+        i = self._nuclide_index(key)
+        params = self._nuclide_params(i).libParams
+        ng = self.fc['ngroup']
+        nsblok = self.fc['nsblok']
+        ords = params['ords']
+        if not 0 <= order < ords[block]:
+            raise ValueError("scattering block {0} of nuclide {1} has {2} "
+                             "orders".format(block, self.nucNames[i],
+                                             ords[block]))
+
+        # Records are nuclide data, principal cross sections, optionally chi,
+        # then nsblok sub-blocks for each scattering block with any orders.
+        rec = 2 + (params['chiFlag'] > 1)
+        rec += nsblok * sum(1 for n in range(block) if ords[n] > 0)
+        jband = np.array([params['jband'][g, block] for g in range(ng)])
+        jup = np.array([params['jj'][g, block] for g in range(ng)]) - 1
+
+        rows, cols, vals = [], [], []
+        for subBlock in range(nsblok):
+            self._seek_record(i, rec + subBlock)
+            data = np.frombuffer(self.get_fortran_record().data,
+                                 dtype=np.float32)
+
+            # groups of this sub-block, as in _read_nuclide_scatter()
+            m = subBlock + 1
+            jl = (m - 1)*((ng - 1)//nsblok + 1)
+            ju = min(ng, m*((ng - 1)//nsblok + 1))
+            groups = np.arange(jl, ju)
+            counts = jband[groups]
+            kmax = counts.sum()
+            starts = np.cumsum(counts) - counts
+            to_g = np.repeat(groups, counts)
+            k = np.arange(kmax) - np.repeat(starts, counts)
+            rows.append(to_g)
+            cols.append(to_g + jup[to_g] - k)
+            vals.append(data[order*kmax:(order + 1)*kmax])
+        rows = np.concatenate(rows)
+        cols = np.concatenate(cols)
+        vals = np.concatenate(vals).astype(np.float64)
+
+        if sparse:
+            from scipy.sparse import csr_matrix
+            return csr_matrix((vals, (rows, cols)), shape=(ng, ng))
+        scat = np.zeros((ng, ng), dtype=np.float64)
+        scat[rows, cols] = vals
+        return scat
         
     def _read_file_ID(self):
         """Reads the file identification block. This block is always present in
@@ -380,12 +616,18 @@ class Isotxs(_BinaryReader):
 
         """
 
+        if self._records is not None:
+            return self.nuclide(name) if name in self.nucNames else None
         for nuc in self:
             if nuc.name == name:
                 return nuc
         return None
 
     def __iter__(self):
+        if self._records is not None:
+            for i in range(len(self.nucNames)):
+                yield self.nuclide(i)
+            return
         for nuc in self.nuclides:
             yield nuc
             
@@ -150,30 +150,51 @@ cdef extern from "data.h" namespace "pyne":
     vector[pair[double, double]] gamma_energy(int parent) except +
     vector[pair[double, double]] gamma_energy(double energy,
                                               double error) except +
+    vector[pair[double, double]] gamma_energy(vector[double]&, vector[double]&,
+                                              vector[int]&) except +
     vector[pair[double, double]] gamma_photon_intensity(int parent) except +
     vector[pair[double, double]] gamma_photon_intensity(double energy,
                                                         double error) except +
+    vector[pair[double, double]] gamma_photon_intensity(vector[double]&,
+                                                        vector[double]&,
+                                                        vector[int]&) except +
     vector[pair[double, double]] gamma_conversion_intensity(int parent) except +
     vector[pair[double, double]] gamma_total_intensity(int parent) except +
     vector[pair[int, int]] gamma_from_to(int parent) except +
     vector[pair[int, int]] gamma_from_to(double energy, double error) except +
+    vector[pair[int, int]] gamma_from_to(vector[double]&, vector[double]&,
+                                         vector[int]&) except +
     vector[pair[int, int]] gamma_parent_child(double energy, double error) except +
+    vector[pair[int, int]] gamma_parent_child(vector[double]&, vector[double]&,
+                                              vector[int]&) except +
     vector[int] gamma_parent(double energy, double error) except +
+    vector[int] gamma_parent(vector[double]&, vector[double]&,
+                             vector[int]&) except +
     vector[int] gamma_child(double energy, double error) except +
+    vector[int] gamma_child(vector[double]&, vector[double]&,
+                            vector[int]&) except +
     vector[int] gamma_child(int parent) except +
     vector[pair[double, double]] gamma_xrays(int parent) except +
 
     vector[double] alpha_energy(int parent) except +
     vector[double] alpha_intensity(int parent) except +
     vector[int] alpha_parent(double energy, double error) except +
+    vector[int] alpha_parent(vector[double]&, vector[double]&,
+                             vector[int]&) except +
     vector[int] alpha_child(double energy, double error) except +
+    vector[int] alpha_child(vector[double]&, vector[double]&,
+                            vector[int]&) except +
     vector[int] alpha_child(int parent) except +
 
     vector[double] beta_endpoint_energy(int parent) except +
     vector[double] beta_average_energy(int parent) except +
     vector[double] beta_intensity(int parent) except +
     vector[int] beta_parent(double energy, double error) except +
+    vector[int] beta_parent(vector[double]&, vector[double]&,
+                            vector[int]&) except +
     vector[int] beta_child(double energy, double error) except +
+    vector[int] beta_child(vector[double]&, vector[double]&,
+                           vector[int]&) except +
     vector[int] beta_child(int parent) except +
 
     vector[double] ecbp_endpoint_energy(int parent) except +
@@ -181,6 +202,10 @@ cdef extern from "data.h" namespace "pyne":
     vector[double] ec_intensity(int parent) except +
     vector[double] bp_intensity(int parent) except +
     vector[int] ecbp_parent(double energy, double error) except +
+    vector[int] ecbp_parent(vector[double]&, vector[double]&,
+                            vector[int]&) except +
     vector[int] ecbp_child(double energy, double error) except +
+    vector[int] ecbp_child(vector[double]&, vector[double]&,
+                           vector[int]&) except +
     vector[int] ecbp_child(int parent) except +
     vector[pair[double, double]] ecbp_xrays(int parent) except +
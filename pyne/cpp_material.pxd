@@ -66,6 +66,8 @@ cdef extern from "material.h" namespace "pyne":
 
         void normalize() except +
         map[int, double] mult_by_mass() except +
+        void update(vector[int], vector[double]) except +
+        void remove(vector[int]) except +
         map[int, double] activity() except +
         map[int, double] decay_heat() except +
         map[int, double] dose_per_g(std_string, int) except +
@@ -116,3 +118,8 @@ cdef extern from "material.h" namespace "pyne":
         Material operator+(Material) except +
         Material operator*(double) except +
         Material operator/(double) except +
+
+    # Mixing
+    Material mix(vector[Material], vector[double], bool) except +
+    vector[Material] mix_many(vector[Material], vector[vector[int]],
+                              vector[vector[double]], bool) except +
@@ -7,4 +7,5 @@ cdef extern from "transmuters.h" namespace "pyne::transmuters":
 
     map[int, double] cram(vector[double], const map[int, double]) except +ValueError
     map[int, double] cram(vector[double], const map[int, double], const int) except +ValueError
-
+    void cram_batch(const double*, int, const int*, const double*, double*, int,
+                    const int, int) nogil except +ValueError
@@ -2,6 +2,7 @@ from __future__ import print_function, division, unicode_literals
 
 # Python imports
 import sys
+import multiprocessing
 from contextlib import contextmanager
 from warnings import warn
 from pyne.utils import QAWarning
@@ -289,6 +290,9 @@ surf_id_to_handle = {}
 surf_handle_to_id = {}
 vol_id_to_handle = {}
 vol_handle_to_id = {}
+# the name of the file most recently loaded, so that worker processes can
+# load the same geometry
+_loaded_filename = None
 
 def versions():
     """Return a (str, int) tuple: the version and SVN revision of the 
@@ -300,7 +304,9 @@ def versions():
 def load(filename):
     """Load a given filename into DagMC"""
     global surf_id_to_handle, surf_handle_to_id, vol_id_to_handle, vol_handle_to_id
+    global _loaded_filename
     dag_load(filename)
+    _loaded_filename = filename
 
     def get_geom_list(dim):
         cdef int count
@@ -753,6 +759,12 @@ def discretize_geom(mesh, **kwargs):
         (on the boundary) for each mesh row. If true, a linearly spaced grid of
         starting points is used, with dimension sqrt(num_rays) x sqrt(num_rays). 
         In this case, "num_rays" must be a perfect square.
+    num_procs : int, optional, default = 1
+        Structured mesh only. The number of processes to distribute mesh rows
+        over, see ray_discretize().
+    seed : int, optional
+        Structured mesh only. The seed for random ray starting points, see
+        ray_discretize().
 
     Returns
     -------
@@ -773,7 +785,9 @@ def discretize_geom(mesh, **kwargs):
     if mesh.structured:
        num_rays = kwargs['num_rays'] if 'num_rays' in kwargs else 10
        grid = kwargs['grid'] if 'grid' in kwargs else False
-       results = ray_discretize(mesh, num_rays, grid)
+       num_procs = kwargs['num_procs'] if 'num_procs' in kwargs else 1
+       seed = kwargs['seed'] if 'seed' in kwargs else None
+       results = ray_discretize(mesh, num_rays, grid, num_procs, seed)
     else:
        if kwargs:
            raise ValueError("No valid key word arguments for unstructed mesh.")
@@ -812,8 +826,10 @@ def cells_at_ve_centers(mesh):
 
     return cells
 
-def ray_discretize(mesh, num_rays=10, grid=False):
-    """ray_discretize(mesh, num_rays=10, grid=False)
+def ray_discretize(mesh, num_rays=10, grid=False, num_procs=1, seed=None,
+                   rows_per_task=16):
+    """ray_discretize(mesh, num_rays=10, grid=False, num_procs=1, seed=None,
+                      rows_per_task=16)
     This function discretizes a geometry (by geometry cell) onto a 
     superimposed, structured, axis-aligned mesh using the method described in
     [1]. Ray tracing is used to sample track lengths in geometry cells in mesh
@@ -822,6 +838,11 @@ def ray_discretize(mesh, num_rays=10, grid=False):
     points can be chosen randomly, or on a uniform grid. Note that a DAGMC
     geometry must already be loaded into memory.
 
+    Mesh rows are independent of one another, so they may be distributed over
+    a pool of processes, each of which loads its own copy of the geometry.
+    Row results are reduced in the same order regardless of the number of
+    processes, so the output does not depend on num_procs.
+
     [1] Moule, D. and Wilson, P., Mesh Generation methods for Deterministic
     Radiation Transport Codes, Transacztions of the American Nuclear Society,
     104, 407--408, (2009).
@@ -838,6 +859,16 @@ def ray_discretize(mesh, num_rays=10, grid=False):
         for each mesh row. If true, a linearly spaced grid of starting points is
         used, with dimension sqrt(num_rays) x sqrt(num_rays). In this case,
         "num_rays" must be a perfect square.
+    num_procs : int, optional, default = 1
+        The number of worker processes to fire rays with. If 1, all rows are
+        evaluated in this process.
+    seed : int, optional
+        The seed for random ray starting points. Each mesh row draws its
+        starting points from a generator seeded with (seed, direction, row),
+        so results are reproducible for a given seed. If None, the seed is
+        drawn from numpy.random.
+    rows_per_task : int, optional, default = 16
+        The number of mesh rows sent to a worker process at a time.
 
     Returns
     -------
@@ -857,94 +888,167 @@ def ray_discretize(mesh, num_rays=10, grid=False):
     """
     mesh._structured_check()
     divs = [mesh.structured_get_divisions(x) for x in b'xyz']
-    num_ves = (len(divs[0])-1)*(len(divs[1])-1)*(len(divs[2])-1)
-    #  Stores a running tally of sums of x and sums of x^2 for each ve
-    mesh_sums = [{} for x in range(0, num_ves)]
-    #  The length of the output array (will vary because different ve contain
-    #  different numbers of geometry cells.
-    len_count = 0
-
-    #  Direction indicies: x = 0, y = 1, z = 2
-    dis = [0, 1, 2]
-    #  Iterate over all directions indicies
-    for di in dis:
-        #  For each direction, the remaining two directions define the sampling 
-        #  surface. These two directions are the values in s_dis (surface
-        #  direction indices)
+    if grid and int(np.sqrt(num_rays))**2 != num_rays:
+        raise ValueError("For rays fired in a grid, "
+                         "num_rays must be a perfect square.")
+    if not grid and seed is None:
+        seed = np.random.randint(2**31)
+
+    #  The volume element indices of the mesh arranged on the (x, y, z) grid,
+    #  so that the indices of any mesh row are a single slice.
+    shape = [len(x) - 1 for x in divs]
+    idx_grid = np.fromiter(mesh.iter_structured_idx('xyz'), dtype=np.int64)
+    idx_grid = idx_grid.reshape(shape)
+
+    #  Each mesh row is described by its direction index (x = 0, y = 1,
+    #  z = 2) and its position (a, b) on the sampling surface defined by the
+    #  remaining two directions.
+    rows = []
+    for di in range(3):
         s_dis = [0, 1, 2]
         s_dis.remove(di)
-        #  Iterate through all all the sampling planes perpendicular to di,
-        #  creating a _MeshRow in each, and subsequently evaluating that row.
         for a in range(0, len(divs[s_dis[0]]) - 1):
             for b in range(0, len(divs[s_dis[1]]) - 1):
-                mesh_row = _MeshRow()
-                mesh_row.di = di
-                mesh_row.divs = divs[di]
-                mesh_row.num_rays = num_rays
-                mesh_row.s_dis_0 = s_dis[0]
-                mesh_row.s_min_0 = divs[s_dis[0]][a]
-                mesh_row.s_max_0 = divs[s_dis[0]][a + 1]
-                mesh_row.s_dis_1 = s_dis[1]
-                mesh_row.s_min_1 = divs[s_dis[1]][b]
-                mesh_row.s_max_1 = divs[s_dis[1]][b + 1]
-
-                #  Create a lines of starting points to fire rays for this
-                #  particular mesh row.
-                if not grid:
-                    mesh_row._rand_start()
-                else:
-                    mesh_row._grid_start()
-
-                #  Create a list of mesh idx corresponding to this mesh row.
-                if di == 0:
-                    ves = mesh.structured_iterate_hex('x', y=a, z=b)
-                elif di == 1:
-                    ves = mesh.structured_iterate_hex('y', x=a, z=b)
-                elif di == 2:
-                    ves = mesh.structured_iterate_hex('z', x=a, y=b)
-
-                idx_tag = mesh.mesh.getTagHandle('idx')
-                idx = []
-                for ve in ves:
-                    idx.append(idx_tag[ve])
-
-                #  Fire rays.
-                row_sums = mesh_row._evaluate_row()
-
-                #  Add row results to the full mesh sum matrix.
-                for j, ve_sums in enumerate(row_sums):
-                   for cell in ve_sums.keys():
-                       if ve_sums[cell][0] < VOL_FRAC_TOLERANCE:
-                           continue
-                       if cell not in mesh_sums[idx[j]].keys():
-                           mesh_sums[idx[j]][cell] = [0, 0]
-                           len_count += 1
-
-                       mesh_sums[idx[j]][cell][0] += ve_sums[cell][0]
-                       mesh_sums[idx[j]][cell][1] += ve_sums[cell][1]
-
+                rows.append((di, a, b))
+    tasks = [(divs, num_rays, grid, seed, rows[i:i + rows_per_task])
+             for i in range(0, len(rows), rows_per_task)]
+
+    if num_procs > 1:
+        if _loaded_filename is None:
+            raise DagmcError("A geometry must be loaded with dagmc.load() "
+                             "before discretizing in parallel.")
+        pool = multiprocessing.Pool(num_procs, _init_ray_worker,
+                                    (_loaded_filename,))
+        try:
+            task_results = list(pool.imap(_evaluate_rows, tasks))
+        finally:
+            pool.close()
+            pool.join()
+    else:
+        task_results = [_evaluate_rows(task) for task in tasks]
+
+    #  Map positions within each row to mesh idx, in row order.
+    all_idx = []
+    all_cells = []
+    all_sums = []
+    all_sums_sq = []
+    for task, row_results in zip(tasks, task_results):
+        for (di, a, b), (pos, cells, sums, sums_sq) in zip(task[-1],
+                                                           row_results):
+            if di == 0:
+                row_idx = idx_grid[:, a, b]
+            elif di == 1:
+                row_idx = idx_grid[a, :, b]
+            else:
+                row_idx = idx_grid[a, b, :]
+            all_idx.append(row_idx[pos])
+            all_cells.append(cells)
+            all_sums.append(sums)
+            all_sums_sq.append(sums_sq)
+    idx = np.concatenate(all_idx)
+    cells = np.concatenate(all_cells)
+    sums = np.concatenate(all_sums)
+    sums_sq = np.concatenate(all_sums_sq)
+
+    #  Reduce the row results for each (idx, cell) pair. The sort is stable,
+    #  so samples are summed in row order. Each pair is hit by at most one
+    #  row per direction, so each sum adds at most three values sequentially.
+    order = np.lexsort((cells, idx))
+    idx = idx[order]
+    cells = cells[order]
+    if len(order) > 0:
+        starts = np.flatnonzero(np.concatenate(([True],
+                                (idx[1:] != idx[:-1]) |
+                                (cells[1:] != cells[:-1]))))
+        sums = np.add.reduceat(sums[order], starts)
+        sums_sq = np.add.reduceat(sums_sq[order], starts)
+        idx = idx[starts]
+        cells = cells[starts]
 
     #  Create structured array
     total_rays = num_rays*3 # three directions
-    results = np.zeros(len_count, dtype=[(b'idx', np.int64),
-                                         (b'cell', np.int64),
-                                         (b'vol_frac', np.float64), 
-                                         (b'rel_error', np.float64)])
-
-    row_count = 0
-    total_rays = num_rays*3
-    for i, ve_sums in enumerate(mesh_sums):
-       for vol in ve_sums.keys():
-           vol_frac = ve_sums[vol][0]/total_rays
-           rel_error = np.sqrt((ve_sums[vol][1])/(ve_sums[vol][0])**2 
-                                - 1.0/total_rays)
-           results[row_count] = (i, vol, vol_frac, rel_error)
-           row_count += 1
-
+    results = np.zeros(len(idx), dtype=[(b'idx', np.int64),
+                                        (b'cell', np.int64),
+                                        (b'vol_frac', np.float64), 
+                                        (b'rel_error', np.float64)])
+    results[b'idx'] = idx
+    results[b'cell'] = cells
+    results[b'vol_frac'] = sums/total_rays
+    results[b'rel_error'] = np.sqrt(sums_sq/sums**2 - 1.0/total_rays)
     results.sort()
 
     return results
 
+def _init_ray_worker(filename):
+    """Private function that loads the geometry in a ray_discretize() worker
+    process. Forked workers inherit the geometry already loaded in the parent,
+    which must not be loaded into DagMC a second time.
+    """
+    if _loaded_filename == filename:
+        return
+    load(filename)
+
+def _evaluate_rows(task):
+    """Private function that fires rays down a batch of mesh rows. This is
+    the unit of work distributed by ray_discretize().
+
+    Parameters
+    ----------
+    task : tuple
+        (divs, num_rays, grid, seed, rows) where rows is a list of
+        (di, a, b) mesh row descriptors.
+
+    Returns
+    -------
+    row_results : list
+        For each row, a tuple of arrays (pos, cell, sum, sum_sq) holding the
+        position of the volume element within the row, the geometry cell, the
+        sum of the samples, and the sum of the squares of the samples.
+    """
+    divs, num_rays, grid, seed, rows = task
+    row_results = []
+    for di, a, b in rows:
+        s_dis = [0, 1, 2]
+        s_dis.remove(di)
+        mesh_row = _MeshRow()
+        mesh_row.di = di
+        mesh_row.divs = divs[di]
+        mesh_row.num_rays = num_rays
+        mesh_row.s_dis_0 = s_dis[0]
+        mesh_row.s_min_0 = divs[s_dis[0]][a]
+        mesh_row.s_max_0 = divs[s_dis[0]][a + 1]
+        mesh_row.s_dis_1 = s_dis[1]
+        mesh_row.s_min_1 = divs[s_dis[1]][b]
+        mesh_row.s_max_1 = divs[s_dis[1]][b + 1]
+
+        #  Create a lines of starting points to fire rays for this
+        #  particular mesh row.
+        if not grid:
+            mesh_row._rand_start(np.random.RandomState([seed, di, a, b]))
+        else:
+            mesh_row._grid_start()
+
+        #  Fire rays.
+        row_sums = mesh_row._evaluate_row()
+
+        pos = []
+        cells = []
+        sums = []
+        sums_sq = []
+        for j, ve_sums in enumerate(row_sums):
+            for cell, (ve_sum, ve_sum_sq) in ve_sums.items():
+                if ve_sum < VOL_FRAC_TOLERANCE:
+                    continue
+                pos.append(j)
+                cells.append(cell)
+                sums.append(ve_sum)
+                sums_sq.append(ve_sum_sq)
+        row_results.append((np.array(pos, dtype=np.int64),
+                            np.array(cells, dtype=np.int64),
+                            np.array(sums, dtype=np.float64),
+                            np.array(sums_sq, dtype=np.float64)))
+    return row_results
+
 class _MeshRow():
     """A class to store data and fire rays down a single mesh row.
 
@@ -980,19 +1084,20 @@ class _MeshRow():
     def __init__(self):
         pass
 
-    def _rand_start(self):
+    def _rand_start(self, rng=np.random):
         """Private function for randomly generating ray starting points to
-        populate self.starting_points
+        populate self.starting_points, drawing from the random number
+        generator rng.
         """
         self.start_points = []
         ray_count = 0
         while ray_count < self.num_rays:
             start_point = [0]*3
             start_point[self.di] = self.divs[0]
-            start_point[self.s_dis_0] = np.random.uniform(self.s_min_0,
-                                                          self.s_max_0)
-            start_point[self.s_dis_1] = np.random.uniform(self.s_min_1,
-                                                          self.s_max_1)
+            start_point[self.s_dis_0] = rng.uniform(self.s_min_0,
+                                                    self.s_max_0)
+            start_point[self.s_dis_1] = rng.uniform(self.s_min_1,
+                                                    self.s_max_1)
             self.start_points.append(start_point)
             ray_count += 1
     
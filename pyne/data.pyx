@@ -10,6 +10,7 @@ from libcpp.map cimport map as cpp_map
 from libcpp.set cimport set as cpp_set
 from libcpp.string cimport string as std_string
 from libcpp.utility cimport pair as cpp_pair
+from libcpp.vector cimport vector
 #from cython cimport pointer
 
 #Standard lib import
@@ -64,6 +65,121 @@ Bq_per_Ci = cpp_data.Bq_per_Ci
 Ci_per_Bq = cpp_data.Ci_per_Bq
 """Curies per Becquerel"""
 
+#
+# dense array lookups
+#
+def _merge_sorted(keys, vals, new_keys, new_vals):
+    """Merges new keys, none of which are in keys, and their values into the
+    sorted arrays keys and vals.
+    """
+    keys = np.concatenate([keys, new_keys])
+    vals = np.concatenate([vals, new_vals])
+    order = np.argsort(keys, kind='mergesort')
+    return keys[order], vals[order]
+
+def _search_sorted(keys, flat):
+    """Returns the positions of flat in the sorted array keys and a mask of
+    which of them were found.
+    """
+    pos = np.searchsorted(keys, flat)
+    found = pos < len(keys)
+    found[found] = keys[pos[found]] == flat[found]
+    return pos, found
+
+class _DenseTable(object):
+    """The values of a scalar nuclide data function, stored as sorted arrays
+    of nuclide ids and values so that whole arrays of nuclides can be looked
+    up with one binary search. Nuclides are added as they are first seen.
+    Integer nuclides which are not ids are normalized once and memoized
+    along with their values, so that later lookups of them are searched
+    directly too.
+    """
+
+    def __init__(self, func, args=(), convert=True):
+        self.func = func
+        self.args = args
+        self.convert = convert
+        self.ids = np.empty(0, dtype=np.int64)
+        self.vals = np.empty(0, dtype=np.float64)
+        self.raw = np.empty(0, dtype=np.int64)
+        self.raw_vals = np.empty(0, dtype=np.float64)
+
+    def add(self, ids):
+        """Adds the values for nuclide ids not yet in the table."""
+        ids = np.setdiff1d(np.asarray(ids, dtype=np.int64), self.ids)
+        if len(ids) == 0:
+            return
+        vals = np.array([self.func(nuc, *self.args) for nuc in ids.tolist()],
+                        dtype=np.float64)
+        self.ids, self.vals = _merge_sorted(self.ids, self.vals, ids, vals)
+        # ids are their own normalized form
+        new = ~_search_sorted(self.raw, ids)[1]
+        self.raw, self.raw_vals = _merge_sorted(self.raw, self.raw_vals,
+                                                ids[new], vals[new])
+
+    def lookup(self, ids):
+        """Returns the values for an array of nuclide ids."""
+        ids = np.asarray(ids, dtype=np.int64)
+        flat = ids.ravel()
+        pos, found = _search_sorted(self.ids, flat)
+        if not found.all():
+            self.add(flat[~found])
+            pos = np.searchsorted(self.ids, flat)
+        return self.vals[pos].reshape(ids.shape)
+
+    def __call__(self, nucs):
+        nucs = np.asarray(nucs)
+        if not self.convert:
+            return self.lookup(nucs)
+        if nucs.dtype.kind not in 'iu':
+            return self.lookup(pyne.nucname.id_array(nucs))
+        flat = nucs.astype(np.int64).ravel()
+        pos, found = _search_sorted(self.raw, flat)
+        if not found.all():
+            raw = np.unique(flat[~found])
+            vals = self.lookup(pyne.nucname.id_array(raw))
+            new = ~_search_sorted(self.raw, raw)[1]
+            self.raw, self.raw_vals = _merge_sorted(self.raw, self.raw_vals,
+                                                    raw[new], vals[new])
+            pos = np.searchsorted(self.raw, flat)
+        return self.raw_vals[pos].reshape(nucs.shape)
+
+
+_dense_tables = {}
+
+def _array_lookup(funcname, nucs, *args):
+    """Looks up the named data function for an array of nuclides through its
+    dense table, using nuclide ids unless a use_metastable argument is False.
+    """
+    key = (funcname,) + args
+    table = _dense_tables.get(key)
+    if table is None:
+        convert = not (funcname in _METASTABLE_FUNCS and args[0] is False)
+        table = _DenseTable(globals()[funcname], args, convert=convert)
+        _dense_tables[key] = table
+    return table(nucs)
+
+def _pair_lookup(func, from_nucs, to_nucs, use_metastable):
+    """Evaluates a data function of nuclide pairs over broadcast arrays,
+    calling it once per distinct pair.
+    """
+    from_nucs, to_nucs = np.broadcast_arrays(np.asarray(from_nucs),
+                                             np.asarray(to_nucs))
+    shape = from_nucs.shape
+    if use_metastable is True:
+        from_nucs = pyne.nucname.id_array(from_nucs)
+        to_nucs = pyne.nucname.id_array(to_nucs)
+    pairs = np.column_stack([np.asarray(from_nucs, dtype=np.int64).ravel(),
+                             np.asarray(to_nucs, dtype=np.int64).ravel()])
+    if len(pairs) == 0:
+        return np.empty(shape, dtype=np.float64)
+    uniq, inv = np.unique(pairs, axis=0, return_inverse=True)
+    vals = np.array([func(f, t, use_metastable) for f, t in uniq.tolist()],
+                    dtype=np.float64)
+    return vals[inv.ravel()].reshape(shape)
+
+_METASTABLE_FUNCS = frozenset(['half_life', 'decay_const', 'state_energy'])
+
 #
 # hash map and initialization
 #
@@ -84,7 +200,7 @@ def atomic_mass(nuc):
 
     Parameters
     ----------
-    nuc : int or str
+    nuc : int, str, or ndarray
         Input nuclide.
 
     Returns
@@ -96,6 +212,8 @@ def atomic_mass(nuc):
     -----
     If the nuclide is not found, the A-number is returned as a float.
     """
+    if isinstance(nuc, np.ndarray):
+        return _array_lookup('atomic_mass', nuc)
     if isinstance(nuc, int):
         mass = cpp_data.atomic_mass(<int> nuc)
     elif isinstance(nuc, basestring):
@@ -127,7 +245,7 @@ def natural_abund(nuc):
 
     Parameters
     ----------
-    nuc : int or str
+    nuc : int, str, or ndarray
         Input nuclide.
 
     Returns
@@ -139,6 +257,8 @@ def natural_abund(nuc):
     -----
     If the nuclide is not found, abundance is 0.
     """
+    if isinstance(nuc, np.ndarray):
+        return _array_lookup('natural_abund', nuc)
     if isinstance(nuc, int):
         abund = cpp_data.natural_abund(<int> pyne.nucname.id(nuc))
     elif isinstance(nuc, basestring):
@@ -163,7 +283,7 @@ def q_val(nuc):
 
     Parameters
     ----------
-    nuc : int or str
+    nuc : int, str, or ndarray
         Input nuclide.
 
     Returns
@@ -175,6 +295,8 @@ def q_val(nuc):
     -----
     If the nuclide is not found, 0 is returned.
     """
+    if isinstance(nuc, np.ndarray):
+        return _array_lookup('q_val', nuc)
     if isinstance(nuc, int):
         q_val = cpp_data.q_val(<int> nuc)
     elif isinstance(nuc, basestring):
@@ -199,7 +321,7 @@ def gamma_frac(nuc):
 
     Parameters
     ----------
-    nuc : int or str
+    nuc : int, str, or ndarray
         Input nuclide.
 
     Returns
@@ -211,6 +333,8 @@ def gamma_frac(nuc):
     -----
     If the nuclide is not found, gamma_frac is 0.
     """
+    if isinstance(nuc, np.ndarray):
+        return _array_lookup('gamma_frac', nuc)
     if isinstance(nuc, int):
         gamma_frac = cpp_data.gamma_frac(<int> nuc)
     elif isinstance(nuc, basestring):
@@ -300,7 +424,7 @@ def ext_air_dose(nuc, source=0):
 
     Parameters
     ----------
-    nuc : int or str
+    nuc : int, str, or ndarray
         Parent nuclide.
     source : int or str
         The int or corresponding dictionary key for the source dataset.
@@ -317,6 +441,8 @@ def ext_air_dose(nuc, source=0):
     The only source that provides this data is EPA; all other
     sources will give a value of -1.
     """
+    if isinstance(nuc, np.ndarray):
+        return _array_lookup('ext_air_dose', nuc, source)
     srcmap = {'EPA': 0, 'DOE': 1, 'GENII': 2}
     if isinstance(source, str):
         sourceint = srcmap[source]
@@ -348,7 +474,7 @@ def dose_ratio(nuc, source=0):
 
     Parameters
     ----------
-    nuc : int or str
+    nuc : int, str, or ndarray
         Parent nuclide.
     source : int or str
         The int or corresponding dictionary key for the source dataset.
@@ -365,6 +491,8 @@ def dose_ratio(nuc, source=0):
     The only source that provides this data is EPA; all other
     sources will give a value of -1.
     """
+    if isinstance(nuc, np.ndarray):
+        return _array_lookup('dose_ratio', nuc, source)
     srcmap = {'EPA': 0, 'DOE': 1, 'GENII': 2}
     if isinstance(source, str):
         sourceint = srcmap[source]
@@ -396,7 +524,7 @@ def ext_soil_dose(nuc, source=0):
 
     Parameters
     ----------
-    nuc : int or str
+    nuc : int, str, or ndarray
         Parent nuclide.
     source : int or str
         The int or corresponding dictionary key for the source dataset.
@@ -412,6 +540,8 @@ def ext_soil_dose(nuc, source=0):
     -----
     If the nuclide is not found, a value of -1 is returned.
     """
+    if isinstance(nuc, np.ndarray):
+        return _array_lookup('ext_soil_dose', nuc, source)
     srcmap = {'EPA': 0, 'DOE': 1, 'GENII': 2}
     if isinstance(source, str):
         sourceint = srcmap[source]
@@ -443,7 +573,7 @@ def ingest_dose(nuc, source=0):
 
     Parameters
     ----------
-    nuc : int or str
+    nuc : int, str, or ndarray
         Parent nuclide.
     source : int or str
         The int or corresponding dictionary key for the source dataset.
@@ -459,6 +589,8 @@ def ingest_dose(nuc, source=0):
     -----
     If the nuclide is not found, a value of -1 is returned.
     """
+    if isinstance(nuc, np.ndarray):
+        return _array_lookup('ingest_dose', nuc, source)
     srcmap = {'EPA': 0, 'DOE': 1, 'GENII': 2}
     if isinstance(source, str):
         sourceint = srcmap[source]
@@ -490,7 +622,7 @@ def dose_fluid_frac(nuc, source=0):
 
     Parameters
     ----------
-    nuc : int or str
+    nuc : int, str, or ndarray
         Parent nuclide.
     source : int or str
         The int or corresponding dictionary key for the source dataset.
@@ -506,6 +638,8 @@ def dose_fluid_frac(nuc, source=0):
     -----
     If the nuclide is not found, a value of -1 is returned.
     """
+    if isinstance(nuc, np.ndarray):
+        return _array_lookup('dose_fluid_frac', nuc, source)
     srcmap = {'EPA': 0, 'DOE': 1, 'GENII': 2}
     if isinstance(source, str):
         sourceint = srcmap[source]
@@ -537,7 +671,7 @@ def inhale_dose(nuc, source=0):
 
     Parameters
     ----------
-    nuc : int or str
+    nuc : int, str, or ndarray
         Parent nuclide.
     source : int or str
         The int or corresponding dictionary key for the source dataset.
@@ -553,6 +687,8 @@ def inhale_dose(nuc, source=0):
     -----
     If the nuclide is not found, a value of -1 is returned.
     """
+    if isinstance(nuc, np.ndarray):
+        return _array_lookup('inhale_dose', nuc, source)
     srcmap = {'EPA': 0, 'DOE': 1, 'GENII': 2}
     if isinstance(source, str):
         sourceint = srcmap[source]
@@ -715,7 +851,7 @@ def b(nuc):
 
     Parameters
     ----------
-    nuc : int or str
+    nuc : int, str, or ndarray
         Input nuclide.
 
     Returns
@@ -738,6 +874,8 @@ def b(nuc):
         b = \\sqrt{\\left| b_{\mbox{coh}} \\right|^2 + \\left| b_{\mbox{inc}} \\right|^2}
 
     """
+    if isinstance(nuc, np.ndarray):
+        return _array_lookup('b', nuc)
     if isinstance(nuc, int):
         value = cpp_data.b(<int> nuc)
     elif isinstance(nuc, basestring):
@@ -848,7 +986,7 @@ def half_life(nuc, use_metastable=True):
 
     Parameters
     ----------
-    nuc : int or str
+    nuc : int, str, or ndarray
         Input nuclide, if metastable is false this uses state_id
     use_metastable : bool
         Assume state of input nuc_id refers to metastable state. Defaults to
@@ -863,6 +1001,8 @@ def half_life(nuc, use_metastable=True):
     -----
     If the nuclide is not found, the nuclide is assumed to be stable.
     """
+    if isinstance(nuc, np.ndarray):
+        return _array_lookup('half_life', nuc, use_metastable)
     if use_metastable is True:
         nuc = pyne.nucname.id(nuc)
         ms = nuc % 10000
@@ -887,7 +1027,7 @@ def decay_const(nuc, use_metastable=True):
 
     Parameters
     ----------
-    nuc : int or str
+    nuc : int, str, or ndarray
         Input nuclide, if metastable is false this uses state_id
     use_metastable : bool
         Assume state of input nuc_id refers to metastable state. Defaults to
@@ -902,6 +1042,8 @@ def decay_const(nuc, use_metastable=True):
     -----
     If the nuclide is not found, the nuclide is assumed to be stable.
     """
+    if isinstance(nuc, np.ndarray):
+        return _array_lookup('decay_const', nuc, use_metastable)
     if use_metastable is True:
         nuc = pyne.nucname.id(nuc)
         ms = nuc % 10000
@@ -940,8 +1082,11 @@ def branch_ratio(from_nuc, to_nuc, use_metastable=True):
     Notes
     -----
     If this pair is not found, it is assumed to be impossible, and the branch ratio
-    is set to zero.
+    is set to zero. If either nuclide is an ndarray, the two are broadcast
+    against each other and an array of branch ratios is returned.
     """
+    if isinstance(from_nuc, np.ndarray) or isinstance(to_nuc, np.ndarray):
+        return _pair_lookup(branch_ratio, from_nuc, to_nuc, use_metastable)
     if use_metastable is True:
         from_nuc = pyne.nucname.id(from_nuc)
         to_nuc = pyne.nucname.id(to_nuc)
@@ -978,7 +1123,7 @@ def state_energy(nuc, use_metastable=True):
 
     Parameters
     ----------
-    nuc : int or str
+    nuc : int, str, or ndarray
         Input nuclide, if metastable is false this uses state id
     use_metastable : bool
         Assume state of input nuc_id refers to metastable state. Defaults to
@@ -993,6 +1138,8 @@ def state_energy(nuc, use_metastable=True):
     -----
     If the nuclide is not found, the nuclide is assumed to be stable.
     """
+    if isinstance(nuc, np.ndarray):
+        return _array_lookup('state_energy', nuc, use_metastable)
     if use_metastable is True:
         nuc = pyne.nucname.id(nuc)
         ms = nuc % 10000
@@ -1344,8 +1491,10 @@ def gamma_energy_byen(en, enerror=None):
 
     Parameters
     ----------
-    en : double
-        gamma ray energy in keV
+    en : double or ndarray
+        gamma ray energy in keV, or an array of them to query
+        one window each, in a single pass over the data. Arrays give a
+        list of result arrays, one per window
     enerror : double
         gamma ray energy error (range which you want to search) this defaults
         to 1% of the energy if it is not provided
@@ -1355,6 +1504,12 @@ def gamma_energy_byen(en, enerror=None):
     ratios : array of pairs
         An array of gamma ray energies and errors
     """
+    cdef vector[double] energy, error
+    cdef vector[int] offsets
+    if isinstance(en, np.ndarray):
+        energy, error = _windows(en, enerror)
+        return _split_pairs(cpp_data.gamma_energy(energy, error, offsets),
+                            offsets)
     if enerror is None:
         enerror = en * 0.01
     return cpp_data.gamma_energy(<double> en, <double> enerror)
@@ -1385,8 +1540,10 @@ def gamma_photon_intensity_byen(en, enerror=None):
 
     Parameters
     ----------
-    en : double
-        gamma ray energy in keV
+    en : double or ndarray
+        gamma ray energy in keV, or an array of them to query
+        one window each, in a single pass over the data. Arrays give a
+        list of result arrays, one per window
     enerror : double
         gamma ray energy error (range which you want to search) this defaults
         to 1% of the energy if it is not provided
@@ -1396,6 +1553,12 @@ def gamma_photon_intensity_byen(en, enerror=None):
     ratios : array of pairs
         An array of gamma ray photon intensities and errors
     """
+    cdef vector[double] energy, error
+    cdef vector[int] offsets
+    if isinstance(en, np.ndarray):
+        energy, error = _windows(en, enerror)
+        return _split_pairs(cpp_data.gamma_photon_intensity(energy, error, offsets),
+                            offsets)
     if enerror is None:
         enerror = en * 0.01
     return cpp_data.gamma_photon_intensity(<double> en,<double> enerror)
@@ -1458,8 +1621,10 @@ def gamma_from_to_byen(en, enerror=None):
 
     Parameters
     ----------
-    en : double
-        gamma ray energy in keV
+    en : double or ndarray
+        gamma ray energy in keV, or an array of them to query
+        one window each, in a single pass over the data. Arrays give a
+        list of result arrays, one per window
     enerror : double
         gamma ray energy error (range which you want to search) this defaults
         to 1% of the energy if it is not provided
@@ -1469,6 +1634,12 @@ def gamma_from_to_byen(en, enerror=None):
     ratios : array of pairs
         An array of gamma ray level pairs in state_id form
     """
+    cdef vector[double] energy, error
+    cdef vector[int] offsets
+    if isinstance(en, np.ndarray):
+        energy, error = _windows(en, enerror)
+        return _split_int_pairs(cpp_data.gamma_from_to(energy, error, offsets),
+                                offsets)
     if enerror is None:
         enerror = en * 0.01
     return cpp_data.gamma_from_to(<double> en,<double> enerror)
@@ -1480,8 +1651,10 @@ def gamma_parent_child(en, enerror=None):
 
     Parameters
     ----------
-    en : double
-        gamma ray energy in keV
+    en : double or ndarray
+        gamma ray energy in keV, or an array of them to query
+        one window each, in a single pass over the data. Arrays give a
+        list of result arrays, one per window
     enerror : double
         gamma ray energy error (range which you want to search) this defaults
         to 1% of the energy if it is not provided
@@ -1491,6 +1664,12 @@ def gamma_parent_child(en, enerror=None):
     ratios : array of pairs
         An array of gamma ray parents in state_id form
     """
+    cdef vector[double] energy, error
+    cdef vector[int] offsets
+    if isinstance(en, np.ndarray):
+        energy, error = _windows(en, enerror)
+        return _split_int_pairs(cpp_data.gamma_parent_child(energy, error, offsets),
+                                offsets)
     if enerror is None:
         enerror = en * 0.01
     return cpp_data.gamma_parent_child(<double> en, <double> enerror)
@@ -1503,8 +1682,10 @@ def gamma_parent(en, enerror=None):
 
     Parameters
     ----------
-    en : double
-        gamma ray energy in keV
+    en : double or ndarray
+        gamma ray energy in keV, or an array of them to query
+        one window each, in a single pass over the data. Arrays give a
+        list of result arrays, one per window
     enerror : double
         gamma ray energy error (range which you want to search) this defaults
         to 1% of the energy if it is not provided
@@ -1514,6 +1695,12 @@ def gamma_parent(en, enerror=None):
     ratios : array of ints
         An array of gamma ray parents in state_id form
     """
+    cdef vector[double] energy, error
+    cdef vector[int] offsets
+    if isinstance(en, np.ndarray):
+        energy, error = _windows(en, enerror)
+        return _split_ints(cpp_data.gamma_parent(energy, error, offsets),
+                           offsets)
     if enerror is None:
         enerror = en * 0.01
     return cpp_data.gamma_parent(<double> en, <double> enerror)
@@ -1525,8 +1712,10 @@ def gamma_child_byen(en, enerror=None):
 
     Parameters
     ----------
-    en : double
-       gamma ray energy in keV
+    en : double or ndarray
+       gamma ray energy in keV, or an array of them to query
+       one window each, in a single pass over the data. Arrays give a
+       list of result arrays, one per window
     enerror : double
        gamma ray energy error (range which you want to search) this defaults
        to 1% of the energy if it is not provided
@@ -1536,6 +1725,12 @@ def gamma_child_byen(en, enerror=None):
     ratios : array of ints
        An array of gamma ray children in state_id form
     """
+    cdef vector[double] energy, error
+    cdef vector[int] offsets
+    if isinstance(en, np.ndarray):
+        energy, error = _windows(en, enerror)
+        return _split_ints(cpp_data.gamma_child(energy, error, offsets),
+                           offsets)
     if enerror is None:
         enerror = en * 0.01
     return cpp_data.gamma_child(<double> en, <double> enerror)
@@ -1619,8 +1814,10 @@ def alpha_parent(en, enerror=None):
 
     Parameters
     ----------
-    en : double
-        alpha energy in keV
+    en : double or ndarray
+        alpha energy in keV, or an array of them to query
+        one window each, in a single pass over the data. Arrays give a
+        list of result arrays, one per window
     enerror : double
         alpha energy error (range which you want to search) this defaults
         to 1% of the energy if it is not provided
@@ -1630,6 +1827,12 @@ def alpha_parent(en, enerror=None):
     ratios : array of ints
         An array of alpha parents in state_id form
     """
+    cdef vector[double] energy, error
+    cdef vector[int] offsets
+    if isinstance(en, np.ndarray):
+        energy, error = _windows(en, enerror)
+        return _split_ints(cpp_data.alpha_parent(energy, error, offsets),
+                           offsets)
     if enerror is None:
         enerror = en * 0.01
     return cpp_data.alpha_parent(<double> en, <double> enerror)
@@ -1641,8 +1844,10 @@ def alpha_child_byen(en, enerror=None):
 
     Parameters
     ----------
-    en : double
-        alpha energy in keV
+    en : double or ndarray
+        alpha energy in keV, or an array of them to query
+        one window each, in a single pass over the data. Arrays give a
+        list of result arrays, one per window
     enerror : double
         alpha energy error (range which you want to search) this defaults
         to 1% of the energy if it is not provided
@@ -1652,6 +1857,12 @@ def alpha_child_byen(en, enerror=None):
     ratios : array of ints
         An array of alpha children in state_id form
     """
+    cdef vector[double] energy, error
+    cdef vector[int] offsets
+    if isinstance(en, np.ndarray):
+        energy, error = _windows(en, enerror)
+        return _split_ints(cpp_data.alpha_child(energy, error, offsets),
+                           offsets)
     if enerror is None:
         enerror = en * 0.01
     return cpp_data.alpha_child(<double> en, <double> enerror)
@@ -1731,8 +1942,10 @@ def beta_parent(en, enerror=None):
 
     Parameters
     ----------
-    en : double
-        beta- energy in keV
+    en : double or ndarray
+        beta- energy in keV, or an array of them to query
+        one window each, in a single pass over the data. Arrays give a
+        list of result arrays, one per window
     enerror : double
         beta- energy error (range which you want to search) this defaults
         to 1% of the energy if it is not provided
@@ -1742,6 +1955,12 @@ def beta_parent(en, enerror=None):
     ratios : array of ints
         An array of beta minus parents in nuc_id form
     """
+    cdef vector[double] energy, error
+    cdef vector[int] offsets
+    if isinstance(en, np.ndarray):
+        energy, error = _windows(en, enerror)
+        return _split_ints(cpp_data.beta_parent(energy, error, offsets),
+                           offsets)
     if enerror is None:
         enerror = en * 0.01
     return cpp_data.beta_parent(<double> en, <double> enerror)
@@ -1753,8 +1972,10 @@ def beta_child_byen(en, enerror=None):
 
     Parameters
     ----------
-    en : double
-        beta- energy in keV
+    en : double or ndarray
+        beta- energy in keV, or an array of them to query
+        one window each, in a single pass over the data. Arrays give a
+        list of result arrays, one per window
     enerror : double
         beta- energy error (range which you want to search) this defaults
         to 1% of the energy if it is not provided
@@ -1764,6 +1985,12 @@ def beta_child_byen(en, enerror=None):
     ratios : array of ints
         An array of beta minus children in nuc_id form
     """
+    cdef vector[double] energy, error
+    cdef vector[int] offsets
+    if isinstance(en, np.ndarray):
+        energy, error = _windows(en, enerror)
+        return _split_ints(cpp_data.beta_child(energy, error, offsets),
+                           offsets)
     if enerror is None:
         enerror = en * 0.01
     return cpp_data.beta_child(<double> en, <double> enerror)
@@ -1860,8 +2087,10 @@ def ecbp_parent(en, enerror=None):
 
     Parameters
     ----------
-    en : double
-        beta- energy in keV
+    en : double or ndarray
+        beta- energy in keV, or an array of them to query
+        one window each, in a single pass over the data. Arrays give a
+        list of result arrays, one per window
     enerror : double
         beta- energy error (range which you want to search) this defaults
         to 1% of the energy if it is not provided
@@ -1871,6 +2100,12 @@ def ecbp_parent(en, enerror=None):
     ratios : array of ints
         An array of beta plus/electron capture children in nuc_id form
     """
+    cdef vector[double] energy, error
+    cdef vector[int] offsets
+    if isinstance(en, np.ndarray):
+        energy, error = _windows(en, enerror)
+        return _split_ints(cpp_data.ecbp_parent(energy, error, offsets),
+                           offsets)
     if enerror is None:
         enerror = en * 0.01
     return cpp_data.ecbp_parent(<double> en, <double> enerror)
@@ -1882,8 +2117,10 @@ def ecbp_child_byen(en, enerror=None):
 
     Parameters
     ----------
-    en : double
-        beta- energy in keV
+    en : double or ndarray
+        beta- energy in keV, or an array of them to query
+        one window each, in a single pass over the data. Arrays give a
+        list of result arrays, one per window
     enerror : double
         beta- energy error (range which you want to search) this defaults
         to 1% of the energy if it is not provided
@@ -1893,6 +2130,12 @@ def ecbp_child_byen(en, enerror=None):
     ratios : array of ints
         An array of beta plus/electron capture children in state_id form
     """
+    cdef vector[double] energy, error
+    cdef vector[int] offsets
+    if isinstance(en, np.ndarray):
+        energy, error = _windows(en, enerror)
+        return _split_ints(cpp_data.ecbp_child(energy, error, offsets),
+                           offsets)
     if enerror is None:
         enerror = en * 0.01
     return cpp_data.ecbp_child(<double> en, <double> enerror)
@@ -1932,3 +2175,90 @@ def ecbp_xrays(parent):
 
     """
     return cpp_data.ecbp_xrays(<int> parent)
+
+
+#
+# batched energy window queries
+#
+def _windows(en, enerror):
+    """Returns flat lists of the energies and the broadcast errors of an
+    array of energy windows, whose errors default to 1% of the energies.
+    """
+    en = np.asarray(en, dtype=np.float64)
+    if enerror is None:
+        enerror = en * 0.01
+    en, enerror = np.broadcast_arrays(en, np.asarray(enerror, dtype=np.float64))
+    return en.ravel().tolist(), enerror.ravel().tolist()
+
+cdef list _split_offsets(np.ndarray arr, vector[int]& offsets):
+    """Splits an array of the results of batched window queries into the
+    results of each window."""
+    if offsets.size() <= 1:
+        return []
+    return np.split(arr, [offsets[i] for i in range(1, offsets.size() - 1)])
+
+cdef list _split_ints(vector[int] values, vector[int]& offsets):
+    cdef size_t i
+    cdef np.ndarray[np.int32_t, ndim=1] arr = np.empty(values.size(),
+                                                       dtype=np.int32)
+    for i in range(values.size()):
+        arr[i] = values[i]
+    return _split_offsets(arr, offsets)
+
+cdef list _split_int_pairs(vector[cpp_pair[int, int]] values,
+                           vector[int]& offsets):
+    cdef size_t i
+    cdef np.ndarray[np.int32_t, ndim=2] arr = np.empty((values.size(), 2),
+                                                       dtype=np.int32)
+    for i in range(values.size()):
+        arr[i, 0] = values[i].first
+        arr[i, 1] = values[i].second
+    return _split_offsets(arr, offsets)
+
+cdef list _split_pairs(vector[cpp_pair[double, double]] values,
+                       vector[int]& offsets):
+    cdef size_t i
+    cdef np.ndarray[np.float64_t, ndim=2] arr = np.empty((values.size(), 2),
+                                                         dtype=np.float64)
+    for i in range(values.size()):
+        arr[i, 0] = values[i].first
+        arr[i, 1] = values[i].second
+    return _split_offsets(arr, offsets)
+
+
+#
+# preloading
+#
+_PRELOAD_FUNCS = ['atomic_mass', 'natural_abund', 'q_val', 'gamma_frac', 'b',
+                  'half_life', 'decay_const', 'state_energy']
+_PRELOAD_DOSE_FUNCS = ['ext_air_dose', 'dose_ratio', 'ext_soil_dose',
+                       'ingest_dose', 'dose_fluid_frac', 'inhale_dose']
+
+def preload(tables=True):
+    """Loads the nuclear data behind the scalar lookup functions from
+    nuc_data now, rather than lazily on first use.
+
+    Parameters
+    ----------
+    tables : bool, optional
+        Also fill the dense tables used when these functions are given
+        arrays, for every nuclide with an atomic mass.
+    """
+    for funcname in _PRELOAD_FUNCS:
+        globals()[funcname]('H3')
+    for funcname in _PRELOAD_DOSE_FUNCS:
+        for source in range(3):
+            globals()[funcname]('H3', source)
+    branch_ratio('H3', 'He3')
+    decay_children('H3')
+    if not tables:
+        return
+    nucs = np.array(sorted(atomic_mass_map.keys()), dtype=np.int64)
+    keys = [(funcname,) for funcname in _PRELOAD_FUNCS[:5]]
+    keys += [(funcname, True) for funcname in _PRELOAD_FUNCS[5:]]
+    keys += [(funcname, source) for funcname in _PRELOAD_DOSE_FUNCS
+             for source in range(3)]
+    for key in keys:
+        if key not in _dense_tables:
+            _dense_tables[key] = _DenseTable(globals()[key[0]], key[1:])
+        _dense_tables[key].add(nucs)
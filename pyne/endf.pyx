@@ -15,6 +15,8 @@ from __future__ import print_function, division, unicode_literals
 
 import re
 import os
+import mmap
+import multiprocessing
 from collections import OrderedDict, Iterable
 from warnings import warn
 from pyne.utils import QAWarning
@@ -30,7 +32,8 @@ from pyne cimport cpp_nucname
 from pyne import nucname
 from pyne import rxdata
 from pyne.rxname import label
-from pyne.utils import fromendf_tok, endftod
+from pyne.utils import fromendf_tok, endftod, INDEX_SUFFIX, save_index, \
+    load_index
 
 np.import_array()
 
@@ -57,8 +60,26 @@ def _radiation_type(value):
 
 
 class Library(rxdata.RxLib):
-    """A class for a file which contains multiple ENDF evaluations."""
-    def __init__(self, fh):
+    """A class for a file which contains multiple ENDF evaluations.
+
+    Parameters
+    ----------
+    fh : str or file-like
+        Path to, or handle of, the ENDF tape.
+    index : bool, optional
+        If fh is a path, reuse the MF/MT byte-offset index saved beside the
+        tape (fh + INDEX_SUFFIX) when the tape is unchanged, rather than
+        scanning the headers of every material, and save a new index
+        otherwise. The index is written next to the tape, so this is off by
+        default.
+
+    Notes
+    -----
+    Sections of tapes given by path are read through a memory map, which
+    stays open until close() is called or the library is garbage collected.
+    Libraries may also be used as context managers.
+    """
+    def __init__(self, fh, index=False):
         self.mts = {}
         self.structure = {}
         self.mat_dict = {}
@@ -72,12 +93,84 @@ class Library(rxdata.RxLib):
         self.chars_til_now = 0
         self.offset = 0
         self.fh = fh
+        self._mmap = None
+        self.index_file = None
+        if index and isinstance(fh, basestring):
+            self.index_file = fh + INDEX_SUFFIX
+            if self._load_index():
+                return
         self._set_line_length()
         # read first line (Tape ID)
         self._read_tpid()
         # read headers for all materials
         while self.more_files:
             self._read_headers()
+        if self.index_file is not None:
+            self._save_index()
+
+    def close(self):
+        """Closes the memory map of the tape, if one is open."""
+        if self._mmap is not None:
+            self._mmap.close()
+            self._mmap = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+    def __del__(self):
+        if getattr(self, '_mmap', None) is not None:
+            self._mmap.close()
+
+    def _save_index(self):
+        """Saves the material headers and MF/MT byte offsets of the tape to
+        self.index_file, along with the size and modification time of the
+        tape.
+        """
+        materials = []
+        for nuc, mat in self.mat_dict.items():
+            mfs = [[mf, mt, start, stop] for (mf, mt), (start, stop)
+                   in mat['mfs'].items()]
+            materials.append({'nuc': nuc, 'end_line': mat['end_line'],
+                              'mfs': mfs,
+                              'docs': self.structure[nuc]['docs'],
+                              'matflags': self.structure[nuc]['matflags'],
+                              'named': hasattr(self, 'mat{0}'.format(nuc))})
+        idx = {'line_length': self.line_length,
+               'chars_til_now': self.chars_til_now, 'offset': self.offset,
+               'materials': materials}
+        save_index(self.fh, idx, self.index_file)
+
+    def _load_index(self):
+        """Loads the material headers and MF/MT byte offsets of the tape from
+        self.index_file.
+
+        Returns
+        -------
+        loaded : bool
+            False if there is no index or the tape has changed since it was
+            saved.
+        """
+        idx = load_index(self.fh, self.index_file)
+        if idx is None:
+            return False
+        self.line_length = idx['line_length']
+        self.chars_til_now = idx['chars_til_now']
+        self.offset = idx['offset']
+        for mat in idx['materials']:
+            nuc = mat['nuc']
+            self.structure[nuc] = {'styles': '', 'docs': mat['docs'],
+                                   'particles': [], 'data': {},
+                                   'matflags': mat['matflags']}
+            mfs = dict(((mf, mt), (start, stop))
+                       for mf, mt, start, stop in mat['mfs'])
+            self.mat_dict[nuc] = {'end_line': mat['end_line'], 'mfs': mfs}
+            if mat['named']:
+                setattr(self, 'mat{0}'.format(nuc), self.structure[nuc])
+        self.more_files = False
+        return True
 
     def _set_line_length(self):
         opened_here = False
@@ -1054,26 +1147,31 @@ class Library(rxdata.RxLib):
         array, 1d, float64
             1d, float64 NumPy array containing the reaction data.
         """
-        opened_here = False
-        if isinstance(self.fh, basestring):
-            fh = open(self.fh, 'rU')
-            opened_here = True
-        else:
-            fh = self.fh
         try:
             start, stop = self.mat_dict[nuc]['mfs'][mf, mt]
         except KeyError as e:
             msg = 'MT {1} not found in File {0}.'.format(mf, mt)
             e.args = (msg,)
             raise e
+        if isinstance(self.fh, basestring):
+            # slice the section straight out of a memory map of the tape
+            if self._mmap is None:
+                with open(self.fh, 'rb') as f:
+                    self._mmap = mmap.mmap(f.fileno(), 0,
+                                           access=mmap.ACCESS_READ)
+            if lines != 0:
+                stop = start + lines*self.line_length
+            s = self._mmap[start:stop]
+            if self.line_length == 82:
+                s = s.replace(b'\r\n', b'\n')
+            return fromendf_tok(s)
+        fh = self.fh
         fh.readline()
         fh.seek(start)
         if lines == 0:
             s = fh.read(stop-start)
         else:
             s = fh.read(lines*self.line_length)
-        if opened_here:
-            fh.close
         return fromendf_tok(s)
 
 
@@ -2665,6 +2763,81 @@ class Evaluation(object):
             library = 'None'
         return '<Evaluation: {0}, {1}>'.format(name, library)
 
+    def __getstate__(self):
+        # file handles cannot be pickled, so unpickled evaluations can not
+        # read further sections
+        state = self.__dict__.copy()
+        state['_fh'] = None
+        return state
+
+
+def _seek_material(fh, mat):
+    """Position the file at the start of the ENDF material with MAT number
+    mat.
+    """
+    while True:
+        position = fh.tell()
+        line = fh.readline()
+        if line == '':
+            raise ValueError('Material {0} not found.'.format(mat))
+        if line[66:70].strip() == str(mat) and int(line[70:72]) > 0:
+            fh.seek(position)
+            break
+
+
+def _read_evaluation(args):
+    source, reactions, skip_mf, skip_mt, verbose = args
+    if isinstance(source, tuple):
+        filename, mat = source
+    else:
+        filename, mat = source, None
+    with open(filename, 'rU') as fh:
+        if mat is not None:
+            _seek_material(fh, mat)
+        evaluation = Evaluation(fh, verbose=verbose)
+        evaluation.read(reactions, skip_mf, skip_mt)
+    return evaluation
+
+
+def read_many(sources, reactions=None, skip_mf=[], skip_mt=[], workers=None,
+              verbose=False):
+    """Reads many ENDF evaluations in parallel, one material per process.
+
+    Parameters
+    ----------
+    sources : list of str or (str, int) tuples
+        Paths to ENDF files, each read from their first material, or
+        (path, MAT) pairs giving a particular material in a file.
+    reactions : tuple or list of tuple, optional
+        Reactions to read from each evaluation, as in Evaluation.read().
+    skip_mf : list of int, optional
+        Files (MF) which should not be read
+    skip_mt : list of int, optional
+        Reactions (MT) which should not be read
+    workers : int or None, optional
+        Number of processes to read with. None uses one per CPU, and 1 reads
+        the evaluations in this process.
+    verbose : bool, optional
+        Print each section as it is read.
+
+    Returns
+    -------
+    evaluations : list of Evaluation
+        The evaluations in the order of sources. Their files are closed, so
+        they can not read any more sections.
+    """
+    tasks = [(source, reactions, skip_mf, skip_mt, verbose)
+             for source in sources]
+    if workers == 1 or len(tasks) < 2:
+        return [_read_evaluation(task) for task in tasks]
+    pool = multiprocessing.Pool(workers)
+    try:
+        evaluations = pool.map(_read_evaluation, tasks, chunksize=1)
+    finally:
+        pool.close()
+        pool.join()
+    return evaluations
+
 
 class Tab1(object):
     """A one-dimensional tabulated function.
@@ -3820,6 +3993,15 @@ cdef class Resonance(object):
     cdef public double width_fissionA
     cdef public double width_fissionB
 
+    def __reduce__(self):
+        return (Resonance, (), (self.energy, self.spin, self.width_total,
+                                self.width_neutron, self.width_gamma,
+                                self.width_fissionA, self.width_fissionB))
+
+    def __setstate__(self, state):
+        (self.energy, self.spin, self.width_total, self.width_neutron,
+         self.width_gamma, self.width_fissionA, self.width_fissionB) = state
+
 
 class AdlerResonance(object):
     def __init__(self):
@@ -38,3 +38,4 @@ cdef class _MapStrMaterial:
 
 cdef class _MaterialLibrary(object):
     cdef dict _lib
+    cdef list _rows
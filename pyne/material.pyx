@@ -20,6 +20,7 @@ import numpy as np
 from warnings import warn
 from pyne.utils import QAWarning
 import os
+import json
 import sys
 if sys.version_info[0] >= 3:
     #Python2 basestring is now Python3 string
@@ -1426,18 +1427,15 @@ cdef class _Material:
 
     def __setitem__(self, key, double value):
         cdef _Material new_mat
-        cdef matp new_matp
-        cdef conv._MapIntDouble mbm
         cdef int key_zz
-        cdef cpp_map[int, double].iterator mbmiter, mbmend
+        cdef cpp_vector[int] nucv
+        cdef cpp_vector[double] valv
 
-        # Set single integer-key
+        # Set single integer-key, in place
         if isinstance(key, int):
-            mbm = self.mult_by_mass()
-            mbm.map_ptr[0][key] = value
-            new_matp = new cpp_material.Material(mbm.map_ptr[0], -1.0, -1.0)
-            self.mat_pointer = new_matp
-            self._comp = None
+            nucv.push_back(key)
+            valv.push_back(value)
+            self.mat_pointer.update(nucv, valv)
 
         # Set single string-key
         elif isinstance(key, basestring):
@@ -1473,21 +1471,13 @@ cdef class _Material:
 
     def __delitem__(self, key):
         cdef _Material new_mat
-        cdef matp new_matp
-        cdef conv._MapIntDouble mbm
         cdef int key_zz
-        cdef cpp_map[int, double].iterator mbmiter, mbmend
+        cdef cpp_vector[int] nucv
 
-        # Remove single key
+        # Remove single key, in place
         if isinstance(key, int):
-            if 0 == self.mat_pointer.comp.count(key):
-                return
-            mbm = self.mult_by_mass()
-            mbm.map_ptr.erase(<int> key)
-            new_matp = new cpp_material.Material(mbm.map_ptr[0], -1.0)
-            new_matp = new cpp_material.Material(mbm.map_ptr[0], -1.0, -1.0)
-            self.mat_pointer = new_matp
-            self._comp = None
+            nucv.push_back(key)
+            self.mat_pointer.remove(nucv)
 
         # Remove single string-key
         elif isinstance(key, basestring):
@@ -1521,6 +1511,48 @@ cdef class _Material:
                     repr(key), type(key)))
 
 
+    def update(self, other=(), **kwargs):
+        """update(other=(), **kwargs)
+        Sets the masses of nuclides in place from a mapping or a sequence of
+        (nuc, mass) pairs, and from keyword arguments, as with dict.update().
+        The masses are set together through update_many().
+
+        """
+        items = list(other.items() if hasattr(other, 'items') else other)
+        items.extend(kwargs.items())
+        self.update_many([nuc for nuc, value in items],
+                         [value for nuc, value in items])
+
+
+    def update_many(self, nucs, values):
+        """update_many(nucs, values)
+        Sets the masses of many nuclides in place with a single C++ call.
+        Nuclides that are not yet present are added, and the composition is
+        renormalized only once, so this is much faster than setting the
+        nuclides one at a time. As with setting a single nuclide, the mass of
+        the material becomes the new total mass.
+
+        Parameters
+        ----------
+        nucs : array-like of ints or strs
+            Nuclides whose masses to set.
+        values : array-like of floats
+            The new masses of the nuclides, matching nucs.
+
+        """
+        cdef cpp_vector[int] nucv
+        cdef cpp_vector[double] valv
+        nucs = np.asarray(nucs)
+        values = np.asarray(values, dtype=np.float64)
+        if nucs.shape != values.shape:
+            raise ValueError("nucs and values must have the same shape.")
+        if nucs.dtype.kind not in 'iu':
+            nucs = nucname.id_array(nucs)
+        nucv = nucs.ravel().tolist()
+        valv = values.ravel().tolist()
+        self.mat_pointer.update(nucv, valv)
+
+
     def __iter__(self):
         mbm = self.mult_by_mass()
         self._iter_mbm = mbm
@@ -2067,6 +2099,87 @@ class MapStrMaterial(_MapStrMaterial, collections.MutableMapping):
 
 
 
+cdef cpp_vector[cpp_material.Material] _material_vector(mats):
+    cdef _Material mat
+    cdef cpp_vector[cpp_material.Material] matv
+    matv.reserve(len(mats))
+    for mat in mats:
+        matv.push_back(mat.mat_pointer[0])
+    return matv
+
+
+def mix(mats, fracs, by_volume=False):
+    """mix(mats, fracs, by_volume=False)
+    Mixes materials together in a single pass over their merged nuclides.
+    The result is identical to adding up mat*frac (times density when mixing
+    by volume) for each material in order, with a mass of 1.
+
+    Parameters
+    ----------
+    mats : sequence of Materials
+        The materials to mix.
+    fracs : sequence of floats
+        The mass fraction, or volume fraction if by_volume, of each material.
+    by_volume : bool, optional
+        Whether fracs are volume fractions rather than mass fractions.
+
+    Returns
+    -------
+    mixed : Material
+        The mixture, with a mass of 1.
+
+    See Also
+    --------
+    mix_many : Mixes many sets of materials at once.
+    MultiMaterial : Mixes a dictionary of materials and fractions.
+
+    """
+    if len(mats) != len(fracs):
+        raise ValueError("mats and fracs must have the same length.")
+    cdef _Material mixed = Material()
+    mixed.mat_pointer[0] = cpp_material.mix(_material_vector(mats), fracs,
+                                            by_volume)
+    return mixed
+
+
+def mix_many(mats, indices, fracs, by_volume=False):
+    """mix_many(mats, indices, fracs, by_volume=False)
+    Mixes many sets of materials at once. The nuclides of mats are merged
+    only once, and no intermediate materials are built, so this is much
+    faster than calling mix() for each mixture.
+
+    Parameters
+    ----------
+    mats : sequence of Materials
+        The materials that mixtures are made of.
+    indices : sequence of sequences of ints
+        The indices into mats of the materials in each mixture.
+    fracs : sequence of sequences of floats
+        The mass fractions, or volume fractions if by_volume, of the
+        materials in each mixture, matching indices.
+    by_volume : bool, optional
+        Whether fracs are volume fractions rather than mass fractions.
+
+    Returns
+    -------
+    mixed : list of Materials
+        The mixtures, each equal to mix() of its materials and fractions.
+
+    """
+    if len(indices) != len(fracs):
+        raise ValueError("indices and fracs must have the same length.")
+    cdef cpp_vector[cpp_material.Material] mixedv = cpp_material.mix_many(
+        _material_vector(mats), indices, fracs, by_volume)
+    cdef _Material pymat
+    cdef int i
+    mixed = []
+    for i in range(mixedv.size()):
+        pymat = Material()
+        pymat.mat_pointer[0] = mixedv[i]
+        mixed.append(pymat)
+    return mixed
+
+
 class MultiMaterial(collections.MutableMapping):
     """ This class is serves as a way of storing a collection of materials.
     There sole argument of this function is a dictionary with material
@@ -2112,30 +2225,15 @@ class MultiMaterial(collections.MutableMapping):
         """This function reads in a python dict of materials and mass fractions
         then mixes the material by mass fractions and returns a material of mass=1.
         """
-        total = 0
-        total_mass_frac = 0
-        mix = Material()
-        for mat, mat_frac in self._mats.items():
-            mix = mix + mat*mat_frac
-            total_mass_frac += mat_frac
-            total += (mat_frac/mat.density)
-        mix.mass = 1
-        mix.density = total_mass_frac/total
-
-        return mix
+        mats, fracs = zip(*self._mats.items()) if self._mats else ((), ())
+        return mix(mats, fracs)
 
     def mix_by_volume(self):
         """This function reads in a python dict of materials and volume fractions
         then mixes the material by volume fractions and returns a material of mass=1.
         """
-        total = 0
-        mix = Material()
-        for mat, mat_frac in self._mats.items():
-            mix = mix + mat*mat_frac*mat.density
-            total += (mat.density*mat_frac)
-        mix.mass = 1
-        mix.density = total
-        return mix
+        mats, fracs = zip(*self._mats.items()) if self._mats else ((), ())
+        return mix(mats, fracs, by_volume=True)
 
 
 def mats_latex_table(mats, labels=None, align=None, format=".5g"):
@@ -2173,7 +2271,8 @@ def mats_latex_table(mats, labels=None, align=None, format=".5g"):
 
 cdef class _MaterialLibrary(object):
 
-    def __init__(self, lib=None, datapath="/materials", nucpath="/nucid"):
+    def __init__(self, lib=None, datapath="/materials", nucpath="/nucid",
+                 lazy=False):
         """Parameters
         ----------
         lib : dict-like, str, or None, optional
@@ -2183,11 +2282,14 @@ cdef class _MaterialLibrary(object):
             The path in the heirarchy to the data table in an HDF5 file.
         nucpath : str, optional
             The path in the heirarchy to the nuclide array in an HDF5 file.
+        lazy : bool, optional
+            Read materials from an HDF5 file only when they are accessed.
 
         """
         if sys.version_info[0] >=3 and isinstance(lib, bytes):
             lib = lib.decode()
         cdef dict _lib = {}
+        self._rows = []
         if lib is None:
             self._lib = _lib
         elif isinstance(lib, collections.Mapping):
@@ -2200,7 +2302,8 @@ cdef class _MaterialLibrary(object):
                 self.from_json(lib)
             if lib.endswith('.h5') or lib.endswith('.hdf5') \
                                    or lib.endswith('.h5m'):
-                self.from_hdf5(lib, datapath=datapath, nucpath=nucpath)
+                self.from_hdf5(lib, datapath=datapath, nucpath=nucpath,
+                               lazy=lazy)
         elif isinstance(lib, collections.Sequence):
             for key, mat in lib:
                 _lib[key] = ensure_material(mat)
@@ -2219,7 +2322,10 @@ cdef class _MaterialLibrary(object):
         return iter(self._lib)
 
     def __getitem__(self, key):
-        return self._lib[key]
+        mat = self._lib[key]
+        if isinstance(mat, _LazyRow):
+            mat = self._lib[key] = mat.load()
+        return mat
 
     def __setitem__(self, key, value):
         self._lib[key] = ensure_material(value)
@@ -2276,7 +2382,8 @@ cdef class _MaterialLibrary(object):
         cdef bint opened_here = False
         cdef cpp_jsoncpp.Value jsonlib = cpp_jsoncpp.Value(cpp_jsoncpp.objectValue)
         cdef cpp_jsoncpp.StyledWriter writer = cpp_jsoncpp.StyledWriter()
-        for key, mat in self._lib.items():
+        for key in self._lib:
+            mat = self[key]
             key = key.encode()
             skey = std_string(<char *> key)
             jsonlib[skey] = (<_Material> mat).mat_pointer.dump_json()
@@ -2288,8 +2395,10 @@ cdef class _MaterialLibrary(object):
         if opened_here:
             file.close()
 
-    def from_hdf5(self, file, datapath="/materials", nucpath="/nucid"):
-        """Loads data from an HDF5 file into this material library.
+    def from_hdf5(self, file, datapath="/materials", nucpath="/nucid",
+                  lazy=False):
+        """Loads data from an HDF5 file into this material library.  The
+        material table is read as a single slab, unless lazy is set.
 
         Parameters
         ----------
@@ -2299,6 +2408,9 @@ cdef class _MaterialLibrary(object):
             The path in the heirarchy to the data table in an HDF5 file.
         nucpath : str, optional
             The path in the heirarchy to the nuclide array in an HDF5 file.
+        lazy : bool, optional
+            Only read the metadata now, and read each material from its row of
+            the table when it is first accessed, by key or with row().
 
         """
         cdef std_string s
@@ -2307,18 +2419,35 @@ cdef class _MaterialLibrary(object):
         cdef int i
         cdef _Material mat
         cdef dict _lib = (<_MaterialLibrary> self)._lib
-        cdef np.ndarray mattable
         with tb.open_file(file, 'r') as f:
-            matstable = f.get_node(datapath)[:]
-            nucs = f.get_node(nucpath)[:]
             matsmetadata = f.get_node(datapath + '_metadata').read()
+            if not lazy:
+                matstable = f.get_node(datapath)[:]
+                nucs = f.get_node(nucpath)[:]
+        matsmetadata = [np.asarray(m, dtype=np.int8).tobytes()
+                        for m in matsmetadata]
+        self._rows = []
+        if lazy:
+            filename = os.path.abspath(file)
+            for i, strmetadata in enumerate(matsmetadata):
+                metadata = json.loads(strmetadata.decode())
+                name = metadata.get("name", "_" + str(i))
+                _lib[name] = _LazyRow(filename, datapath, i)
+                self._rows.append(name)
+            return
+        # group the nonzero entries of the composition slab by row
+        comps = matstable['comp']
+        rows, cols = np.nonzero(comps)
+        bounds = np.searchsorted(rows, np.arange(len(matstable) + 1))
+        masses = matstable['mass'].tolist()
+        densities = matstable['density'].tolist()
+        apms = matstable['atoms_per_molecule'].tolist()
         for i in range(len(matstable)):
-            row = matstable[i]
-            comp = dict((<int> k, v) for k, v in zip(nucs, row[3]) if v != 0.0)
-            mat = Material(comp, mass=row[0], density=row[1],
-                                    atoms_per_molecule=row[2])
-            strmetadata = "".join(map(chr, matsmetadata[i]))
-            strmetadata = strmetadata.encode()
+            rowcols = cols[bounds[i]:bounds[i+1]]
+            comp = dict(zip(nucs[rowcols].tolist(), comps[i, rowcols].tolist()))
+            mat = Material(comp, mass=masses[i], density=densities[i],
+                           atoms_per_molecule=apms[i])
+            strmetadata = matsmetadata[i]
             s = std_string(<char *> strmetadata)
             attribs = cpp_jsoncpp.Value()
             reader.parse(s, attribs)
@@ -2328,9 +2457,21 @@ cdef class _MaterialLibrary(object):
             else:
                 name = "_" + str(i)
             _lib[name] = mat
+            self._rows.append(name)
+
+    def row(self, i):
+        """Returns the material in row i of the HDF5 table last loaded into
+        this library with from_hdf5().
+        """
+        return self[self._rows[i]]
 
-    def write_hdf5(self, filename, datapath="/materials", nucpath="/nucid"):
-        """Writes this material library to an HDF5 file.
+    def write_hdf5(self, filename, datapath="/materials", nucpath="/nucid",
+                   chunksize=100):
+        """Writes this material library to an HDF5 file.  The file is opened
+        once, the compositions of all of the materials are written to the
+        material table as one slab, and their metadata to the variable-length
+        metadata array.  If the table already exists the materials are appended
+        to it.
 
         Parameters
         ----------
@@ -2340,21 +2481,100 @@ cdef class _MaterialLibrary(object):
             The path in the heirarchy to the data table in an HDF5 file.
         nucpath : str, optional
             The path in the heirarchy to the nuclide array in an HDF5 file.
+            If this array already exists, nuclides which are not in it are not
+            written out.
+        chunksize : int, optional
+            The number of rows per chunk of a new table.
 
         """
         cdef _Material mat
-        cdef dict _lib = (<_MaterialLibrary> self)._lib
+        cdef cpp_jsoncpp.FastWriter writer = cpp_jsoncpp.FastWriter()
+        cdef std_string s
         cdef set nucids = set()
-        for mat in _lib.values():
+        keys = list(self._lib)
+        mats = [self[key] for key in keys]
+        for mat in mats:
             nucids.update(mat.comp.keys())
+        filters = tb.Filters(complevel=1, complib='zlib')
         with tb.open_file(filename, 'a') as f:
-            nucgrp, nucdsname = os.path.split(nucpath)
-            f.create_array(nucgrp, nucdsname, np.array(sorted(nucids)),
-                          createparents=True)
-        for key, mat in _lib.items():
-            if "name" not in mat.metadata:
-                mat.metadata["name"] = key
-            mat.write_hdf5(filename, datapath=datapath, nucpath=nucpath)
+            if nucpath in f:
+                nucs = np.asarray(f.get_node(nucpath)[:], dtype='i4')
+            else:
+                nucs = np.array(sorted(nucids), dtype='i4')
+                nucgrp, nucdsname = os.path.split(nucpath)
+                f.create_array(nucgrp, nucdsname, nucs, createparents=True)
+            dtype = np.dtype([('mass', 'f8'), ('density', 'f8'),
+                              ('atoms_per_molecule', 'f8'),
+                              ('comp', 'f8', (len(nucs),))])
+            data = np.zeros(len(mats), dtype=dtype)
+            _fill_comps(data['comp'], nucs, mats)
+            metadata = []
+            for i, mat in enumerate(mats):
+                if "name" not in mat.metadata:
+                    mat.metadata["name"] = keys[i]
+                data['mass'][i] = mat.mass
+                data['density'][i] = mat.density
+                data['atoms_per_molecule'][i] = mat.atoms_per_molecule
+                s = writer.write(mat.mat_pointer.metadata)
+                metadata.append(np.frombuffer(bytes(s), dtype=np.int8))
+            if datapath in f:
+                table = f.get_node(datapath)
+                metatable = f.get_node(datapath + '_metadata')
+            else:
+                grp, name = os.path.split(datapath)
+                table = f.create_table(grp, name, dtype, filters=filters,
+                                       chunkshape=(chunksize,),
+                                       createparents=True)
+                table.attrs.nucpath = np.bytes_(nucpath.encode())
+                metatable = f.create_vlarray(grp, name + '_metadata',
+                                             tb.Int8Atom(), filters=filters,
+                                             chunkshape=(chunksize,))
+            if len(data) > 0:
+                table.append(data)
+            for row in metadata:
+                metatable.append(row)
+
+
+def _fill_comps(comps, nucs, mats):
+    """Fills each row of comps with the mass fractions of a material, in the
+    columns given by the nuclide array nucs.  Nuclides which are not in nucs
+    are dropped.
+    """
+    if len(nucs) == 0:
+        return
+    sorter = np.argsort(nucs)
+    for i, mat in enumerate(mats):
+        comp = mat.comp
+        if len(comp) == 0:
+            continue
+        matnucs = np.fromiter(comp.keys(), dtype='i4', count=len(comp))
+        fracs = np.fromiter(comp.values(), dtype='f8', count=len(comp))
+        pos = np.searchsorted(nucs, matnucs, sorter=sorter)
+        idx = sorter[pos.clip(0, len(nucs) - 1)]
+        known = (nucs[idx] == matnucs)
+        comps[i, idx[known]] = fracs[known]
+
+
+def _metadata_json(_Material mat):
+    """Returns the metadata of a material as a JSON string."""
+    cdef cpp_jsoncpp.FastWriter writer = cpp_jsoncpp.FastWriter()
+    cdef std_string s = writer.write(mat.mat_pointer.metadata)
+    return bytes(s).decode()
+
+
+class _LazyRow(object):
+    """A material in a row of an HDF5 material table which has not been read
+    yet."""
+
+    def __init__(self, filename, datapath, row):
+        self.filename = filename
+        self.datapath = datapath
+        self.row = row
+
+    def load(self):
+        mat = Material()
+        mat.from_hdf5(self.filename, self.datapath, self.row)
+        return mat
 
 class MaterialLibrary(_MaterialLibrary, collections.MutableMapping):
     """The material library is a collection of unique keys mapped to
@@ -2366,4 +2586,225 @@ class MaterialLibrary(_MaterialLibrary, collections.MutableMapping):
         libs = "{" + ", ".join(libs) + "}"
         return "pyne.material.MaterialLibrary({0})".format(libs)
 
+
+
+class MaterialMatrix(object):
+    """A dense collection of materials which share one sorted array of
+    nuclides.  The mass fractions of all materials are held in a contiguous
+    (n_mats, n_nucs) array, next to vectors of their masses, densities, and
+    atoms per molecule, so that operations over the whole set are vectorized
+    rather than iterating over the composition map of each material.
+
+    Parameters
+    ----------
+    nucs : array-like of ints
+        Nuclide ids of the columns, in increasing order.
+    comp : 2D array-like of floats
+        Mass fractions, one row per material.
+    mass : array-like of floats, optional
+        Masses of the materials, -1.0 if unknown.
+    density : array-like of floats, optional
+        Mass densities [g/cc] of the materials, -1.0 if unknown.
+    atoms_per_molecule : array-like of floats, optional
+        Atoms per molecule of the materials, -1.0 if unknown.
+    metadata : list of dicts, optional
+        Metadata of the materials.
+    names : list, optional
+        Keys of the materials when converted to a MaterialLibrary.
+
+    """
+
+    def __init__(self, nucs, comp, mass=None, density=None,
+                 atoms_per_molecule=None, metadata=None, names=None):
+        self.nucs = np.asarray(nucs, dtype='i4')
+        self.comp = np.ascontiguousarray(np.atleast_2d(comp), dtype='f8')
+        n = len(self.comp)
+        def vector(x):
+            return np.full(n, -1.0) if x is None else \
+                   np.array(np.broadcast_to(x, (n,)), dtype='f8')
+        self.mass = vector(mass)
+        self.density = vector(density)
+        self.atoms_per_molecule = vector(atoms_per_molecule)
+        self.metadata = [{} for i in range(n)] if metadata is None \
+                        else list(metadata)
+        self.names = list(range(n)) if names is None else list(names)
+
+    @classmethod
+    def from_materials(cls, mats, names=None):
+        """Creates a material matrix from a sequence of materials."""
+        mats = [ensure_material(mat) for mat in mats]
+        nucids = set()
+        for mat in mats:
+            nucids.update(nuc for nuc, frac in mat.comp.items() if frac != 0.0)
+        nucs = np.array(sorted(nucids), dtype='i4')
+        comp = np.zeros((len(mats), len(nucs)), dtype='f8')
+        _fill_comps(comp, nucs, mats)
+        return cls(nucs, comp,
+                   mass=[mat.mass for mat in mats],
+                   density=[mat.density for mat in mats],
+                   atoms_per_molecule=[mat.atoms_per_molecule for mat in mats],
+                   metadata=[json.loads(_metadata_json(mat)) for mat in mats],
+                   names=names)
+
+    @classmethod
+    def from_library(cls, lib):
+        """Creates a material matrix from a MaterialLibrary, or any other
+        mapping of keys to materials."""
+        names = list(lib.keys())
+        return cls.from_materials([lib[name] for name in names], names=names)
+
+    def __len__(self):
+        return len(self.comp)
+
+    def __getitem__(self, i):
+        """Returns the ith material."""
+        row = self.comp[i]
+        nz = np.flatnonzero(row)
+        comp = dict(zip(self.nucs[nz].tolist(), row[nz].tolist()))
+        return Material(comp, mass=self.mass[i], density=self.density[i],
+                        atoms_per_molecule=self.atoms_per_molecule[i],
+                        metadata=self.metadata[i])
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def to_materials(self):
+        """Returns a list of the materials."""
+        return list(self)
+
+    def to_library(self):
+        """Returns a MaterialLibrary of the materials keyed by name."""
+        return MaterialLibrary(list(zip(self.names, self)))
+
+    def index(self, nuc):
+        """Returns the column of a nuclide."""
+        nuc = nucname.id(nuc)
+        i = np.searchsorted(self.nucs, nuc)
+        if i == len(self.nucs) or self.nucs[i] != nuc:
+            raise KeyError(nuc)
+        return i
+
+    def norm_comp(self):
+        """Normalizes the mass fractions of each material to sum to one."""
+        tot = self.comp.sum(axis=1)
+        tot[tot == 0.0] = 1.0
+        self.comp /= tot[:, np.newaxis]
+
+    def normalize(self):
+        """Sets the mass of every material to 1.0."""
+        self.mass[:] = 1.0
+
+    def mult_by_mass(self):
+        """Returns the mass of each nuclide in each material."""
+        return self.comp * self.mass[:, np.newaxis]
+
+    def dot(self, values):
+        """Sums a per-nuclide quantity over the mass fractions of each
+        material.
+
+        Parameters
+        ----------
+        values : array-like or mapping
+            Per-nuclide values, either aligned with nucs, or a mapping of
+            nuclides to values, where missing nuclides count as zero.  A 2D
+            array aligned with nucs along its first axis is also accepted.
+
+        Returns
+        -------
+        result : ndarray
+            comp dotted with values, one entry (or row) per material.
+
+        """
+        if hasattr(values, 'items'):
+            vals = np.zeros(len(self.nucs), dtype='f8')
+            for nuc, val in values.items():
+                nuc = nucname.id(nuc)
+                i = np.searchsorted(self.nucs, nuc)
+                if i < len(self.nucs) and self.nucs[i] == nuc:
+                    vals[i] = val
+            values = vals
+        return np.dot(self.comp, values)
+
+    def molecular_mass(self, atoms_per_molecule=-1.0):
+        """Returns the molecular mass [amu] of each material, as with
+        Material.molecular_mass()."""
+        inverse_A = self.dot(1.0 / data.atomic_mass(self.nucs))
+        if 0.0 <= atoms_per_molecule:
+            apm = np.full(len(self), atoms_per_molecule)
+            unset = self.atoms_per_molecule < 0.0
+            self.atoms_per_molecule[unset] = atoms_per_molecule
+        else:
+            apm = np.where(0.0 <= self.atoms_per_molecule,
+                           self.atoms_per_molecule, 1.0)
+        with np.errstate(divide='ignore'):
+            mw = apm / inverse_A
+        mw[inverse_A == 0.0] = 0.0
+        return mw
+
+    def to_atom_frac(self):
+        """Returns the (n_mats, n_nucs) array of atom fractions."""
+        mw = self.molecular_mass()
+        return self.comp * mw[:, np.newaxis] / data.atomic_mass(self.nucs)
+
+    def to_atom_dens(self):
+        """Returns the (n_mats, n_nucs) array of atom densities [1/cc]."""
+        return self.comp * (self.density * data.N_A)[:, np.newaxis] / \
+               data.atomic_mass(self.nucs)
+
+    def mass_density(self, num_dens=None, atoms_per_molecule=-1.0):
+        """Computes and sets the mass density of each material from its
+        number density num_dens [1/cc], if given, and returns the densities
+        [g/cc], as with Material.mass_density()."""
+        if num_dens is not None:
+            mw = self.molecular_mass(atoms_per_molecule)
+            self.density = np.asarray(num_dens, dtype='f8') * mw / data.N_A / \
+                           self.atoms_per_molecule
+        return self.density
+
+    def number_density(self, mass_dens=None, atoms_per_molecule=-1.0):
+        """Returns the number density [1/cc] of each material, first setting
+        the mass densities to mass_dens [g/cc] if given, as with
+        Material.number_density()."""
+        if mass_dens is not None:
+            self.density = np.array(np.broadcast_to(mass_dens, (len(self),)),
+                                    dtype='f8')
+        mw = self.molecular_mass(atoms_per_molecule)
+        return self.density * data.N_A * self.atoms_per_molecule / mw
+
+    def activity(self):
+        """Returns the (n_mats, n_nucs) array of activities [Bq]."""
+        return self.mult_by_mass() * data.N_A * \
+               data.decay_const(self.nucs) / data.atomic_mass(self.nucs)
+
+    def decay_heat(self):
+        """Returns the (n_mats, n_nucs) array of decay heats [MW]."""
+        return self.mult_by_mass() * data.N_A * data.decay_const(self.nucs) * \
+               data.q_val(self.nucs) / data.atomic_mass(self.nucs) / \
+               data.MeV_per_MJ
+
+    def collapse_elements(self, nucset=set()):
+        """Collapses the nuclides of every material into their elements,
+        except those whose znum and anum match a nuclide in nucset, as with
+        Material.collapse_elements().
+
+        Returns
+        -------
+        collapsed : MaterialMatrix
+            A new material matrix of the collapsed materials.
+
+        """
+        znums = nucname.znum_array(self.nucs)
+        stripped = znums * 10000000 + nucname.anum_array(self.nucs) * 10000
+        nucset = sorted(nucname.id(nuc) for nuc in nucset)
+        keep = np.isin(stripped, np.array(nucset, dtype='i4'))
+        targets = np.where(keep, self.nucs, znums * 10000000)
+        nucs, cols = np.unique(targets, return_inverse=True)
+        collapse = np.zeros((len(self.nucs), len(nucs)), dtype='f8')
+        collapse[np.arange(len(self.nucs)), cols] = 1.0
+        return MaterialMatrix(nucs, np.dot(self.comp, collapse),
+                              mass=self.mass, density=self.density,
+                              atoms_per_molecule=self.atoms_per_molecule,
+                              metadata=self.metadata, names=self.names)
+
 ensure_material = lambda m: m if isinstance(m, Material) else Material(m)
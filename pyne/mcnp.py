@@ -18,6 +18,7 @@ import math
 import os
 import linecache
 import datetime
+import time
 from warnings import warn
 
 import numpy as np
@@ -28,6 +29,7 @@ from pyne.material import Material
 from pyne.material import MultiMaterial
 from pyne import nucname
 from pyne.binaryreader import _BinaryReader, _FortranRecord
+from pyne._utils import fromstring_token
 
 warn(__name__ + " is not yet QA compliant.", QAWarning)
 
@@ -1019,6 +1021,9 @@ class PtracEvent(tables.IsDescription):
     wgt = tables.Float32Col()
     tme = tables.Float32Col()
 
+# the NumPy equivalent of the PtracEvent table definition
+PTRAC_EVENT_DTYPE = tables.description.dtype_from_descr(PtracEvent)
+
 
 class PtracReader(object):
     """Class to read _binary_ PTRAC files generated by MCNP.
@@ -1246,17 +1251,7 @@ class PtracReader(object):
         # save for current event, because this record
         # contains only the next event's type
         event_type = self.next_event
-
-        if event_type == 1000:
-            e = "src"
-        elif event_type == 3000:
-            e = "sur"
-        elif event_type == 4000:
-            e = "col"
-        elif event_type == 5000:
-            e = "ter"
-        else:
-            e = "bnk"
+        e = self._event_key(event_type)
 
         evt_line = self.read_next('f', self.variable_nums[e])
 
@@ -1269,30 +1264,135 @@ class PtracReader(object):
                     evt_line[i]
         ptrac_event["event_type"] = event_type
 
-    def write_to_hdf5_table(self, hdf5_table, print_progress=0):
-        """Writes the events contained in this Ptrac file to a given HDF5
-        table. The table must already exist and have rows that match the
-        PtracEvent definition.
-        If desired, the number of processed events can be printed to the
-        console each N events by passing the print_progress=N parameter.
+    def _event_key(self, event_type):
+        """Returns the record type key ("src", "bnk", "sur", "col" or "ter")
+        of an event type number.
         """
+        if event_type == 1000:
+            return "src"
+        elif event_type == 3000:
+            return "sur"
+        elif event_type == 4000:
+            return "col"
+        elif event_type == 5000:
+            return "ter"
+        else:
+            return "bnk"
 
-        ptrac_event = hdf5_table.row
-        counter = 0
+    def _decode_events(self, buf, offsets, event_types):
+        """Decodes the event records starting at the given byte offsets of
+        buf into a structured array with the PtracEvent fields. Records of
+        the same type share a layout, so each type is decoded in one go.
+        """
+        events = np.zeros(len(offsets), dtype=PTRAC_EVENT_DTYPE)
+        if len(offsets) == 0:
+            return events
+        events["event_type"] = event_types
+        offsets = np.asarray(offsets, dtype=np.int64)
+        keys = np.array([self._event_key(t) for t in event_types])
+        raw = np.frombuffer(buf, dtype=np.uint8)
+        width = 8 if self.eightbytes else 4
+        val_dtype = np.dtype(self.endianness + ("f8" if self.eightbytes
+                                                 else "f4"))
+        for e in set(keys.tolist()):
+            mask = (keys == e)
+            num_vars = self.variable_nums[e]
+            # gather the bytes of all records of this type into rows
+            rows = raw[offsets[mask][:, np.newaxis] +
+                       np.arange(num_vars * width)]
+            values = rows.view(val_dtype)
+            var_ids = self.variable_ids[e]
+            for i in range(1, len(var_ids)):
+                if var_ids[i] in self.variable_mappings:
+                    events[self.variable_mappings[var_ids[i]]][mask] = \
+                        values[:, i]
+        return events
+
+    def read_chunks(self, chunk_size=100000, buffer_size=2**24):
+        """Reads the remaining events of the Ptrac file in large blocks and
+        yields them as structured arrays with the PtracEvent fields, in file
+        order. Record boundaries and event types are found with a light scan
+        of the record markers; the records themselves are decoded many at a
+        time with NumPy.
 
+        Parameters
+        ----------
+        chunk_size : int, optional
+            The maximum number of events per yielded array.
+        buffer_size : int, optional
+            The number of bytes to read from the file at a time.
+
+        Yields
+        ------
+        events : structured array
+            Up to chunk_size events, with dtype PTRAC_EVENT_DTYPE.
+        """
+        marker = struct.Struct(self.endianness + "i")
+        if self.eightbytes:
+            nps_value = struct.Struct(self.endianness + "qq")
+            evt_value = struct.Struct(self.endianness + "d")
+        else:
+            nps_value = struct.Struct(self.endianness + "ii")
+            evt_value = struct.Struct(self.endianness + "f")
+
+        leftover = b""
         while True:
-            try:
-                self.read_nps_line()
-            except EOFError:
-                break  # no more entries
+            data = self.f.read(buffer_size)
+            buf = leftover + data
+            n = len(buf)
+            pos = 0
+            offsets = []
+            event_types = []
+            while pos + 4 <= n:
+                length = marker.unpack_from(buf, pos)[0]
+                end = pos + length + 8
+                if end > n:
+                    break
+                if self.next_event in (0, 9000):
+                    # NPS record, it only holds the type of the next event
+                    self.next_event = nps_value.unpack_from(buf, pos + 4)[1]
+                else:
+                    offsets.append(pos + 4)
+                    event_types.append(self.next_event)
+                    self.next_event = int(evt_value.unpack_from(buf,
+                                                                pos + 4)[0])
+                    if len(offsets) == chunk_size:
+                        yield self._decode_events(buf, offsets, event_types)
+                        offsets = []
+                        event_types = []
+                pos = end
+            if len(offsets) > 0:
+                yield self._decode_events(buf, offsets, event_types)
+            leftover = buf[pos:]
+            if not data:
+                break
+        if len(leftover) > 0:
+            raise ValueError("The ptrac file ends with a truncated record "
+                             "of {0} bytes.".format(len(leftover)))
 
-            while self.next_event != 9000:
-                self.read_event_line(ptrac_event)
-                ptrac_event.append()
+    def write_to_hdf5_table(self, hdf5_table, print_progress=0,
+                            chunk_size=100000):
+        """Writes the events contained in this Ptrac file to a given HDF5
+        table. The table must already exist and have rows that match the
+        PtracEvent definition. Events are read and appended chunk_size at a
+        time.
+        If desired, the number of processed events and the processing rate
+        can be printed to the console each N events by passing the
+        print_progress=N parameter.
+        """
 
-                counter += 1
-                if print_progress > 0 and counter % print_progress == 0:
-                    print("processing event {0}".format(counter))
+        counter = 0
+        next_report = print_progress
+        start = time.time()
+
+        for events in self.read_chunks(chunk_size=chunk_size):
+            hdf5_table.append(events)
+            counter += len(events)
+            if print_progress > 0 and counter >= next_report:
+                rate = counter / max(time.time() - start, 1e-9)
+                print("processing event {0} ({1:.0f} events/s)".format(
+                      counter, rate))
+                next_report = (counter // print_progress + 1) * print_progress
 
 def _is_cell_line(line):
     is_cell = False
@@ -1936,10 +2036,13 @@ class Meshtal(object):
         tag name, and the total relative error tag name. If tags is None
         the tags are named 'x_result', 'x_rel_error', 'x_result_total',
         'x_rel_error_total' where x is n or p for neutrons or photons.
+    tally_numbers : set of ints or None
+        The tally numbers that were read, or None if all tallies were read.
 
     """
 
-    def __init__(self, filename, tags=None, meshes_have_mats=False):
+    def __init__(self, filename, tags=None, meshes_have_mats=False,
+                 tally_numbers=None):
         """Parameters
         ----------
         filename : str
@@ -1953,6 +2056,10 @@ class Meshtal(object):
         meshes_have_mats : bool
              If false, Meshtally objects will be created without PyNE material
              material objects.
+        tally_numbers : iterable of ints, optional
+            Only the mesh tallies with these numbers are parsed and stored in
+            the tally attribute, the tables of all others are skipped. By
+            default all mesh tallies are read.
         """
 
         if not HAVE_PYTAPS:
@@ -1961,6 +2068,8 @@ class Meshtal(object):
 
         self.tally = {}
         self.tags = tags
+        self.tally_numbers = None if tally_numbers is None \
+                             else set(tally_numbers)
         self._meshes_have_mats = meshes_have_mats
 
         with open(filename, 'r') as f:
@@ -1993,7 +2102,10 @@ class Meshtal(object):
         while line != "":
             if line.split()[0:3] == ['Mesh', 'Tally', 'Number']:
                 tally_num = int(line.split()[3])
-                if self.tags is not None and tally_num in self.tags.keys():
+                if self.tally_numbers is not None and \
+                   tally_num not in self.tally_numbers:
+                    _skip_meshtally(f)
+                elif self.tags is not None and tally_num in self.tags.keys():
                     self.tally[tally_num] = MeshTally(f, tally_num,
                                                       self.tags[tally_num],
                                           mesh_has_mats=self._meshes_have_mats)
@@ -2004,6 +2116,26 @@ class Meshtal(object):
             line = f.readline()
 
 
+def _skip_meshtally(f):
+    """Advances a filestream, open to the second line of a mesh tally header,
+    past the results table of the mesh tally without parsing it. The number
+    of rows in the table is found from the bin boundaries in the header, as
+    in MeshTally.
+    """
+    line = f.readline()
+    while line.strip() != 'Tally bin boundaries:':
+        line = f.readline()
+    # the x, y and z bounds follow two words, the energy bounds three
+    num_vol_elements = 1
+    for i in range(3):
+        num_vol_elements *= len(f.readline().split()) - 3
+    num_e_groups = len(f.readline().split()) - 4
+    num_blocks = num_e_groups + 1 if num_e_groups > 1 else num_e_groups
+    # skip the blank line and the table headings, then the table
+    for i in range(2 + num_blocks * num_vol_elements):
+        f.readline()
+
+
 class MeshTally(StatMesh):
     """This class stores all information from all single MCNP mesh tally that
     exists within some meshtal file. Header information is stored as attributes
@@ -2138,20 +2270,13 @@ class MeshTally(StatMesh):
             * (len(self.z_bounds)-1)
         num_e_groups = len(self.e_bounds)-1
 
-        # get result and relative error data from file
-        result = np.empty(shape=(num_e_groups, num_vol_elements))
-        rel_error = np.empty(shape=(num_e_groups, num_vol_elements))
-        for i in range(0, num_e_groups):
-            result_row = []
-            rel_error_row = []
-            for j in range(0, num_vol_elements):
-                line = f.readline().split()
-                result_row.append(float(line[self._column_idx["Result"]]))
-                rel_error_row.append(
-                    float(line[self._column_idx["Rel_Error"]]))
-
-            result[i] = result_row
-            rel_error[i] = rel_error_row
+        # get result and relative error data from file, the table holds one
+        # block of rows per energy group followed by a block of totals if
+        # there is more than one energy group
+        num_blocks = num_e_groups + 1 if num_e_groups > 1 else num_e_groups
+        result, rel_error = self._read_table(f, num_blocks * num_vol_elements)
+        result = result.reshape(num_blocks, num_vol_elements)
+        rel_error = rel_error.reshape(num_blocks, num_vol_elements)
 
         # Tag results and error vector to mesh
         res_tag = IMeshTag(num_e_groups, float, mesh=self,
@@ -2162,25 +2287,37 @@ class MeshTally(StatMesh):
             res_tag[:] = result[0]
             rel_err_tag[:] = rel_error[0]
         else:
-            res_tag[:] = result.transpose()
-            rel_err_tag[:] = rel_error.transpose()
+            res_tag[:] = result[:num_e_groups].transpose()
+            rel_err_tag[:] = rel_error[:num_e_groups].transpose()
 
         # If "total" data exists (i.e. if there is more than
-        # 1 energy group) get it and tag it onto the mesh.
+        # 1 energy group) tag it onto the mesh.
         if num_e_groups > 1:
-            result = []
-            rel_error = []
-            for i in range(0, num_vol_elements):
-                line = f.readline().split()
-                result.append(float(line[self._column_idx["Result"]]))
-                rel_error.append(
-                    float(line[self._column_idx["Rel_Error"]]))
-
             res_tot_tag = IMeshTag(1, float, mesh=self, name=self.tag_names[2])
             rel_err_tot_tag = IMeshTag(1, float, mesh=self,
                                        name=self.tag_names[3])
-            res_tot_tag[:] = result
-            rel_err_tot_tag[:] = rel_error
+            res_tot_tag[:] = result[num_e_groups]
+            rel_err_tot_tag[:] = rel_error[num_e_groups]
+
+    def _read_table(self, f, num_rows):
+        """Reads num_rows rows of the results table in a single pass and
+        returns the result and relative error columns as arrays. Non-numeric
+        entries (e.g. "Total" in the energy column) are read as zero, which is
+        harmless since only the result and relative error columns are kept.
+        """
+        num_cols = len(self._column_idx)
+        block = "".join([f.readline() for i in range(num_rows)])
+        # let the buffer hold every token so that tables with too many
+        # entries are reported below rather than overflowing it
+        data = fromstring_token(block, sep=" \t\r\n", inplace=True)
+        if len(data) != num_rows * num_cols:
+            raise ValueError("Expected {0} values in the table of mesh tally "
+                             "{1}, found {2}.".format(num_rows * num_cols,
+                                                      self.tally_number,
+                                                      len(data)))
+        data = data.reshape(num_rows, num_cols)
+        return (data[:, self._column_idx["Result"]],
+                data[:, self._column_idx["Rel_Error"]])
 
 
 def mesh_to_geom(mesh, frac_type='mass', title_card="Generated from PyNE Mesh"):
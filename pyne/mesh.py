@@ -1,8 +1,10 @@
 from __future__ import print_function, division
+import os
 import sys
 import copy
+import tempfile
 import itertools
-from collections import Iterable, Sequence
+from collections import Iterable, Sequence, OrderedDict
 from warnings import warn
 from pyne.utils import QAWarning
 
@@ -17,7 +19,7 @@ except ImportError:
     warn("the PyTAPS optional dependency could not be imported. "
          "Some aspects of the mesh module may be incomplete.", QAWarning)
 
-from pyne.material import Material, MaterialLibrary, MultiMaterial
+from pyne.material import Material, MaterialLibrary, MultiMaterial, mix_many
 
 if sys.version_info[0] > 2:
     basestring = str
@@ -481,6 +483,161 @@ class IMeshTag(Tag):
             tag[list(self.mesh.iter_ve())] = data
 
 
+class ColumnarTag(Tag):
+    """A mesh tag whose data lives in a single contiguous NumPy array indexed
+    by the volume element index (idx). Reads and writes operate directly on
+    this array, so whole-mesh, slice, boolean mask, and fancy index access all
+    happen at array speed rather than by iterating over volume elements. This
+    makes the following expressions equivalent for a given tag name::
+
+        mesh.name[i] == mesh.name.data[i]
+
+    The array is copied into a tag of the same name on the iMesh.Mesh instance
+    only when sync() is called, either directly or through Mesh.sync_tags()
+    and Mesh.write_hdf5(). If the iMesh.Mesh instance already carries a tag
+    with this name, its values are loaded into the array upon creation.
+    """
+
+    def __init__(self, size=1, dtype='f8', default=0.0, mesh=None, name=None,
+                 doc=None):
+        """Parameters
+        ----------
+        size : int, optional
+            The number of elements of type dtype that this tag stores.
+        dtype : np.dtype or similar, optional
+            The data type of this tag from int, float, and byte.
+        default : dtype or None, optional
+            The default value to fill this tag with upon creation. If None,
+            then the array is left uninitialized.
+        mesh : Mesh, optional
+            The PyNE mesh to tag.
+        name : str, optional
+            The name of the tag.
+        doc : str, optional
+            Documentation string for the tag.
+
+        """
+        super(ColumnarTag, self).__init__(mesh=mesh, name=name, doc=doc)
+        if mesh is None or name is None:
+            self._lazy_args['size'] = size
+            self._lazy_args['dtype'] = dtype
+            self._lazy_args['default'] = default
+            return
+        self.size = size
+        self.dtype = np.dtype(dtype)
+        self.default = default
+        self._ves = None
+        shape = (len(mesh),) if size == 1 else (len(mesh), size)
+        self.data = np.empty(shape, dtype=self.dtype)
+        try:
+            self.load()
+        except iBase.TagNotFoundError:
+            if default is not None:
+                self.data[...] = default
+            self.dirty = True
+
+    @property
+    def ves(self):
+        """The volume elements of the mesh in idx order, computed once."""
+        if self._ves is None:
+            self._ves = list(self.mesh.iter_ve())
+        return self._ves
+
+    def __delete__(self, mesh):
+        try:
+            self.mesh.mesh.destroyTag(self.name, force=True)
+        except iBase.TagNotFoundError:
+            pass
+        del self.mesh.tags[self.name]
+
+    def __getitem__(self, key):
+        size = len(self.mesh)
+        if isinstance(key, _INTEGRAL_TYPES):
+            if key >= size:
+                raise IndexError("key index {0} greater than the size of the "
+                                 "mesh {1}".format(key, size))
+            return self.data[key]
+        elif isinstance(key, slice):
+            return self.data[key]
+        elif isinstance(key, np.ndarray) and key.dtype == np.bool:
+            if len(key) != size:
+                raise KeyError("boolean mask must match the length "
+                               "of the mesh.")
+            return self.data[key]
+        elif isinstance(key, Iterable):
+            return self.data[np.asarray(list(key), dtype=int)]
+        else:
+            raise TypeError("{0} is not an int, slice, mask, "
+                            "or fancy index.".format(key))
+
+    def __setitem__(self, key, value):
+        size = len(self.mesh)
+        value = np.asarray(value, dtype=self.dtype)
+        if isinstance(key, _INTEGRAL_TYPES):
+            if key >= size:
+                raise IndexError("key index {0} greater than the size of the "
+                                 "mesh {1}".format(key, size))
+        elif isinstance(key, slice):
+            pass
+        elif isinstance(key, np.ndarray) and key.dtype == np.bool:
+            if len(key) != size:
+                raise KeyError("boolean mask must match the length "
+                               "of the mesh.")
+        elif isinstance(key, Iterable):
+            key = np.asarray(list(key), dtype=int)
+        else:
+            raise TypeError("{0} is not an int, slice, mask, "
+                            "or fancy index.".format(key))
+        self.data[key] = value
+        self.dirty = True
+
+    def __delitem__(self, key):
+        msg = ("the columnar tag {0!r} may only be deleted as "
+               "a whole").format(self.name)
+        raise AttributeError(msg)
+
+    def load(self):
+        """Reads the array from the tag of the same name on the iMesh.Mesh
+        instance, discarding any unsynced changes.
+        """
+        mtag = self.mesh.mesh.getTagHandle(self.name)
+        self.data[...] = np.reshape(mtag[self.ves], self.data.shape)
+        self.dirty = False
+
+    def sync(self):
+        """Writes the array to the tag of the same name on the iMesh.Mesh
+        instance, creating it if necessary. This is a no-op if the array has
+        not changed since the last sync.
+        """
+        if not self.dirty:
+            return
+        m = self.mesh.mesh
+        try:
+            mtag = m.getTagHandle(self.name)
+        except iBase.TagNotFoundError:
+            mtag = m.createTag(self.name, self.size, self.dtype)
+        mtag[self.ves] = self.data
+        self.dirty = False
+
+    def expand(self):
+        """This function creates a group of scalar columnar tags from a vector
+        tag. For a vector tag named <tag_name> of length N, scalar tags in the
+        form:
+
+        <tag_name>_000, <tag_name>_001, <tag_name>_002... <tag_name>_N
+
+        are created and the data is tagged accordingly.
+        """
+        if self.size < 2:
+            raise TypeError("Cannot expand a tag that is already a scalar.")
+        for j in range(self.size):
+            name = "{0}_{1:03d}".format(self.name, j)
+            t = ColumnarTag(size=1, dtype=self.dtype, default=None,
+                            mesh=self.mesh, name=name)
+            t[:] = self.data[:, j]
+            setattr(self.mesh, name, t)
+
+
 class ComputedTag(Tag):
     '''A mesh tag which looks itself up by calling a function (or other callable)
     with the following signature::
@@ -559,6 +716,222 @@ class ComputedTag(Tag):
         raise AttributeError(msg)
 
 
+_TAGTYPES = {'imesh': IMeshTag, 'columnar': ColumnarTag,
+             'metadata': MetadataTag, 'computed': ComputedTag}
+
+
+class CellFracs(object):
+    """An index over the output of dagmc.discretize_geom() that gives the
+    rows belonging to each volume element in constant time. The index is
+    built once from run-length offsets on the 'idx' field, so that::
+
+        cf = CellFracs(cell_fracs)
+        cf[i] == cell_fracs[cell_fracs['idx'] == i]
+
+    without rescanning the whole array for every volume element.
+
+    Attributes
+    ----------
+    cell_fracs : structured array
+        The cell_fracs array, sorted by volume element index.
+    offsets : np.ndarray of ints
+        The rows of volume element i are cell_fracs[offsets[i]:offsets[i+1]].
+    """
+
+    def __init__(self, cell_fracs, num_ve=None):
+        """Parameters
+        ----------
+        cell_fracs : structured array
+            The output from dagmc.discretize_geom(), see
+            Mesh.cell_fracs_to_mats() for the required fields. Rows are
+            stably sorted by 'idx' if they are not already.
+        num_ve : int, optional
+            The number of volume elements to index, defaults to one more than
+            the largest 'idx' present.
+
+        """
+        idx = cell_fracs['idx']
+        if len(idx) > 1 and np.any(idx[1:] < idx[:-1]):
+            cell_fracs = cell_fracs[np.argsort(idx, kind='mergesort')]
+            idx = cell_fracs['idx']
+        if num_ve is None:
+            num_ve = int(idx[-1]) + 1 if len(idx) > 0 else 0
+        self.cell_fracs = cell_fracs
+        self.offsets = np.searchsorted(idx, np.arange(num_ve + 1))
+
+    def __len__(self):
+        return len(self.offsets) - 1
+
+    def __getitem__(self, i):
+        return self.cell_fracs[self.offsets[i]:self.offsets[i + 1]]
+
+    def __iter__(self):
+        for i in range(len(self)):
+            yield self[i]
+
+    def counts(self):
+        """Returns the number of rows for each volume element."""
+        return np.diff(self.offsets)
+
+    def positions(self):
+        """Returns the position of each indexed row within its volume
+        element, i.e. 0 for the first cell of a volume element, 1 for the
+        second, and so on.
+        """
+        n = self.offsets[-1]
+        idx = self.cell_fracs['idx'][:n]
+        return np.arange(n) - self.offsets[idx]
+
+
+class MixtureCache(object):
+    """Memoizes the materials obtained by mixing cell materials by volume, so
+    that volume elements containing the same cells with the same volume
+    fractions share a single mixing computation. Mixtures are keyed on the
+    tuple of (cell, material, vol_frac) triples of a volume element, with the
+    volume fractions optionally rounded. Materials are identified by object
+    identity, so a cache may be reused with other cell_mats dicts, but cell
+    materials must not be modified in place while the cache is in use; call
+    clear() after doing so.
+
+    Attributes
+    ----------
+    sig_figs : int or None
+        The number of significant figures the volume fractions are rounded
+        to before being used as a key. If None, volume fractions must match
+        exactly.
+    share : bool
+        Whether volume elements with the same key are given the cached
+        mixture itself rather than copies of it.
+    hits : int
+        The number of mixtures served from the cache.
+    misses : int
+        The number of mixtures that had to be computed.
+    """
+
+    def __init__(self, sig_figs=None, share=False):
+        """Parameters
+        ----------
+        sig_figs : int or None, optional
+            The number of significant figures to round volume fractions to
+            when building keys. Rounding lets nearly identical mixtures share
+            a result at the cost of using the volume fractions of the first
+            volume element seen with a given key.
+        share : bool, optional
+            Return the cached mixtures themselves, so that volume elements
+            with the same key share one Material object, instead of copies.
+            Modifying the material of one such volume element then modifies
+            all of them, and the cache.
+
+        """
+        self.sig_figs = sig_figs
+        self.share = share
+        self.hits = 0
+        self.misses = 0
+        self._mixtures = {}
+        self._mats = {}  # keeps keyed materials alive so their ids stay unique
+
+    def __len__(self):
+        return len(self._mixtures)
+
+    def key(self, rows, cell_mats):
+        """Returns the cache key for the cell_fracs rows of a volume element
+        and the materials of its cells.
+        """
+        vol_fracs = rows['vol_frac']
+        if self.sig_figs is not None:
+            vol_fracs = _round_sig_figs(vol_fracs, self.sig_figs)
+        cells = rows['cell'].tolist()
+        mat_ids = [id(cell_mats[cell]) for cell in cells]
+        return tuple(zip(cells, mat_ids, vol_fracs.tolist()))
+
+    def mix(self, rows, cell_mats):
+        """Returns a new material that is the volume mixture of the cell
+        materials of a volume element.
+
+        Parameters
+        ----------
+        rows : structured array
+            The cell_fracs rows of a single volume element.
+        cell_mats : dict
+            Maps geometry cell numbers to Material objects.
+
+        """
+        return self.mix_many([rows], cell_mats)[0]
+
+    def mix_many(self, rows_list, cell_mats):
+        """Returns new materials that are the volume mixtures of the cell
+        materials of many volume elements. All of the mixtures missing from
+        the cache are computed together in one call to
+        pyne.material.mix_many().
+
+        Parameters
+        ----------
+        rows_list : sequence of structured arrays
+            The cell_fracs rows of each volume element.
+        cell_mats : dict
+            Maps geometry cell numbers to Material objects.
+
+        """
+        keys = [self.key(rows, cell_mats) for rows in rows_list]
+        missing = OrderedDict()
+        for key, rows in zip(keys, rows_list):
+            if key in self._mixtures or key in missing:
+                self.hits += 1
+                continue
+            self.misses += 1
+            mat_col = {}  # Collection of materials in the ve.
+            for row in rows:
+                mat_col[cell_mats[row['cell']]] = row['vol_frac']
+            missing[key] = MultiMaterial(mat_col)
+        if len(missing) > 0:
+            mats = []
+            mat_idx = {}
+            indices = []
+            fracs = []
+            for multi in missing.values():
+                idx = []
+                for mat, frac in multi._mats.items():
+                    if mat not in mat_idx:
+                        mat_idx[mat] = len(mats)
+                        mats.append(mat)
+                    idx.append(mat_idx[mat])
+                indices.append(idx)
+                fracs.append(list(multi._mats.values()))
+            mixed = mix_many(mats, indices, fracs, by_volume=True)
+            self._mixtures.update(zip(missing.keys(), mixed))
+            self._mats.update((id(mat), mat) for mat in mats)
+        mixtures = [self._mixtures[key] for key in keys]
+        if self.share:
+            return mixtures
+        # Material.__deepcopy__() copies the underlying C++ material without
+        # the memo bookkeeping of copy.deepcopy()
+        return [mat.__deepcopy__(None) for mat in mixtures]
+
+    def clear(self):
+        """Empties the cache and resets the hit and miss counters."""
+        self._mixtures.clear()
+        self._mats.clear()
+        self.hits = 0
+        self.misses = 0
+
+
+def _round_sig_figs(x, sig_figs):
+    """Rounds the entries of an array to a number of significant figures."""
+    x = np.asarray(x, dtype=float)
+    nonzero = x != 0.0
+    mag = np.zeros(x.shape)
+    mag[nonzero] = np.floor(np.log10(np.abs(x[nonzero])))
+    scale = 10.0**(sig_figs - 1 - mag)
+    return np.round(x * scale) / scale
+
+
+def _cell_fracs_index(cell_fracs, num_ve):
+    """Returns cell_fracs as a CellFracs index, building it if needed."""
+    if isinstance(cell_fracs, CellFracs):
+        return cell_fracs
+    return CellFracs(cell_fracs, num_ve)
+
+
 class MeshError(Exception):
     """Errors related to instantiating mesh objects and utilizing their methods.
     """
@@ -826,15 +1199,16 @@ class Mesh(object):
             The value to initialize the tag with, skipped if None.
         tagtype : Tag or str, optional
             The type of tag this should be any of the following classes or
-            strings are accepted: IMeshTag, MetadataTag, ComputedTag, 'imesh',
-            'metadata', or 'computed'.
+            strings are accepted: IMeshTag, ColumnarTag, MetadataTag,
+            ComputedTag, 'imesh', 'columnar', 'metadata', or 'computed'.
         doc : str, optional
             The tag documentation string.
         size : int, optional
-            The size of the tag. This only applies to IMeshTags.
+            The size of the tag. This only applies to IMeshTags and
+            ColumnarTags.
         dtype : numpy dtype, optional
-            The data type of the tag. This only applies to IMeshTags. See PyTAPS
-            for more details.
+            The data type of the tag. This only applies to IMeshTags and
+            ColumnarTags. See PyTAPS for more details.
 
         """
         if name in self.tags:
@@ -869,11 +1243,16 @@ class Mesh(object):
                                  'or dtype'.format(name))
             else:
                 tagtype = MetadataTag
-        if tagtype is IMeshTag or tagtype.lower() == 'imesh':
+        if isinstance(tagtype, basestring):
+            tagtype = _TAGTYPES.get(tagtype.lower(), tagtype)
+        if tagtype is IMeshTag:
             t = IMeshTag(size=size, dtype=dtype, mesh=self, name=name, doc=doc)
-        elif tagtype is MetadataTag or tagtype.lower() == 'metadata':
+        elif tagtype is ColumnarTag:
+            t = ColumnarTag(size=size or 1, dtype=dtype or 'f8', mesh=self,
+                            name=name, doc=doc)
+        elif tagtype is MetadataTag:
             t = MetadataTag(mesh=self, name=name, doc=doc)
-        elif tagtype is ComputedTag or tagtype.lower() == 'computed':
+        elif tagtype is ComputedTag:
             t = ComputedTag(f=value, mesh=self, name=name, doc=doc)
         else:
             raise ValueError('tagtype {0} not valid'.format(tagtype))
@@ -905,33 +1284,119 @@ class Mesh(object):
         tags = self.common_ve_tags(other)
         return self._do_op(other, tags, "/")
 
-    def _do_op(self, other, tags, op, in_place=True):
+    __itruediv__ = __idiv__
+
+    def __add__(self, other):
+        """Returns a copy of the mesh with the common tags of other added.
+        """
+        return self.arithmetic(other, "+", in_place=False)
+
+    def __sub__(self, other):
+        """Returns a copy of the mesh with the common tags of other
+        subtracted.
+        """
+        return self.arithmetic(other, "-", in_place=False)
+
+    def __mul__(self, other):
+        """Returns a copy of the mesh with the common tags multiplied by
+        those of other.
+        """
+        return self.arithmetic(other, "*", in_place=False)
+
+    def __div__(self, other):
+        """Returns a copy of the mesh with the common tags divided by those
+        of other.
+        """
+        return self.arithmetic(other, "/", in_place=False)
+
+    __truediv__ = __div__
+
+    def arithmetic(self, other, op, tags=None, in_place=True,
+                   chunk_size=None):
+        """Applies an arithmetic operation between the volume element tags
+        of this mesh and those of another mesh with the same volume elements.
+
+        Parameters
+        ----------
+        other : Mesh
+            The right hand operand.
+        op : str
+            One of '+', '-', '*', or '/'.
+        tags : iterable of str, optional
+            The tags to operate on, defaults to the tags in common between the
+            two meshes.
+        in_place : bool, optional
+            If False, the result is stored on a copy of this mesh and this
+            mesh is left untouched.
+        chunk_size : int, optional
+            The number of volume elements to read, operate on, and write at a
+            time. By default all volume elements are processed at once; set
+            this to bound the size of the tag value buffers for very large
+            meshes. The volume element handles of both meshes are still
+            listed in full, and in_place=False still copies the whole mesh.
+
+        Returns
+        -------
+        mesh : Mesh
+            The mesh holding the result.
+        """
+        if tags is None:
+            tags = self.common_ve_tags(other)
+        return self._do_op(other, tags, op, in_place=in_place,
+                           chunk_size=chunk_size)
+
+    def _do_op(self, other, tags, op, in_place=True, chunk_size=None):
         """Private function to do mesh +, -, *, /.
         """
         # Exclude error tags in a case a StatMesh is mistakenly initialized as
         # a Mesh object.
         tags = set(tag for tag in tags if not tag.endswith('_error'))
 
-        if in_place:
-            mesh_1 = self
-        else:
-            mesh_1 = copy.copy(self)
-
-        for tag in tags:
-            for ve_1, ve_2 in \
-                zip(zip(iter(mesh_1.mesh.iterate(iBase.Type.region,
-                    iMesh.Topology.all))),
-                    zip(iter(other.mesh.iterate(iBase.Type.region,
-                        iMesh.Topology.all)))):
-                self.mesh.getTagHandle(tag)[ve_1] = \
-                    _ops[op](mesh_1.mesh.getTagHandle(tag)[ve_1],
-                             other.mesh.getTagHandle(tag)[ve_2])
+        mesh_1, ves_1, ves_2 = self._op_setup(other, in_place)
+        for start, stop in _chunk_bounds(len(ves_1), chunk_size):
+            chunk_1 = ves_1[start:stop]
+            chunk_2 = ves_2[start:stop]
+            for tag in tags:
+                tag_1 = mesh_1.mesh.getTagHandle(tag)
+                tag_1[chunk_1] = _ops[op](tag_1[chunk_1],
+                                          other.mesh.getTagHandle(tag)[chunk_2])
 
+        mesh_1._op_teardown(tags)
         return mesh_1
 
+    def _op_setup(self, other, in_place):
+        """Returns the mesh that will hold the result of an arithmetic
+        operation along with the volume elements of it and of other, in
+        iteration order.
+        """
+        self.sync_tags()
+        other.sync_tags()
+        mesh_1 = self if in_place else copy.copy(self)
+        ves_1 = list(mesh_1.mesh.iterate(iBase.Type.region,
+                                         iMesh.Topology.all))
+        ves_2 = list(other.mesh.iterate(iBase.Type.region,
+                                        iMesh.Topology.all))
+        if len(ves_1) != len(ves_2):
+            raise MeshError("Meshes must have the same number of volume "
+                            "elements, found {0} and {1}".format(len(ves_1),
+                                                                len(ves_2)))
+        return mesh_1, ves_1, ves_2
+
+    def _op_teardown(self, tags):
+        """Reloads columnar tags whose iMesh data was changed by an
+        arithmetic operation.
+        """
+        for tag in self.tags.values():
+            if isinstance(tag, ColumnarTag) and tag.name in tags:
+                tag.load()
+
     def common_ve_tags(self, other):
         """Returns the volume element tags in common between self and other.
+        Columnar tags are synced first, so that those not yet written to the
+        iMesh.Mesh instances are found too.
         """
+        self.sync_tags()
+        other.sync_tags()
         self_tags = self.mesh.getAllTags(list(self.mesh.iterate(
                                          iBase.Type.region,
                                          iMesh.Topology.all))[0])
@@ -945,12 +1410,31 @@ class Mesh(object):
         return intersect
 
     def __copy__(self):
-        # first copy full imesh instance
-        imesh_copy = iMesh.Mesh()
-
-        # now create Mesh objected from copied iMesh instance
-        mesh_copy = Mesh(mesh=imesh_copy,
-                         structured=copy.copy(self.structured))
+        # first copy full imesh instance, PyTAPS has no direct way to do this
+        # so round trip it through a temporary file
+        self.sync_tags()
+        fd, filename = tempfile.mkstemp(suffix='.h5m')
+        os.close(fd)
+        try:
+            self.mesh.save(filename)
+            imesh_copy = iMesh.Mesh()
+            imesh_copy.load(filename)
+        finally:
+            os.remove(filename)
+
+        # now create Mesh objected from copied iMesh instance, along with
+        # copies of its materials
+        kwargs = {}
+        if self.structured:
+            kwargs['structured_ordering'] = self.structured_ordering
+        if self.mats is None:
+            mats = None
+        else:
+            mats = MaterialLibrary([(key, copy.deepcopy(mat))
+                                    for key, mat in self.mats.items()])
+        mesh_copy = type(self)(mesh=imesh_copy,
+                               structured=copy.copy(self.structured),
+                               mats=mats, **kwargs)
         return mesh_copy
 
     # Non-structured volume methods
@@ -1158,20 +1642,30 @@ class Mesh(object):
             raise MeshError("Structured mesh methods cannot be called from "\
                             "unstructured mesh instances.")
 
+    def sync_tags(self):
+        """Writes the arrays of all columnar tags on the mesh to the
+        iMesh.Mesh instance. Other tag types are stored on the iMesh.Mesh
+        instance or the materials directly and need no syncing.
+        """
+        for tag in self.tags.values():
+            if isinstance(tag, ColumnarTag):
+                tag.sync()
+
     def write_hdf5(self, filename):
         """Writes the mesh to an hdf5 file."""
+        self.sync_tags()
         self.mesh.save(filename)
         if self.mats is not None:
             self.mats.write_hdf5(filename)
 
-    def cell_fracs_to_mats(self, cell_fracs, cell_mats):
+    def cell_fracs_to_mats(self, cell_fracs, cell_mats, cache=None):
         """This function uses the output from dagmc.discretize_geom() and
         a mapping of geometry cells to Materials to assign materials
         to each mesh volume element.
 
         Parameters
         ----------
-        cell_fracs : structured array
+        cell_fracs : structured array or CellFracs
             The output from dagmc.discretize_geom(). A sorted, one dimensional
             array, each entry containing the following fields:
 
@@ -1189,15 +1683,27 @@ class Mesh(object):
         cell_mats : dict
             Maps geometry cell numbers to Material objects that represent what
             material each cell is made of.
+        cache : MixtureCache, optional
+            The cache of mixtures to look volume elements up in. Volume
+            elements with the same cells and volume fractions share one
+            mixing computation. A new cache with exact volume fraction
+            matching is used by default.
 
-        """
-        for i in range(len(self)):
-            mat_col = {}  # Collection of materials in the ith ve.
-            for row in cell_fracs[cell_fracs['idx'] == i]:
-                mat_col[cell_mats[row['cell']]] = row['vol_frac']
+        Returns
+        -------
+        cache : MixtureCache
+            The cache used, whose hits and misses attributes record how many
+            mixtures were reused and computed.
 
-            mixed = MultiMaterial(mat_col)
-            self.mats[i] = mixed.mix_by_volume()
+        """
+        if cache is None:
+            cache = MixtureCache()
+        cell_fracs = _cell_fracs_index(cell_fracs, len(self))
+        mixed = cache.mix_many([cell_fracs[i] for i in range(len(self))],
+                               cell_mats)
+        for i, mat in enumerate(mixed):
+            self.mats[i] = mat
+        return cache
 
     def tag_cell_fracs(self, cell_fracs):
         """This function uses the output from dagmc.discretize_geom() and
@@ -1205,7 +1711,7 @@ class Mesh(object):
 
         Parameters
         ----------
-        cell_fracs : structured array
+        cell_fracs : structured array or CellFracs
             The output from dagmc.discretize_geom(). A sorted, one dimensional
             array, each entry containing the following fields:
 
@@ -1224,15 +1730,11 @@ class Mesh(object):
         """
 
         num_vol_elements = len(self)
+        cell_fracs = _cell_fracs_index(cell_fracs, num_vol_elements)
         # Find the maximum cell number in a voxel
-        max_num_cells = -1
-        for i in range(num_vol_elements):
-            max_num_cells = max(max_num_cells,
-                                len(cell_fracs[cell_fracs['idx'] == i]))
+        max_num_cells = int(cell_fracs.counts().max())
 
         # create tag frame with default value
-        cell_largest_frac_number = [-1] * num_vol_elements
-        cell_largest_frac = [0.0] * num_vol_elements
         voxel_cell_number = np.empty(shape=(num_vol_elements, max_num_cells),
                                      dtype=int)
         voxel_cell_fracs = np.empty(shape=(num_vol_elements, max_num_cells),
@@ -1241,16 +1743,15 @@ class Mesh(object):
         voxel_cell_fracs.fill(0.0)
 
         # set the data
-        for i in range(num_vol_elements):
-            for (cell, row) in enumerate(cell_fracs[cell_fracs['idx'] == i]):
-                voxel_cell_number[i, cell] = row['cell']
-                voxel_cell_fracs[i, cell] = row['vol_frac']
-            # cell_largest_frac_tag
-            cell_largest_frac[i] = max(voxel_cell_fracs[i, :])
-            largest_index = \
-                    list(voxel_cell_fracs[i, :]).index(cell_largest_frac[i])
-            cell_largest_frac_number[i] = \
-                    int(voxel_cell_number[i, largest_index])
+        rows = cell_fracs.cell_fracs[:cell_fracs.offsets[-1]]
+        positions = cell_fracs.positions()
+        voxel_cell_number[rows['idx'], positions] = rows['cell']
+        voxel_cell_fracs[rows['idx'], positions] = rows['vol_frac']
+        # cell_largest_frac_tag, argmax picks the first of equal fractions
+        largest_index = np.argmax(voxel_cell_fracs, axis=1)
+        ve_index = np.arange(num_vol_elements)
+        cell_largest_frac = voxel_cell_fracs[ve_index, largest_index]
+        cell_largest_frac_number = voxel_cell_number[ve_index, largest_index]
 
         # create the tags
         self.tag(name='cell_number', value=voxel_cell_number,
@@ -1274,6 +1775,21 @@ class Mesh(object):
 # private helper functions for structured mesh methods
 ######################################################
 
+def _chunk_bounds(n, chunk_size=None):
+    """Yields (start, stop) pairs that split range(n) into consecutive
+    chunks of at most chunk_size elements. If chunk_size is None, a single
+    chunk covering everything is yielded.
+    """
+    if chunk_size is None or chunk_size >= n:
+        yield 0, n
+        return
+    if chunk_size < 1:
+        raise ValueError("chunk_size must be positive, "
+                         "got {0}".format(chunk_size))
+    for start in range(0, n, chunk_size):
+        yield start, min(start + chunk_size, n)
+
+
 def _structured_find_idx(dims, ijk):
     """Helper method fo structured_get_vertex and structured_get_hex.
 
@@ -1362,14 +1878,17 @@ def _structured_iter(indices, ordmap, dims, it):
 
 class StatMesh(Mesh):
     def __init__(self, mesh=None, structured=False,
-                 structured_coords=None, structured_set=None, mats=()):
+                 structured_coords=None, structured_set=None,
+                 structured_ordering='xyz', mats=()):
 
         super(StatMesh, self).__init__(mesh=mesh,
                                        structured=structured,
                                        structured_coords=structured_coords,
-                                       structured_set=structured_set, mats=mats)
+                                       structured_set=structured_set,
+                                       structured_ordering=structured_ordering,
+                                       mats=mats)
 
-    def _do_op(self, other, tags, op, in_place=True):
+    def _do_op(self, other, tags, op, in_place=True, chunk_size=None):
         """Private function to do mesh +, -, *, /. Called by operater
         overloading functions.
         """
@@ -1380,26 +1899,19 @@ class StatMesh(Mesh):
 
         tags = set(tag for tag in tags if not tag.endswith(error_suffix))
 
-        if in_place:
-            mesh_1 = self
-        else:
-            mesh_1 = copy.copy(self)
-
-        for tag in tags:
-            for ve_1, ve_2 in \
-                zip(zip(iter(mesh_1.mesh.iterate(iBase.Type.region,
-                                                 iMesh.Topology.all))),
-                    zip(iter(other.mesh.iterate(iBase.Type.region,
-                                                iMesh.Topology.all)))):
-
-                mesh_1.mesh.getTagHandle(tag + error_suffix)[ve_1] = err__ops[op](
-                    mesh_1.mesh.getTagHandle(tag)[ve_1],
-                    other.mesh.getTagHandle(tag)[ve_2],
-                    mesh_1.mesh.getTagHandle(tag + error_suffix)[ve_1],
-                    other.mesh.getTagHandle(tag + error_suffix)[ve_2])
-
-                mesh_1.mesh.getTagHandle(tag)[ve_1] = \
-                    _ops[op](mesh_1.mesh.getTagHandle(tag)[ve_1],
-                             other.mesh.getTagHandle(tag)[ve_2])
-
+        mesh_1, ves_1, ves_2 = self._op_setup(other, in_place)
+        for start, stop in _chunk_bounds(len(ves_1), chunk_size):
+            chunk_1 = ves_1[start:stop]
+            chunk_2 = ves_2[start:stop]
+            for tag in tags:
+                tag_1 = mesh_1.mesh.getTagHandle(tag)
+                err_1 = mesh_1.mesh.getTagHandle(tag + error_suffix)
+                val_1 = tag_1[chunk_1]
+                val_2 = other.mesh.getTagHandle(tag)[chunk_2]
+                err_1[chunk_1] = err__ops[op](
+                    val_1, val_2, err_1[chunk_1],
+                    other.mesh.getTagHandle(tag + error_suffix)[chunk_2])
+                tag_1[chunk_1] = _ops[op](val_1, val_2)
+
+        mesh_1._op_teardown(tags | set(tag + error_suffix for tag in tags))
         return mesh_1
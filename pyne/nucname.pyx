@@ -11,6 +11,7 @@ from libcpp.string cimport string as std_string
 
 # Python imports
 #from collections import Iterable
+import numpy as np
 
 # local imports
 cimport pyne.cpp_utils
@@ -85,6 +86,11 @@ fp = fp_proxy
 
 
 
+# Memo of string to id parses made by id(), cleared once it holds
+# ID_CACHE_SIZE entries.
+ID_CACHE_SIZE = 65536
+_id_cache = {}
+
 
 class NucTypeError(Exception):
     def __init__(self, nuc=None):
@@ -187,8 +193,13 @@ def id(nuc):
 
     """
     if isinstance(nuc, basestring):
-        nuc = nuc.encode()
-        newnuc = cpp_nucname.id(<char *> nuc)
+        newnuc = _id_cache.get(nuc)
+        if newnuc is None:
+            nuc_bytes = nuc.encode()
+            newnuc = cpp_nucname.id(<char *> nuc_bytes)
+            if len(_id_cache) >= ID_CACHE_SIZE:
+                _id_cache.clear()
+            _id_cache[nuc] = newnuc
     elif isinstance(nuc, int) or isinstance(nuc, long):
         newnuc = cpp_nucname.id(<int> nuc)
     else:
@@ -925,6 +936,66 @@ def ensdf_to_id(nuc):
         return cpp_nucname.ensdf_to_id(<char *> nuc_bytes)
     else:
         raise NucTypeError(nuc)
+#
+# Array Conversion Functions
+#
+
+def _map_unique(func, nucs, dtype=None):
+    """Applies a scalar conversion function to an array of nuclides by
+    converting each distinct nuclide once and broadcasting the results back
+    with NumPy.
+    """
+    nucs = np.asarray(nucs)
+    if nucs.dtype.kind == 'S':
+        nucs = nucs.astype('U')
+    if nucs.size == 0:
+        return np.empty(nucs.shape, dtype=dtype or nucs.dtype)
+    uniq, inv = np.unique(nucs.ravel(), return_inverse=True)
+    conv = np.array([func(nuc) for nuc in uniq.tolist()], dtype=dtype)
+    return conv[inv].reshape(nucs.shape)
+
+
+def _array_func(func, dtype):
+    def array_func(nucs):
+        return _map_unique(func, nucs, dtype)
+    array_func.__name__ = str(func.__name__ + '_array')
+    array_func.__doc__ = """Array version of {0}(). Converts an array-like of
+    nuclides (ints or strs) to a NumPy array of the same shape, converting
+    each distinct nuclide only once.
+
+    Parameters
+    ----------
+    nucs : array-like of ints or strs
+        Input nuclides.
+
+    Returns
+    -------
+    newnucs : ndarray
+        Output nuclides.
+
+    """.format(func.__name__)
+    return array_func
+
+
+id_array = _array_func(id, np.int32)
+name_array = _array_func(name, None)
+znum_array = _array_func(znum, np.int32)
+anum_array = _array_func(anum, np.int32)
+snum_array = _array_func(snum, np.int32)
+zzaaam_array = _array_func(zzaaam, np.int32)
+zzaaam_to_id_array = _array_func(zzaaam_to_id, np.int32)
+zzzaaa_array = _array_func(zzzaaa, np.int32)
+zzzaaa_to_id_array = _array_func(zzzaaa_to_id, np.int32)
+mcnp_array = _array_func(mcnp, np.int32)
+mcnp_to_id_array = _array_func(mcnp_to_id, np.int32)
+serpent_array = _array_func(serpent, None)
+serpent_to_id_array = _array_func(serpent_to_id, np.int32)
+alara_array = _array_func(alara, None)
+alara_to_id_array = _array_func(alara_to_id, np.int32)
+cinder_array = _array_func(cinder, np.int32)
+cinder_to_id_array = _array_func(cinder_to_id, np.int32)
+groundstate_array = _array_func(groundstate, np.int32)
+
 #
 # C++ Helper Functions
 #
@@ -23,7 +23,10 @@ def main():
     argparser.add_argument("-t", "--table-title", default="Ptrac data",
             help="title of the HDF5 table (default is \"Ptrac data\")")
     argparser.add_argument("-s", "--show-progress", action="store_true",
-            help="show progress indicator")
+            help="show progress indicator and processing rate")
+    argparser.add_argument("-c", "--chunk-size", type=int, default=100000,
+            help="number of events to read and write at a time "
+                 "(default is 100000)")
     args = argparser.parse_args()
 
     ptrac_filename = args.ptrac_file
@@ -42,7 +45,8 @@ def main():
     else:
         table = h5file.create_table("/", table_name, mcnp.PtracEvent, table_title)
 
-    ptrac.write_to_hdf5_table(table, print_progress=print_progress)
+    ptrac.write_to_hdf5_table(table, print_progress=print_progress,
+                              chunk_size=args.chunk_size)
 
     table.flush()
     h5file.close()
@@ -4,12 +4,15 @@
    Analysis," a Ph.D. Dissertation, University of Wisconsin, Madison, WI, 1999.
 """
 from __future__ import division
+import hashlib
+from collections import OrderedDict
 from warnings import warn
 from pyne.utils import QAWarning
 
 import numpy as np
 from scipy import linalg
-#from scipy import sparse  # <-- SPARSE
+from scipy import sparse
+from scipy.sparse.linalg import expm_multiply
 
 from pyne import utils
 from pyne import data
@@ -23,6 +26,15 @@ from pyne.xs.channels import sigma_a
 
 warn(__name__ + " is not yet QA compliant.", QAWarning)
 
+# Relative separation below which two destruction rates are considered equal
+# and the Bateman solution is abandoned for a matrix exponential.
+BATEMAN_RTOL = 1e-6
+
+# Maximum numbers of reaction/decay graphs (one per flux and temperature) and
+# of root nuclide results kept by a Transmuter using the 'bateman' method.
+GRAPH_CACHE_SIZE = 16
+PARTIAL_CACHE_SIZE = 4096
+
 class Transmuter(object):
     """A class for transmuting materials using an ALARA-like chain solver."""
 
@@ -46,6 +58,16 @@ class Transmuter(object):
         log : file-like or None
             The log file object should be written. A None imples the log is 
             not desired.
+        method : str, optional
+            Keyword only. How chains are solved. 'expm' computes the dense
+            matrix exponential of every chain. 'bateman' solves each linear
+            chain analytically with the Bateman equations (falling back to a
+            sparse matrix exponential when destruction rates nearly coincide)
+            and memoizes the reaction/decay graph and the result of each root
+            nuclide per flux, time, temperature and tolerance, keeping up to
+            GRAPH_CACHE_SIZE graphs and PARTIAL_CACHE_SIZE results. Assigning
+            rxs clears these caches; call clear_cache() after changing the
+            cross sections of xscache in any other way.
         args : tuple, optional
             Other arguments ignored for compatibility with other Transmuters.
         kwargs : dict, optional
@@ -56,6 +78,15 @@ class Transmuter(object):
         gs = np.array([eafds.src_group_struct[0], eafds.src_group_struct[-1]])
         eafds.dst_group_struct = gs
         self.xscache = XSCache(group_struct=gs, data_sources=(eafds, NullDataSource,))
+        method = kwargs.pop('method', 'expm')
+        if method not in ('expm', 'bateman'):
+            raise ValueError("method must be 'expm' or 'bateman', "
+                             "got {0!r}".format(method))
+        self.method = method
+        self._graphs = OrderedDict()
+        self._partials = OrderedDict()
+        self.cache_hits = 0
+        self.cache_misses = 0
 
         self.t = t
         self._phi = None
@@ -75,6 +106,18 @@ class Transmuter(object):
         rxs.discard(rxname.id('fission'))
         self.rxs = rxs
 
+    @property
+    def rxs(self):
+        return self._rxs
+
+    @rxs.setter
+    def rxs(self, rxs):
+        """Stores the reactions as a frozenset, since the memoized graphs
+        depend on them, and discards those graphs.
+        """
+        self._rxs = frozenset(rxs)
+        self.clear_cache()
+
     @property
     def phi(self):
         return self._phi
@@ -97,6 +140,18 @@ class Transmuter(object):
             ds.src_phi_g = flux
         self.xscache['phi_g'] = np.array([flux.sum()])
         self._phi = flux
+        self._phi_key = hashlib.sha1(np.ascontiguousarray(flux, float)
+                                     ).hexdigest()
+
+    def clear_cache(self):
+        """Discards the memoized reaction/decay graphs and partial results,
+        e.g. after changing the data sources of xscache, and resets the hit
+        and miss counters.
+        """
+        self._graphs.clear()
+        self._partials.clear()
+        self.cache_hits = 0
+        self.cache_misses = 0
 
     def transmute(self, x, t=None, phi=None, tol=None, log=None, *args, **kwargs):
         """Transmutes a material into its daughters.
@@ -138,7 +193,10 @@ class Transmuter(object):
         for nuc, adens in x_atoms.items():
             # Find output for root of unit density and scale all output by 
             # actual nuclide density and add to final output.
-            partial = self._transmute_partial(nuc)
+            if self.method == 'bateman':
+                partial = self._cached_partial(nuc)
+            else:
+                partial = self._transmute_partial(nuc)
             for part_nuc, part_adens in partial.items():
                 y_atoms[part_nuc] = part_adens * adens + y_atoms.get(part_nuc, 0.0)
         mw_x = x.molecular_mass()
@@ -166,15 +224,94 @@ class Transmuter(object):
             # what is the coupled?.
         """
         dest = self._get_destruction(nuc)
-        # DENSE
-        A = np.empty((1,1), float)
-        A[0, 0] = -dest
-        #A = sparse.csr_matrix([[-dest]])  # <-- SPARSE
         rootval = np.exp(-dest * self.t)
         partial = {nuc: rootval}
-        self._traversal(nuc, A, partial)
+        if self.method == 'bateman':
+            self._chain_traversal(nuc, [dest], [], partial)
+        else:
+            A = np.empty((1,1), float)
+            A[0, 0] = -dest
+            self._traversal(nuc, A, partial)
+        return partial
+
+    def _cached_partial(self, nuc):
+        """Returns the partial transmutation result of nuc, computing it with
+        _transmute_partial() only if it has not already been computed for the
+        current time, flux, temperature, and tolerance.
+        """
+        key = (nuc, self.t, self._phi_key, self.temp, self.tol)
+        partial = self._partials.pop(key, None)
+        if partial is None:
+            self.cache_misses += 1
+            partial = self._transmute_partial(nuc)
+        else:
+            self.cache_hits += 1
+        self._partials[key] = partial
+        while len(self._partials) > PARTIAL_CACHE_SIZE:
+            self._partials.popitem(last=False)
         return partial
 
+    def _graph(self):
+        """Returns the reaction/decay graph for the current flux and
+        temperature. This maps nuclides to (destruction rate, production
+        dict) pairs and is filled in lazily by _node().
+        """
+        key = (self._phi_key, self.temp)
+        graph = self._graphs.pop(key, None)
+        if graph is None:
+            graph = {}
+        self._graphs[key] = graph
+        while len(self._graphs) > GRAPH_CACHE_SIZE:
+            self._graphs.popitem(last=False)
+        return graph
+
+    def _node(self, nuc):
+        """Returns the destruction rate of nuc and a dictionary mapping each
+        of its children to the rate at which nuc produces it, reusing earlier
+        results for the current flux and temperature.
+        """
+        graph = self._graph()
+        node = graph.get(nuc)
+        if node is None:
+            node = graph[nuc] = (self._get_destruction(nuc),
+                                 self._production(nuc))
+        return node
+
+    def _production(self, nuc):
+        """Computes the production rates of the decay and reaction children
+        of a nuclide.
+
+        Parameters
+        ----------
+        nuc : int
+            Nuclide id of the parent.
+
+        Returns
+        -------
+        prod : dict
+            Maps child nuclide ids to production rates [1/sec].
+
+        """
+        phi = self.xscache['phi_g'][0]
+        temp = self.temp
+        xscache = self.xscache
+        prod = {}
+        # decay info
+        lam = data.decay_const(nuc)
+        decay_branches = {} if lam == 0 else self._decay_branches(nuc)
+        for decay_child, branch_ratio in decay_branches.items():
+            prod[decay_child] = lam * branch_ratio
+        # reaction daughters
+        for rx in self.rxs:
+            try:
+                child = rxname.child(nuc, rx)
+            except RuntimeError:
+                continue
+            child_xs = xscache[nuc, rx, temp][0]
+            rr = utils.from_barns(child_xs, 'cm2') * phi  # reaction rate
+            prod[child] = rr + prod.get(child, 0.0)
+        return prod
+
     def _get_destruction(self, nuc, decay=True):
         """Computes the destruction rate of the nuclide.
 
@@ -219,7 +356,6 @@ class Transmuter(object):
         """
         shape = A.shape
         n = shape[0]
-        # DENSE
         # Add row and column to current matrix
         B = np.empty((n+1, n+1), dtype=float)
         B[:n,:n] = A
@@ -228,9 +364,6 @@ class Transmuter(object):
         # Update new matrix with provided data
         B[n,n-1] = prod
         B[n,n] = -dest
-        # SPARSE
-        #B = sparse.bmat([[A, None], [None, [[-dest]]]]).tocsr()
-        #B[n,n-1] = prod        
         return B
 
     def _traversal(self, nuc, A, out, depth=0):
@@ -257,26 +390,9 @@ class Transmuter(object):
         """
         t = self.t
         tol = self.tol
-        phi = self.xscache['phi_g'][0]
-        temp = self.temp
-        xscache = self.xscache
         if self.log is not None:
             self._log_tree(depth, nuc, 1.0)
-        prod = {}
-        # decay info
-        lam = data.decay_const(nuc)
-        decay_branches = {} if lam == 0 else self._decay_branches(nuc)
-        for decay_child, branch_ratio in decay_branches.items():
-            prod[decay_child] = lam * branch_ratio
-        # reaction daughters
-        for rx in self.rxs:
-            try:
-                child = rxname.child(nuc, rx)
-            except RuntimeError:
-                continue
-            child_xs = xscache[nuc, rx, temp][0]
-            rr = utils.from_barns(child_xs, 'cm2') * phi  # reaction rate
-            prod[child] = rr + prod.get(child, 0.0)
+        prod = self._production(nuc)
         # Cycle production dictionary
         for child in prod:
             # Grow matrix
@@ -288,8 +404,7 @@ class Transmuter(object):
             N0[0] = 1.0
             # Compute matrix exponential and dot with density vector
             eB = linalg.expm(B * t)
-            N_final = np.dot(eB, N0)  # <-- DENSE
-            #N_final = eB.dot(N0)  # <-- SPARSE
+            N_final = np.dot(eB, N0)
             if self.log is not None:
                 self._log_tree(depth+1, child, N_final[-1])
             # Check against tolerance and continue traversal
@@ -300,6 +415,100 @@ class Transmuter(object):
             if 0.0 < outval:
                 out[child] = outval
 
+    def _chain_traversal(self, nuc, dests, prods, out, depth=0):
+        """Nuclide transmutation traversal method for linear chains.
+
+        This performs the same depth-first traversal as _traversal(), but
+        represents the current chain by its destruction and production rates
+        rather than by a matrix, and solves for the number density of each
+        new chain end with _chain_end_density().
+
+        Parameters
+        ----------
+        nuc : int
+            ID of the active nuclide for the traversal.
+        dests : list of floats
+            The destruction rates of the nuclides in the chain so far, from
+            the root to nuc.
+        prods : list of floats
+            The production rates linking consecutive nuclides of the chain,
+            one shorter than dests.
+        out : dict
+            A dictionary containing the final recorded number densities for
+            each nuclide, modified in place.
+        depth : int
+            Current depth of traversal (root at 0). Should never be provided
+            by user.
+
+        """
+        tol = self.tol
+        if self.log is not None:
+            self._log_tree(depth, nuc, 1.0)
+        _, prod = self._node(nuc)
+        for child in prod:
+            d, _ = self._node(child)
+            child_dests = dests + [d]
+            child_prods = prods + [prod[child]]
+            N_end = self._chain_end_density(child_dests, child_prods)
+            if self.log is not None:
+                self._log_tree(depth+1, child, N_end)
+            # Check against tolerance and continue traversal
+            if N_end > tol:
+                self._chain_traversal(child, child_dests, child_prods, out,
+                                      depth=depth+1)
+            # On recursion exit or truncation, write data from this nuclide
+            outval = N_end + out.get(child, 0.0)
+            if 0.0 < outval:
+                out[child] = outval
+
+    def _chain_end_density(self, dests, prods):
+        """Computes the number density of the last nuclide of a linear chain
+        after the transmutation time, for a unit density of the first nuclide.
+
+        The Bateman solution is used when all destruction rates are distinct.
+        Otherwise, or if cancellation makes it untrustworthy, the matrix
+        exponential of the sparse bidiagonal chain matrix is applied to the
+        initial density vector instead.
+
+        Parameters
+        ----------
+        dests : list of floats
+            The destruction rates of the nuclides in the chain.
+        prods : list of floats
+            The production rates of the nuclides in the chain from their
+            predecessors, one shorter than dests.
+
+        Returns
+        -------
+        N : float
+            Number density of the last nuclide in the chain.
+
+        """
+        t = self.t
+        d = np.asarray(dests, dtype=float)
+        n = len(d)
+        if n == 1:
+            return np.exp(-d[0] * t)
+        prod_rate = np.prod(prods)
+        if prod_rate == 0.0:
+            return 0.0
+        # diff[j, k] = d_k - d_j, with ones on the diagonal for the products
+        diff = d[np.newaxis, :] - d[:, np.newaxis]
+        np.fill_diagonal(diff, 1.0)
+        scale = np.abs(d).max()
+        if scale > 0.0 and np.all(np.abs(diff) > BATEMAN_RTOL * scale):
+            terms = np.exp(-d * t) / np.prod(diff, axis=1)
+            total = terms.sum()
+            N = prod_rate * total
+            if np.isfinite(N) and N >= 0.0 and \
+               abs(total) > BATEMAN_RTOL * np.abs(terms).max():
+                return N
+        B = sparse.diags([-d, np.asarray(prods, dtype=float)], [0, -1],
+                         format='csc')
+        N0 = np.zeros(n, dtype=float)
+        N0[0] = 1.0
+        return max(expm_multiply(B * t, N0)[-1], 0.0)
+
     def _log_tree(self, depth, nuc, numdens):
         """Logging method to track path of _traversal.
 
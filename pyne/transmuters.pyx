@@ -8,6 +8,7 @@ cimport pyne.stlcontainers as conv
 import pyne.stlcontainers as conv
 from pyne cimport nucname
 from pyne import nucname
+from pyne import cram as _cram
 
 # startup numpy
 cimport numpy as np
@@ -50,3 +51,63 @@ def cram(A, n0, int order=14):
     cdef conv._MapIntDouble n1 = conv.MapIntDouble()
     n1.map_ptr = new cpp_map[int, double](cpp_n1)
     return n1
+
+
+def cram_batch(A, n0, int order=14, mat_idx=None, int nthreads=1):
+    """Batched CRAM solver that transmutes many compositions with one call.
+    The compositions are solved in C++ without the GIL, split across
+    nthreads threads.
+
+    Parameters
+    ----------
+    A : 1D or 2D array-like
+        The flat transmutation matrix shared by all compositions, or a 2D
+        array whose rows are distinct flat transmutation matrices [unitless]
+    n0 : 2D array-like
+        The initial compositions, one per row, with columns ordered as
+        pyne.cram.NUCS [atom fraction]
+    order : int, optional
+        The order of approximation, default 14.
+    mat_idx : 1D array-like of ints, optional
+        The row of A used for each composition. This may be omitted when A
+        holds one matrix or one matrix per composition.
+    nthreads : int, optional
+        The number of threads to use, default 1.
+
+    Returns
+    -------
+    n1 : 2D ndarray
+        The results of the transmutations, the same shape as n0
+        [atom fraction]
+    """
+    A = np.ascontiguousarray(np.atleast_2d(A), dtype=np.float64)
+    n0 = np.ascontiguousarray(np.atleast_2d(n0), dtype=np.float64)
+    cdef int nmats = A.shape[0]
+    cdef int ncomps = n0.shape[0]
+    if A.ndim != 2 or A.shape[1] != _cram.NNZ:
+        raise ValueError("A must have {0} values per matrix, got shape "
+                         "{1}".format(_cram.NNZ, A.shape))
+    if n0.ndim != 2 or n0.shape[1] != _cram.N:
+        raise ValueError("n0 must have {0} columns, got shape "
+                         "{1}".format(_cram.N, n0.shape))
+    cdef int* idx_ptr = NULL
+    if mat_idx is None:
+        if nmats != 1 and nmats != ncomps:
+            raise ValueError("mat_idx is required when the number of matrices "
+                             "({0}) differs from the number of compositions "
+                             "({1})".format(nmats, ncomps))
+        if nmats == ncomps and nmats != 1:
+            mat_idx = np.arange(ncomps, dtype=np.intc)
+    if mat_idx is not None:
+        mat_idx = np.ascontiguousarray(mat_idx, dtype=np.intc)
+        if mat_idx.shape != (ncomps,):
+            raise ValueError("mat_idx must have one entry per composition")
+        idx_ptr = <int*> np.PyArray_DATA(mat_idx)
+    n1 = np.empty_like(n0)
+    cdef double* Aptr = <double*> np.PyArray_DATA(A)
+    cdef double* n0ptr = <double*> np.PyArray_DATA(n0)
+    cdef double* n1ptr = <double*> np.PyArray_DATA(n1)
+    with nogil:
+        cpp_transmuters.cram_batch(Aptr, nmats, idx_ptr, n0ptr, n1ptr, ncomps,
+                                   order, nthreads)
+    return n1
@@ -1,5 +1,7 @@
 from __future__ import division
 import os
+import json
+from warnings import warn
 
 from distutils.dir_util import remove_tree
 
@@ -190,3 +192,76 @@ def remove(path):
         remove_tree(path, verbose=False)
     else:
         pass
+
+
+#########################
+### data file indices ###
+#########################
+
+INDEX_VERSION = 1
+INDEX_SUFFIX = '.pyneidx'
+
+_replace = getattr(os, 'replace', os.rename)
+
+
+def save_index(filename, idx, index_file=None):
+    """Saves an index of a data file as JSON, along with the size and
+    modification time of the data file. The index is written under a
+    temporary name and renamed into place. Failing to write it only warns.
+
+    Parameters
+    ----------
+    filename : str
+        Path to the data file.
+    idx : dict
+        JSON-serializable contents of the index.
+    index_file : str, optional
+        Path to the index, filename + INDEX_SUFFIX by default.
+
+    """
+    if index_file is None:
+        index_file = filename + INDEX_SUFFIX
+    st = os.stat(filename)
+    idx = dict(idx, version=INDEX_VERSION, size=st.st_size,
+               mtime=st.st_mtime)
+    tmp = index_file + '.tmp'
+    try:
+        with open(tmp, 'w') as f:
+            json.dump(idx, f)
+        if _replace is os.rename and os.path.exists(index_file):
+            os.remove(index_file)
+        _replace(tmp, index_file)
+    except (IOError, OSError):
+        warn('Could not save the index of {0} to {1}'.format(
+             filename, index_file), UserWarning)
+
+
+def load_index(filename, index_file=None):
+    """Loads an index of a data file saved by save_index().
+
+    Parameters
+    ----------
+    filename : str
+        Path to the data file.
+    index_file : str, optional
+        Path to the index, filename + INDEX_SUFFIX by default.
+
+    Returns
+    -------
+    idx : dict or None
+        Contents of the index, or None if there is no index or the data file
+        has changed since it was saved.
+
+    """
+    if index_file is None:
+        index_file = filename + INDEX_SUFFIX
+    try:
+        with open(index_file, 'r') as f:
+            idx = json.load(f)
+    except (IOError, OSError, ValueError):
+        return None
+    st = os.stat(filename)
+    if idx.get('version') != INDEX_VERSION or \
+       idx['size'] != st.st_size or idx['mtime'] != st.st_mtime:
+        return None
+    return idx
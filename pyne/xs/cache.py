@@ -1,16 +1,19 @@
 """This module provides a cross section cache which automatically extracts 
 cross-sections from provided nuclear data sets."""
+import os
 import sys
+import hashlib
 import inspect
 from warnings import warn
 
 from itertools import product
-from collections import MutableMapping
+from collections import MutableMapping, OrderedDict
 
 import numpy as np
 import tables as tb
 
 from pyne import nucname
+from pyne import rxname
 from pyne.pyne_config import pyne_conf
 from pyne.xs.models import partial_energy_matrix, phi_g, same_arr_or_none
 from pyne.xs import data_source
@@ -21,6 +24,8 @@ warn(__name__ + " is not yet QA compliant.", QAWarning)
 if sys.version_info[0] > 2:
   basestring = str
 
+_replace = getattr(os, 'replace', os.rename)
+
 def _valid_group_struct(E_g):
     if E_g is None:
         return None
@@ -30,6 +35,17 @@ def _valid_group_struct(E_g):
     return E_g
 
 
+def _context_key(E_g, phi_g):
+    """Returns a hash of a group structure and group fluxes, either of which
+    may be None."""
+    sha = hashlib.sha1()
+    for arr in (E_g, phi_g):
+        if arr is not None:
+            sha.update(np.ascontiguousarray(arr, dtype='f8').tobytes())
+        sha.update(b'|')
+    return sha.hexdigest()
+
+
 ###############################################################################
 ### Set up a cross-section cache so the same data isn't loaded repetitively ###
 ###############################################################################
@@ -41,6 +57,12 @@ class XSCache(MutableMapping):
     Normally this requires that some cross section data be built into nuc_data.
     A default instance of this class is provided (pyne.xs.cache.xs_cache).
 
+    Cross sections are cached per flux context, a hash of (E_g, phi_g), so
+    changing the group structure or group fluxes and changing them back again
+    reuses the cross sections already computed for them. Cached cross sections
+    of all contexts share a memory budget and are evicted in least recently
+    used order.
+
     Parameters
     ----------
     group_struct : array-like of floats, optional
@@ -52,6 +74,31 @@ class XSCache(MutableMapping):
         section data. Data from a source earlier in the sequence (eg, index 1)
         will take precednce over data later in the sequence (eg, index 5).
         If a class is given rather than an object, the class is instantiated.
+    max_size : int or None, optional
+        Memory budget [bytes] of the cached cross sections, or None for no
+        limit.
+    store : str or None, optional
+        Path to a directory used as a persistent tier of the cache, created
+        if it does not exist. Cross sections missing from memory are looked
+        up in it before being computed, and computed cross sections are
+        written to it. Each cross section is written to its own file under a
+        temporary name and renamed into place, so several processes may
+        share a store.
+    store_readonly : bool, optional
+        Only read from the store.
+
+    Attributes
+    ----------
+    hits : int
+        Number of lookups found in memory.
+    misses : int
+        Number of lookups not found in memory.
+    store_hits : int
+        Number of misses found in the store.
+    evictions : int
+        Number of cross sections evicted from memory.
+    nbytes : int
+        Size of the cross sections held in memory [bytes].
 
     """
 
@@ -60,16 +107,30 @@ class XSCache(MutableMapping):
                                data_source.OpenMCDataSource,
                                data_source.SimpleDataSource,
                                data_source.EAFDataSource,
-                               data_source.NullDataSource)):
-        self._cache = {}
+                               data_source.NullDataSource),
+                 max_size=None, store=None, store_readonly=False):
+        self._contexts = {}
+        self._context = None
+        self._lru = OrderedDict()
+        self.max_size = max_size
+        self.store = store
+        self.store_readonly = store_readonly
+        self.hits = self.misses = self.store_hits = self.evictions = 0
+        self.nbytes = 0
         self.data_sources = []
         for ds in data_sources:
             if inspect.isclass(ds):
                 ds = ds(dst_group_struct=group_struct)
             if ds.exists:
                 self.data_sources.append(ds)
-        self._cache['E_g'] = _valid_group_struct(group_struct)
-        self._cache['phi_g'] = None
+        # stored cross sections depend on the sources they were computed from
+        self._sources_key = ','.join(['{0}.{1}'.format(type(ds).__module__,
+                                                       type(ds).__name__)
+                                      for ds in self.data_sources])
+        if store is not None and not store_readonly and \
+           not os.path.isdir(store):
+            os.makedirs(store)
+        self._switch_context(_valid_group_struct(group_struct), None)
         self._scalars = {} if scalars is None else scalars
 
     #
@@ -87,6 +148,9 @@ class XSCache(MutableMapping):
 
     def __delitem__(self, key):
         del self._cache[key]
+        size = self._lru.pop((self._context, key), None)
+        if size is not None:
+            self.nbytes -= size
 
     #
     # Explicit overrides
@@ -96,23 +160,17 @@ class XSCache(MutableMapping):
         """Key lookup by via custom loading from the nuc_data database file."""
         kw = dict(zip(['nuc', 'rx', 'temp'], key))
         scalar = self._scalars.get(kw['nuc'], None)
-        if (key not in self._cache) and not isinstance(key, basestring):
-            E_g = self._cache['E_g']
-            if E_g is None:
-                for ds in self.data_sources:
-                    xsdata = ds.reaction(*key)
-                    if xsdata is not None:
-                        self._cache[key] = xsdata
-                        break
-            else:
-                kw['dst_phi_g'] = self._cache['phi_g']
-                for ds in self.data_sources:
-                    xsdata = ds.discretize(**kw)
-                    if xsdata is not None:
-                        self._cache[key] = xsdata
-                        break        
-                else:
-                    raise KeyError
+        if key in self._cache:
+            if not isinstance(key, basestring):
+                self.hits += 1
+                self._touch(key)
+        elif not isinstance(key, basestring):
+            self.misses += 1
+            xsdata = self._read_store(key)
+            if xsdata is None:
+                xsdata = self._load(key, kw)
+                self._write_store(key, xsdata)
+            self._insert(key, xsdata)
         # Return the value requested
         if scalar is None:
             return self._cache[key]
@@ -125,11 +183,9 @@ class XSCache(MutableMapping):
         # Set the E_g
         if (key == 'E_g'):
             value = _valid_group_struct(value)
-            cache_value = self._cache['E_g']
-            self.clear()
-            self._cache['phi_g'] = None
             for ds in self.data_sources:
                 ds.dst_group_struct = value
+            self._switch_context(value, None)
         elif (key == 'phi_g'):
             value = value if value is None else np.asarray(value, dtype='f8')
             cache_value = self._cache['phi_g']
@@ -137,18 +193,117 @@ class XSCache(MutableMapping):
                 return
             E_g = self._cache['E_g']
             if len(value) + 1 == len(E_g):
-                self.clear()
+                self._switch_context(E_g, value)
             else:
                 raise ValueError("phi_g does not match existing group structure E_g!")
         # Set the value normally
-        self._cache[key] = value
+        else:
+            self._write_store(key, value)
+            self._insert(key, value)
 
     def clear(self):
-        """Clears the cache, retaining E_g and phi_g."""
+        """Clears the cross sections of every flux context from memory,
+        retaining E_g and phi_g."""
         E_g, phi_g = self._cache['E_g'], self._cache['phi_g'] 
-        self._cache.clear()
-        self._cache['E_g'], self._cache['phi_g'] = E_g, phi_g
+        self._contexts.clear()
+        self._lru.clear()
+        self.nbytes = 0
+        self._switch_context(E_g, phi_g)
+
+    def _switch_context(self, E_g, phi_g):
+        """Makes the cross sections of the context (E_g, phi_g) current."""
+        old = self._contexts.get(self._context)
+        if old is not None and len(old) == 2:
+            del self._contexts[self._context]
+        self._context = _context_key(E_g, phi_g)
+        if self._context not in self._contexts:
+            self._contexts[self._context] = {'E_g': E_g, 'phi_g': phi_g}
+        self._cache = self._contexts[self._context]
+
+    def _load(self, key, kw):
+        """Gets a cross section from the data sources."""
+        E_g = self._cache['E_g']
+        if E_g is None:
+            for ds in self.data_sources:
+                xsdata = ds.reaction(*key)
+                if xsdata is not None:
+                    return xsdata
+        else:
+            kw['dst_phi_g'] = self._cache['phi_g']
+            for ds in self.data_sources:
+                xsdata = ds.discretize(**kw)
+                if xsdata is not None:
+                    return xsdata
+        raise KeyError(key)
+
+    def _touch(self, key):
+        lrukey = (self._context, key)
+        if lrukey in self._lru:
+            self._lru[lrukey] = self._lru.pop(lrukey)
+
+    def _insert(self, key, value):
+        """Adds a cross section to the current context, then evicts least
+        recently used cross sections until the cache is within max_size."""
+        lrukey = (self._context, key)
+        self.nbytes -= self._lru.pop(lrukey, 0)
+        size = getattr(value, 'nbytes', sys.getsizeof(value))
+        self._cache[key] = value
+        self._lru[lrukey] = size
+        self.nbytes += size
+        if self.max_size is None:
+            return
+        while self.nbytes > self.max_size and len(self._lru) > 1:
+            (context, k), size = self._lru.popitem(last=False)
+            del self._contexts[context][k]
+            self.nbytes -= size
+            self.evictions += 1
+            if context != self._context and len(self._contexts[context]) == 2:
+                del self._contexts[context]
+
+    def _store_path(self, key):
+        """Returns the path of a cross section of the current context in the
+        store. Nuclides and reactions are normalized to their ids, so that
+        equivalent keys share a stored cross section.
+        """
+        parts = list(key)
+        try:
+            parts[0] = nucname.id(parts[0])
+            parts[1] = rxname.id(parts[1])
+        except (IndexError, RuntimeError, TypeError, ValueError):
+            pass
+        ident = '|'.join([self._sources_key, self._context] +
+                         [repr(float(p)) if isinstance(p, float) else str(p)
+                          for p in parts])
+        keyhash = hashlib.sha1(ident.encode('utf-8')).hexdigest()
+        return os.path.join(self.store, keyhash + '.npy')
+
+    def _read_store(self, key):
+        """Reads a cross section of the current context from the store, or
+        returns None if it is not there."""
+        if self.store is None:
+            return None
+        path = self._store_path(key)
+        if not os.path.isfile(path):
+            return None
+        try:
+            xsdata = np.load(path)
+        except (IOError, OSError, ValueError):
+            return None
+        self.store_hits += 1
+        return xsdata
 
+    def _write_store(self, key, value):
+        """Writes a cross section of the current context to the store."""
+        if self.store is None or self.store_readonly or \
+           not isinstance(value, np.ndarray):
+            return
+        path = self._store_path(key)
+        if os.path.isfile(path):
+            return
+        tmp = '{0}.{1}.tmp'.format(path, os.getpid())
+        with open(tmp, 'wb') as f:
+            np.save(f, value)
+        _replace(tmp, path)
 
     def load(self, temp=300.0):
         """Loads the cross sections from all data sources."""
@@ -29,7 +29,8 @@ from pyne import endf
 from pyne import bins
 from pyne import ace
 from pyne.data import MeV_per_K
-from pyne.xs.models import partial_energy_matrix, group_collapse, same_arr_or_none
+from pyne.xs.models import partial_energy_matrix, group_collapse, \
+    group_collapse_many, same_arr_or_none
 
 warn(__name__ + " is not yet QA compliant.", QAWarning)
 
@@ -224,6 +225,42 @@ class DataSource(object):
                                                         self._src_to_dst_matrix)
         return dst_sigma
 
+    def discretize_many(self, reactions, temp=300.0, src_phi_g=None):
+        """Discretizes many reaction channels over many source fluxes at once
+        with group_collapse_many(). As with discretize(), this is only valid
+        for multi-group data sources.
+
+        Parameters
+        ----------
+        reactions : list of (nuc, rx) pairs
+            The reaction channels to discretize.
+        temp : float, optional
+            Temperature [K] of material, defaults to 300.0.
+        src_phi_g : array-like, optional
+            Group fluxes for this data source, either a single spectrum of
+            length src_ngroups or a 2D array with one spectrum per row.
+
+        Returns
+        -------
+        dst_sigma : ndarray
+            Destination cross section data, shape (number of spectra, number
+            of reactions, dst_ngroups). Channels missing from this data source
+            are zero.
+
+        """
+        if self._src_to_dst_matrix is None:
+            raise ValueError("dst_group_struct must be set on {0} to "
+                             "discretize many reactions at once".format(
+                             type(self).__name__))
+        src_phi_g = self.src_phi_g if src_phi_g is None else np.asarray(src_phi_g)
+        src_sigma = np.zeros((len(reactions), self.src_ngroups), dtype='f8')
+        for i, (nuc, rx) in enumerate(reactions):
+            rxdata = self.reaction(nuc, rx, temp)
+            if rxdata is not None:
+                src_sigma[i] = rxdata
+        return group_collapse_many(src_sigma, src_phi_g,
+                                   partial_energies=self._src_to_dst_matrix)
+
 
     def shield_weights(self, num_dens, temp):
         """Builds the weights used during the self shielding calculations. 
@@ -438,6 +475,50 @@ class SimpleDataSource(DataSource):
         self._src_to_dst_matrix = None
 
 
+class _ReactionTable(object):
+    """Multigroup data for every reaction channel of a data source, held as
+    the rows of one dense array and indexed by sorted (nuc, rx) keys. Rows
+    given for the same channel are summed.
+
+    Parameters
+    ----------
+    nucs : array of ints
+        Nuclide ids of the rows.
+    rxs : array of ints
+        Reaction ids of the rows.
+    xs : 2d array of floats
+        Cross section data [barns], one row per channel.
+
+    """
+
+    def __init__(self, nucs, rxs, xs):
+        keys = self._key(np.asarray(nucs, dtype='i8'),
+                         np.asarray(rxs, dtype='i8'))
+        xs = np.asarray(xs, dtype='f8')
+        if len(keys) == 0:
+            self.keys, self.xs = keys, xs
+            return
+        order = np.argsort(keys, kind='mergesort')
+        keys = keys[order]
+        starts = np.flatnonzero(np.r_[True, keys[1:] != keys[:-1]])
+        self.keys = keys[starts]
+        self.xs = np.add.reduceat(xs[order], starts, axis=0)
+
+    @staticmethod
+    def _key(nuc, rx):
+        return (nuc << 32) | rx
+
+    def get(self, nuc, rx):
+        """Returns a view of the row for a channel, or None if there is no
+        such channel.
+        """
+        key = self._key(int(nuc), int(rx))
+        i = np.searchsorted(self.keys, key)
+        if i == len(self.keys) or self.keys[i] != key:
+            return None
+        return self.xs[i]
+
+
 class CinderDataSource(DataSource):
     """Cinder cross section data source. The relevant cinder cross section data must
     be present in the nuc_data for this data source to exist.  This data source does
@@ -495,6 +576,7 @@ class CinderDataSource(DataSource):
     _USES_TEMP = False
 
     def __init__(self, **kwargs):
+        self._table = None
         super(CinderDataSource, self).__init__(**kwargs)
 
     def _load_group_structure(self):
@@ -510,44 +592,53 @@ class CinderDataSource(DataSource):
                 self._exists = ('/neutron/cinder_xs' in f)
         return self._exists
 
-    def _load_reaction(self, nuc, rx, temp=300.0):
+    def _load_table(self):
+        """Reads the whole of the cinder absorption and fission tables into
+        a dense reaction table, along with the absorption sum of each
+        nuclide.
+        """
         fissrx = rxname.id('fission')
         absrx = rxname.id('absorption')
+        with tb.open_file(nuc_data, 'r') as f:
+            absorption = f.root.neutron.cinder_xs.absorption.read()
+            fission = f.root.neutron.cinder_xs.fission.read()
+        code_rx = dict((code.encode(), rx) for rx, code in
+                       self._rx_avail.items())
+        codes, idx = np.unique(absorption['reaction_type'],
+                               return_inverse=True)
+        rxs = np.array([code_rx.get(code, 0) for code in codes],
+                       dtype='i8')[idx]
+        known = (rxs != 0)
+        absorbed = (absorption['reaction_type'] != b'c')
+        nucs, xs = absorption['from_nuc'], absorption['xs']
+        fnucs, fxs = fission['nuc'], fission['xs']
+        self._table = _ReactionTable(
+            np.concatenate([nucs[known], fnucs, nucs[absorbed], fnucs]),
+            np.concatenate([rxs[known], np.full(len(fnucs), fissrx, 'i8'),
+                            np.full(absorbed.sum(), absrx, 'i8'),
+                            np.full(len(fnucs), absrx, 'i8')]),
+            np.concatenate([xs[known], fxs, xs[absorbed], fxs]))
 
-        # Set query condition
-        if rx in self._rx_avail:
-            if py3k:
-                cond = "(from_nuc == {0}) & (reaction_type == {1})"
-            else:
-                cond = "(from_nuc == {0}) & (reaction_type == '{1}')"
-            cond = cond.format(nuc, self._rx_avail[rx].encode())
-        elif rx == fissrx:
-            cond = 'nuc == {0}'.format(nuc)
-        elif rx == absrx:
-            cond = "(from_nuc == {0}) & (reaction_type != b'c')".format(nuc)
-        else:
-            return None
+    def _load_reaction(self, nuc, rx, temp=300.0):
+        if self._table is None:
+            self._load_table()
+        return self._table.get(nuc, rx)
 
-        # read & collapse data
-        with tb.open_file(nuc_data, 'r') as f:
-            node = f.root.neutron.cinder_xs.fission if rx == fissrx else \
-                   f.root.neutron.cinder_xs.absorption
-            rows = [np.array(row['xs']) for row in node.where(cond)]
-
-        if 1 == len(rows):
-            rxdata = rows[0]
-        elif 1 < len(rows):
-            rows = np.array(rows)
-            rxdata = rows.sum(axis=0)
-        else:
-            rxdata = None
+    def load(self, temp=300.0):
+        """Loads all cinder data into memory.
 
-        # add fission data to absorption
-        if rx == absrx:
-            fdata = self._load_reaction(nuc, fissrx)
-            if fdata is not None:
-                rxdata = fdata if rxdata is None else rxdata + fdata
-        return rxdata
+        Parameters
+        ----------
+        temp : float, optional
+            The material temperature
+
+        Notes
+        -----
+        Cinder data does not use temperature information (temp).
+
+        """
+        if self._table is None:
+            self._load_table()
 
 class EAFDataSource(DataSource):
     """European Activation File cross section data source.  The relevant EAF
@@ -624,6 +715,7 @@ class EAFDataSource(DataSource):
     _USES_TEMP = False
 
     def __init__(self, **kwargs):
+        self._table = None
         super(EAFDataSource, self).__init__(**kwargs)
 
     def _load_group_structure(self):
@@ -639,6 +731,23 @@ class EAFDataSource(DataSource):
                 self._exists = ('/neutron/eaf_xs' in f)
         return self._exists
 
+    def _load_table(self):
+        """Reads the whole EAF table into a dense reaction table, along with
+        the absorption sum of each nuclide.
+        """
+        absrx = rxname.id('absorption')
+        with tb.open_file(nuc_data, 'r') as f:
+            rows = f.root.neutron.eaf_xs.eaf_xs.read()
+        rxnums, idx = np.unique(rows['rxnum'], return_inverse=True)
+        rxs = np.array([self._avail_rx.get(rxnum, 0) for rxnum in rxnums],
+                       dtype='i8')[idx]
+        known = (rxs != 0)
+        nucs, xs = rows['nuc_zz'], rows['xs']
+        self._table = _ReactionTable(
+            np.concatenate([nucs[known], nucs]),
+            np.concatenate([rxs[known], np.full(len(nucs), absrx, 'i8')]),
+            np.concatenate([xs[known], xs]))
+
     def _load_reaction(self, nuc, rx, temp=300.0):
         """Loads reaction specific data for EAF.
 
@@ -653,40 +762,14 @@ class EAFDataSource(DataSource):
 
         Notes
         -----
-        EAF data does not use temperature information (temp).
+        EAF data does not use temperature information (temp). The first
+        call reads the whole EAF table, and later calls return views of its
+        rows.
 
         """
-        absrx = rxname.id('absorption')
-
-        if rx in self._rx_avail:
-            if py3k is True:
-                cond = "(nuc_zz == {0}) & (rxnum == {1})"
-            else:
-                cond = "(nuc_zz == {0}) & (rxnum == '{1}')"
-            cond = cond.format(nuc, self._rx_avail[rx])
-        elif rx == absrx:
-            cond = "(nuc_zz == {0})".format(nuc)
-        else:
-            return None
-
-        # Grab data
-        with tb.open_file(nuc_data, 'r') as f:
-            node = f.root.neutron.eaf_xs.eaf_xs
-            rows = node.read_where(cond)
-            #rows = [np.array(row['xs']) for row in node.where(cond)]
-
-        if len(rows) == 0:
-            rxdata = None
-        elif 1 < len(rows):
-            xss = rows['xs']
-            rxnums = rows['rxnum']
-            for rxnum, xs in zip(rxnums, xss):
-                self.rxcache[nuc, self._avail_rx[rxnum]] = xs
-            rxdata = xss.sum(axis=0)
-        else:
-            rxdata = rows[0]['xs']
-
-        return rxdata
+        if self._table is None:
+            self._load_table()
+        return self._table.get(nuc, rx)
 
     def load(self, temp=300.0):
         """Loads all EAF into memory.
@@ -701,19 +784,8 @@ class EAFDataSource(DataSource):
         EAF data does not use temperature information (temp).
 
         """
-        rxcache = self.rxcache
-        avail_rx = self._avail_rx
-        absrx = rxname.id('absorption')
-        with tb.open_file(nuc_data, 'r') as f:
-            node = f.root.neutron.eaf_xs.eaf_xs
-            for row in node:
-                nuc = row['nuc_zz']
-                rx = avail_rx[row['rxnum']]
-                xs = row['xs']
-                rxcache[nuc, rx] = xs
-                abskey = (nuc, absrx)
-                rxcache[abskey] = xs + rxcache.get(abskey, 0.0)
-        self.fullyloaded = True
+        if self._table is None:
+            self._load_table()
 
 class ENDFDataSource(DataSource):
     """Evaluated Nuclear Data File cross section data source.  The ENDF file
@@ -860,6 +932,50 @@ class ENDFDataSource(DataSource):
                      for dst_bound in dst_bounds]
         return dst_sigma
 
+    def discretize_many(self, reactions, temp=300.0, src_phi_g=None):
+        """Discretizes many reaction channels at once by stacking discretize()
+        for each of them. ENDF reactions are pointwise and are integrated
+        directly over the destination groups, so every spectrum gives the
+        same cross sections.
+
+        Parameters
+        ----------
+        reactions : list of (nuc, rx) pairs
+            The reaction channels to discretize.
+        temp : float, optional
+            Temperature [K] of material, defaults to 300.0.
+        src_phi_g : array-like, optional
+            Group fluxes, either a single spectrum or a 2D array with one
+            spectrum per row. Only the number of spectra is used.
+
+        Returns
+        -------
+        dst_sigma : ndarray
+            Destination cross section data, shape (number of spectra, number
+            of reactions, dst_ngroups). Channels missing from the library are
+            zero.
+
+        """
+        n_spectra = 1
+        if src_phi_g is not None and np.ndim(src_phi_g) == 2:
+            n_spectra = len(src_phi_g)
+        found = {}
+        for i, (nuc, rx) in enumerate(reactions):
+            try:
+                self.reaction(nuc, rx)
+            except (KeyError, ValueError):
+                continue
+            found[i] = np.asarray(self.discretize(nuc, rx, temp), dtype='f8')
+        dst_ngroups = set(len(sigma) for sigma in found.values())
+        if len(dst_ngroups) > 1:
+            raise ValueError("the reactions to discretize must share a "
+                             "dst_group_struct")
+        dst_sigma = np.zeros((len(reactions), max(dst_ngroups or [0])),
+                             dtype='f8')
+        for i, sigma in found.items():
+            dst_sigma[i] = sigma
+        return np.tile(dst_sigma, (n_spectra, 1, 1))
+
     def integrate_dst_group(self, dst_bounds, src_bounds, src_dict, e_int, xs):
         dst_low, dst_high = dst_bounds
         src_bounds = np.array(src_bounds)
@@ -980,7 +1096,7 @@ class OpenMCDataSource(DataSource):
             if os.path.isfile(atab.abspath or atab.path):
                 if atab not in self.libs:
                     lib = self.libs[atab] = ace.Library(atab.abspath or atab.path)
-                    lib.read(atab.name)
+                    lib.read(atab.name, lazy=True)
                 lib = self.libs[atab]
                 ntab = lib.tables[atab.name]
                 if mt in ntab.reactions or rx == totrx or rx == absrx:
@@ -224,6 +224,58 @@ def group_collapse(sigma_n, phi_n, phi_g=None, partial_energies=None, E_g=None,
     return sigma_g
 
 
+def group_collapse_many(sigma_n, phi_n, partial_energies=None, E_g=None, E_n=None,
+                        weights=None):
+    """Collapses many cross sections over many fluxes at once.  This is equivalent
+    to calling group_collapse() for every pair of a row of sigma_n and a row of
+    phi_n, but is computed with one matrix product per low-resolution group.
+
+    Parameters
+    ----------
+    sigma_n : 2D array-like of floats
+        High-fidelity cross sections, shape (R, N).
+    phi_n : 2D array-like of floats
+        High-fidelity fluxes [n/cm^2/s], shape (S, N).
+    partial_energies : 2D array-like of floats, optional
+        A partial energy matrix as provided by a previous call to the function
+        partial_energy_matrix().
+    E_g : array-like of floats, optional
+        Lower resolution energy group structure [MeV] that is of length G+1.
+        If present, E_n is needed as well.
+    E_n : array-like of floats, optional
+        Higher resolution energy group structure [MeV] that is of length N+1. 
+        If present, E_g is needed as well.
+    weights : array-like of floats, optional
+        Weights of the high-fidelity groups (length N).
+
+    Returns
+    -------
+    sigma_g : ndarray
+        The collapsed cross sections, shape (S, R, G).
+    """
+    if partial_energies is not None:
+        pem = np.asarray(partial_energies, dtype='f8')
+    elif (E_g is not None) and (E_n is not None):
+        pem = partial_energy_matrix(E_g, E_n)
+    else:
+        msg = "Either partial_energies or E_g and E_n must both not be None."
+        raise ValueError(msg)
+    sigma_n = np.atleast_2d(np.asarray(sigma_n, dtype='f8'))
+    phi_n = np.atleast_2d(np.asarray(phi_n, dtype='f8'))
+    if weights is not None:
+        phi_n = phi_n * weights
+    G = pem.shape[0]
+    sigma_g = np.empty((phi_n.shape[0], sigma_n.shape[0], G), dtype='f8')
+    sigma_nT = np.ascontiguousarray(sigma_n.T)
+    for g in range(G):
+        sigma_g[:, :, g] = np.dot(phi_n * pem[g], sigma_nT)
+    phi_g = np.dot(phi_n, pem.T)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        sigma_g /= phi_g[:, np.newaxis, :]
+    sigma_g[np.isnan(sigma_g)] = 0.0  # handle zero flux that causes NaNs later.
+    return sigma_g
+
+
 
 #######################
 ### Physical models ###
@@ -0,0 +1 @@
+@python -c "import sys; from pyne.ace_cache import main; sys.exit(main())"
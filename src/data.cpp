@@ -1076,36 +1076,166 @@ const std::pair<int, double>& rhs) const {
       lhs.first<rhs.first);
 }
 
+namespace {
+// Orders energy index entries as swapmapcompare orders their keys.
+struct energy_index_compare {
+  pyne::swapmapcompare cmp;
+  template<typename E>
+  bool operator()(const E& lhs, const std::pair<int, double>& rhs) const {
+    return cmp(lhs.first, rhs);
+  }
+  template<typename E>
+  bool operator()(const std::pair<int, double>& lhs, const E& rhs) const {
+    return cmp(lhs, rhs.first);
+  }
+  template<typename E>
+  bool operator()(const E& lhs, const E& rhs) const {
+    return cmp(lhs.first, rhs.first);
+  }
+};
+
+// Energy indices of the maps of entries of type U, keyed by map address.
+template<typename U>
+struct energy_indices {
+  typedef std::vector<std::pair<std::pair<int, double>, const U*> > index_t;
+  static std::map<const void*, index_t>& get() {
+    static std::map<const void*, index_t> indices;
+    return indices;
+  }
+};
+} // namespace
+
+template<typename U>
+const std::vector<std::pair<std::pair<int, double>, const U*> >&
+pyne::energy_index(std::map<std::pair<int, double>, U>  &data) {
+  typedef typename energy_indices<U>::index_t index_t;
+  std::map<const void*, index_t>& indices = energy_indices<U>::get();
+  typename std::map<const void*, index_t>::iterator found =
+    indices.find(&data);
+  if (found != indices.end())
+    return found->second;
+  index_t& index = indices[&data];
+  index.reserve(data.size());
+  typename std::map<std::pair<int, double>, U>::const_iterator it;
+  for (it = data.begin(); it != data.end(); ++it)
+    index.push_back(std::make_pair(it->first, &(it->second)));
+  std::stable_sort(index.begin(), index.end(), energy_index_compare());
+  return index;
+}
+
+template<typename U>
+void pyne::invalidate_energy_index(
+std::map<std::pair<int, double>, U>  &data) {
+  energy_indices<U>::get().erase(&data);
+}
+
 template<typename T, typename U> std::vector<T> pyne::data_access(
 double energy_min, double energy_max, size_t valoffset, std::map<std::pair<int,
 double>, U>  &data) {
-  typename std::map<std::pair<int, double>, U, swapmapcompare>::iterator
-    nuc_iter, nuc_end, it;
-  std::map<std::pair<int, double>, U, swapmapcompare> dc(data.begin(),
-    data.end());
-  std::vector<T> result;
+  typedef std::vector<std::pair<std::pair<int, double>, const U*> > index_t;
+  // Fill up the map with values from the nuc_data.h5, if the map is empty.
+  if (data.empty())
+    _load_data<U>();
   if (energy_max < energy_min){
     double temp = energy_max;
     energy_max = energy_min;
     energy_min = temp;
   }
-  nuc_iter = dc.lower_bound(std::make_pair(0, energy_min));
-  nuc_end = dc.upper_bound(std::make_pair(9999999999, energy_max));
-  T *ret;
-  // First check if we already have the nuc in the map
-  for (it = nuc_iter; it!= nuc_end; ++it){
-    ret = (T *)((char *)&(it->second) + valoffset);
+  const index_t& index = energy_index<U>(data);
+  typename index_t::const_iterator nuc_iter, nuc_end, it;
+  nuc_iter = std::lower_bound(index.begin(), index.end(),
+    std::make_pair(0, energy_min), energy_index_compare());
+  nuc_end = std::upper_bound(nuc_iter, index.end(),
+    std::make_pair(std::numeric_limits<int>::max(), energy_max),
+    energy_index_compare());
+  std::vector<T> result;
+  result.reserve(nuc_end - nuc_iter);
+  const T *ret;
+  for (it = nuc_iter; it != nuc_end; ++it){
+    ret = (const T *)((const char *)(it->second) + valoffset);
     result.push_back(*ret);
   }
-  // Next, fill up the map with values from the
-  // nuc_data.h5, if the map is empty.
+  return result;
+}
+
+template<typename T, typename U> std::vector<T> pyne::data_access(
+const std::vector<double>& energy_min, const std::vector<double>& energy_max,
+size_t valoffset, std::map<std::pair<int, double>, U>  &data,
+std::vector<int>& offsets) {
+  typedef std::vector<std::pair<std::pair<int, double>, const U*> > index_t;
+  // Fill up the map with values from the nuc_data.h5, if the map is empty.
   if (data.empty())
-  {
     _load_data<U>();
-    return data_access<T, U>(energy_min, energy_max, valoffset, data);
+  size_t n = energy_min.size();
+  std::vector<std::pair<double, size_t> > lower(n);
+  std::vector<double> upper(n);
+  for (size_t i = 0; i < n; ++i){
+    lower[i] = std::make_pair(std::min(energy_min[i], energy_max[i]), i);
+    upper[i] = std::max(energy_min[i], energy_max[i]);
+  }
+  // Visit the windows in order of their lower bounds, so that each lower
+  // bound is searched for only from the previous one onwards.
+  std::sort(lower.begin(), lower.end());
+  const index_t& index = energy_index<U>(data);
+  std::vector<typename index_t::const_iterator> first(n), last(n);
+  typename index_t::const_iterator nuc_iter = index.begin();
+  for (size_t k = 0; k < n; ++k){
+    size_t i = lower[k].second;
+    nuc_iter = std::lower_bound(nuc_iter, index.end(),
+      std::make_pair(0, lower[k].first), energy_index_compare());
+    first[i] = nuc_iter;
+    last[i] = std::upper_bound(nuc_iter, index.end(),
+      std::make_pair(std::numeric_limits<int>::max(), upper[i]),
+      energy_index_compare());
+  }
+  offsets.assign(n + 1, 0);
+  for (size_t i = 0; i < n; ++i)
+    offsets[i + 1] = offsets[i] + (last[i] - first[i]);
+  std::vector<T> result;
+  result.reserve(offsets[n]);
+  typename index_t::const_iterator it;
+  const T *ret;
+  for (size_t i = 0; i < n; ++i){
+    for (it = first[i]; it != last[i]; ++it){
+      ret = (const T *)((const char *)(it->second) + valoffset);
+      result.push_back(*ret);
+    }
+  }
+  return result;
+}
+
+namespace {
+// Batched energy window query of the values at valoffset, for windows of
+// half width error centered on energy.
+template<typename T, typename U>
+std::vector<T> window_access(const std::vector<double>& energy,
+const std::vector<double>& error, size_t valoffset,
+std::map<std::pair<int, double>, U>  &data, std::vector<int>& offsets) {
+  std::vector<double> emin(energy.size()), emax(energy.size());
+  for (size_t i = 0; i < energy.size(); ++i){
+    emin[i] = energy[i] - error[i];
+    emax[i] = energy[i] + error[i];
+  }
+  return pyne::data_access<T, U>(emin, emax, valoffset, data, offsets);
+}
+
+// Batched energy window query of the pairs of values at offset1 and offset2.
+template<typename T, typename U>
+std::vector<std::pair<T, T> > window_pairs(const std::vector<double>& energy,
+const std::vector<double>& error, size_t offset1, size_t offset2,
+std::map<std::pair<int, double>, U>  &data, std::vector<int>& offsets) {
+  std::vector<T> part1 = window_access<T, U>(energy, error, offset1, data,
+    offsets);
+  std::vector<T> part2 = window_access<T, U>(energy, error, offset2, data,
+    offsets);
+  std::vector<std::pair<T, T> > result;
+  result.reserve(part1.size());
+  for(int i = 0; i < part1.size(); ++i){
+    result.push_back(std::make_pair(part1[i],part2[i]));
   }
   return result;
 }
+} // namespace
 
 template<typename T, typename U> std::vector<T> pyne::data_access(int parent,
 double min, double max, size_t valoffset,
@@ -1880,6 +2010,8 @@ template<> void pyne::_load_data<pyne::gamma>() {
   status = H5Dclose(gamma_set);
   status = H5Fclose(nuc_data_h5);
 
+  // the old index points into the entries being replaced
+  invalidate_energy_index<gamma>(gamma_data);
   for (int i = 0; i < gamma_length; ++i) {
     if ((gamma_array[i].parent_nuc != 0) && !isnan(gamma_array[i].energy))
       gamma_data[std::make_pair(gamma_array[i].parent_nuc,
@@ -1913,6 +2045,13 @@ double error) {
   return result;
 }
 
+std::vector<std::pair<double, double> > pyne::gamma_energy(
+const std::vector<double>& energy,
+const std::vector<double>& error, std::vector<int>& offsets) {
+  return window_pairs<double, gamma>(energy, error, offsetof(gamma, energy),
+    offsetof(gamma, energy_err), gamma_data, offsets);
+}
+
 std::vector<std::pair<double, double> > pyne::gamma_photon_intensity(
 int parent) {
   std::vector<std::pair<double, double> > result;
@@ -1939,6 +2078,14 @@ double energy, double error) {
   return result;
 }
 
+std::vector<std::pair<double, double> > pyne::gamma_photon_intensity(
+const std::vector<double>& energy,
+const std::vector<double>& error, std::vector<int>& offsets) {
+  return window_pairs<double, gamma>(energy, error,
+    offsetof(gamma, photon_intensity), offsetof(gamma, photon_intensity_err),
+    gamma_data, offsets);
+}
+
 std::vector<std::pair<double, double> > pyne::gamma_conversion_intensity(
 int parent) {
   std::vector<std::pair<double, double> > result;
@@ -1990,6 +2137,13 @@ double error) {
   return result;
 }
 
+std::vector<std::pair<int, int> > pyne::gamma_from_to(
+const std::vector<double>& energy,
+const std::vector<double>& error, std::vector<int>& offsets) {
+  return window_pairs<int, gamma>(energy, error, offsetof(gamma, from_nuc),
+    offsetof(gamma, to_nuc), gamma_data, offsets);
+}
+
 
 std::vector<std::pair<int, int> > pyne::gamma_parent_child(double energy,
 double error) {
@@ -2004,16 +2158,35 @@ double error) {
   return result;
 }
 
+std::vector<std::pair<int, int> > pyne::gamma_parent_child(
+const std::vector<double>& energy,
+const std::vector<double>& error, std::vector<int>& offsets) {
+  return window_pairs<int, gamma>(energy, error, offsetof(gamma, parent_nuc),
+    offsetof(gamma, child_nuc), gamma_data, offsets);
+}
+
 std::vector<int> pyne::gamma_parent(double energy, double error) {
   return data_access<int, gamma>(energy+error, energy-error,
     offsetof(gamma, parent_nuc), gamma_data);
 }
 
+std::vector<int> pyne::gamma_parent(const std::vector<double>& energy,
+const std::vector<double>& error, std::vector<int>& offsets) {
+  return window_access<int, gamma>(energy, error, offsetof(gamma, parent_nuc),
+    gamma_data, offsets);
+}
+
 std::vector<int> pyne::gamma_child(double energy, double error) {
   return data_access<int, gamma>(energy+error, energy-error,
   offsetof(gamma, child_nuc), gamma_data);
 }
 
+std::vector<int> pyne::gamma_child(const std::vector<double>& energy,
+const std::vector<double>& error, std::vector<int>& offsets) {
+  return window_access<int, gamma>(energy, error, offsetof(gamma, child_nuc),
+    gamma_data, offsets);
+}
+
 std::vector<int> pyne::gamma_child(int parent) {
   return data_access<int, gamma>(parent, 0.0, DBL_MAX,
   offsetof(gamma, child_nuc), gamma_data);
@@ -2103,6 +2276,8 @@ template<> void pyne::_load_data<pyne::alpha>() {
   status = H5Dclose(alpha_set);
   status = H5Fclose(nuc_data_h5);
 
+  // the old index points into the entries being replaced
+  invalidate_energy_index<alpha>(alpha_data);
   for (int i = 0; i < alpha_length; ++i) {
     if ((alpha_array[i].from_nuc != 0) && !isnan(alpha_array[i].energy))
       alpha_data[std::make_pair(alpha_array[i].from_nuc, alpha_array[i].energy)]
@@ -2125,11 +2300,23 @@ std::vector<int> pyne::alpha_parent(double energy, double error) {
                      offsetof(alpha, from_nuc), alpha_data);
 }
 
+std::vector<int> pyne::alpha_parent(const std::vector<double>& energy,
+const std::vector<double>& error, std::vector<int>& offsets) {
+  return window_access<int, alpha>(energy, error, offsetof(alpha, from_nuc),
+    alpha_data, offsets);
+}
+
 std::vector<int> pyne::alpha_child(double energy, double error) {
   return data_access<int, alpha>(energy+error, energy-error,
                      offsetof(alpha, to_nuc), alpha_data);
 }
 
+std::vector<int> pyne::alpha_child(const std::vector<double>& energy,
+const std::vector<double>& error, std::vector<int>& offsets) {
+  return window_access<int, alpha>(energy, error, offsetof(alpha, to_nuc),
+    alpha_data, offsets);
+}
+
 std::vector<int> pyne::alpha_child(int parent){
   return data_access<int, alpha>(parent, 0.0, DBL_MAX,
                      offsetof(alpha, to_nuc), alpha_data);
@@ -2181,6 +2368,8 @@ template<> void pyne::_load_data<pyne::beta>() {
   status = H5Dclose(beta_set);
   status = H5Fclose(nuc_data_h5);
 
+  // the old index points into the entries being replaced
+  invalidate_energy_index<beta>(beta_data);
   for (int i = 0; i < beta_length; ++i) {
     if ((beta_array[i].from_nuc != 0) && !isnan(beta_array[i].avg_energy))
       beta_data[std::make_pair(beta_array[i].from_nuc, beta_array[i].avg_energy)]
@@ -2209,11 +2398,23 @@ std::vector<int> pyne::beta_parent(double energy, double error) {
                      offsetof(beta, from_nuc), beta_data);
 }
 
+std::vector<int> pyne::beta_parent(const std::vector<double>& energy,
+const std::vector<double>& error, std::vector<int>& offsets) {
+  return window_access<int, beta>(energy, error, offsetof(beta, from_nuc),
+    beta_data, offsets);
+}
+
 std::vector<int> pyne::beta_child(double energy, double error) {
   return data_access<int, beta>(energy+error, energy-error,
                      offsetof(beta, to_nuc), beta_data);
 }
 
+std::vector<int> pyne::beta_child(const std::vector<double>& energy,
+const std::vector<double>& error, std::vector<int>& offsets) {
+  return window_access<int, beta>(energy, error, offsetof(beta, to_nuc),
+    beta_data, offsets);
+}
+
 std::vector<int> pyne::beta_child(int parent){
   return data_access<int, beta>(parent, 0.0, DBL_MAX,
                      offsetof(beta, to_nuc),beta_data);
@@ -2273,6 +2474,8 @@ template<> void pyne::_load_data<pyne::ecbp>() {
   status = H5Dclose(ecbp_set);
   status = H5Fclose(nuc_data_h5);
 
+  // the old index points into the entries being replaced
+  invalidate_energy_index<ecbp>(ecbp_data);
   for (int i = 0; i < ecbp_length; ++i) {
     if ((ecbp_array[i].from_nuc != 0) && !isnan(ecbp_array[i].avg_energy))
       ecbp_data[std::make_pair(ecbp_array[i].from_nuc, ecbp_array[i].avg_energy)]
@@ -2306,11 +2509,23 @@ std::vector<int> pyne::ecbp_parent(double energy, double error) {
                      offsetof(ecbp, from_nuc), ecbp_data);
 }
 
+std::vector<int> pyne::ecbp_parent(const std::vector<double>& energy,
+const std::vector<double>& error, std::vector<int>& offsets) {
+  return window_access<int, ecbp>(energy, error, offsetof(ecbp, from_nuc),
+    ecbp_data, offsets);
+}
+
 std::vector<int> pyne::ecbp_child(double energy, double error) {
   return data_access<int, ecbp>(energy+error, energy-error,
                      offsetof(ecbp, to_nuc), ecbp_data);
 }
 
+std::vector<int> pyne::ecbp_child(const std::vector<double>& energy,
+const std::vector<double>& error, std::vector<int>& offsets) {
+  return window_access<int, ecbp>(energy, error, offsetof(ecbp, to_nuc),
+    ecbp_data, offsets);
+}
+
 std::vector<int> pyne::ecbp_child(int parent){
   return data_access<int, ecbp>(parent, 0.0, DBL_MAX,
                      offsetof(ecbp, to_nuc), ecbp_data);
@@ -8,6 +8,7 @@
 #include <iostream>
 #include <string>
 #include <utility>
+#include <algorithm>
 #include <map>
 #include <set>
 #include <limits>
@@ -319,11 +320,36 @@ namespace pyne
                         const std::pair<int, double>& rhs) const;
   };
 
+  /// Returns an index of the entries of a std::map<std::pair<int, double>,
+  /// U>, ordered by the second member of the key and then the first. The
+  /// index is built once per map and holds pointers to its entries, so it
+  /// must be invalidated whenever the map is modified; the _load_data
+  /// functions do so when they (re)fill the decay maps. Building the index
+  /// is not thread-safe: like the lazily loaded maps themselves, it must be
+  /// created by one thread before others query the map concurrently.
+  template<typename U>
+  const std::vector<std::pair<std::pair<int, double>, const U*> >&
+    energy_index(std::map<std::pair<int, double>, U>  &data);
+
+  /// Discards the energy index of a map, so that it is rebuilt on next use.
+  template<typename U>
+  void invalidate_energy_index(std::map<std::pair<int, double>, U>  &data);
+
   /// Access data in a std::map<std::pair<int, double> for a range of
   /// values of the second member of the pair. Returns a vector of all
   /// values at valoffset of class U of type T f
   template<typename T, typename U> std::vector<T> data_access(double emin,
     double emax, size_t valoffset, std::map<std::pair<int, double>, U>  &data);
+  /// Access data in a std::map<std::pair<int, double> for many ranges of
+  /// values of the second member of the pair at once, sweeping the ranges in
+  /// order of their lower bounds over the energy index. Returns the values
+  /// of all of the ranges, concatenated in the order of the ranges; on
+  /// return, the values of range i are those from offsets[i] up to
+  /// offsets[i+1].
+  template<typename T, typename U> std::vector<T> data_access(
+    const std::vector<double>& emin, const std::vector<double>& emax,
+    size_t valoffset, std::map<std::pair<int, double>, U>  &data,
+    std::vector<int>& offsets);
   /// Access data in a std::map<std::pair<int, double> for a given
   /// value of the first member of the pair. Returns a vector of all
   /// values at valoffset of class U of type T
@@ -563,6 +589,25 @@ namespace pyne
   std::vector<int> gamma_parent(double energy, double error);
   // returns a list of child state_id's based on a gamma-ray energy
   std::vector<int> gamma_child(double energy, double error);
+  //batched versions of the energy window queries above, taking arrays of
+  //energies and errors; the results of window i are those from offsets[i]
+  //up to offsets[i+1]
+  std::vector<std::pair<double, double> > gamma_energy(
+   const std::vector<double>& energy,
+   const std::vector<double>& error, std::vector<int>& offsets);
+  std::vector<std::pair<double, double> > gamma_photon_intensity(
+   const std::vector<double>& energy,
+   const std::vector<double>& error, std::vector<int>& offsets);
+  std::vector<std::pair<int, int> > gamma_from_to(
+   const std::vector<double>& energy,
+   const std::vector<double>& error, std::vector<int>& offsets);
+  std::vector<std::pair<int, int> > gamma_parent_child(
+   const std::vector<double>& energy,
+   const std::vector<double>& error, std::vector<int>& offsets);
+  std::vector<int> gamma_parent(const std::vector<double>& energy,
+   const std::vector<double>& error, std::vector<int>& offsets);
+  std::vector<int> gamma_child(const std::vector<double>& energy,
+   const std::vector<double>& error, std::vector<int>& offsets);
   // returns a list of child state_id's based on a parent state_id
   std::vector<int> gamma_child(int parent);
   //returns an array of arrays of X-ray energies and intesities for a
@@ -597,6 +642,13 @@ namespace pyne
   std::vector<int> alpha_parent(double energy, double error);
   //returns a list of alpha decay children from input decay energy range
   std::vector<int> alpha_child(double energy, double error);
+  //batched versions of the energy window queries above, taking arrays of
+  //energies and errors; the results of window i are those from offsets[i]
+  //up to offsets[i+1]
+  std::vector<int> alpha_parent(const std::vector<double>& energy,
+   const std::vector<double>& error, std::vector<int>& offsets);
+  std::vector<int> alpha_child(const std::vector<double>& energy,
+   const std::vector<double>& error, std::vector<int>& offsets);
   //returns a list of alpha decay children from input parent nuclide
   std::vector<int> alpha_child(int parent);
 
@@ -624,6 +676,13 @@ namespace pyne
   std::vector<int> beta_parent(double energy, double error);
   //returns a list of beta decay children from input decay energy range
   std::vector<int> beta_child(double energy, double error);
+  //batched versions of the energy window queries above, taking arrays of
+  //energies and errors; the results of window i are those from offsets[i]
+  //up to offsets[i+1]
+  std::vector<int> beta_parent(const std::vector<double>& energy,
+   const std::vector<double>& error, std::vector<int>& offsets);
+  std::vector<int> beta_child(const std::vector<double>& energy,
+   const std::vector<double>& error, std::vector<int>& offsets);
   //returns a list of beta decay children from input parent nuclide
   std::vector<int> beta_child(int parent);
 
@@ -663,6 +722,13 @@ namespace pyne
   //returns a list of electron capture /beta plus decay children from input
   //decay energy range
   std::vector<int> ecbp_child(double energy, double error);
+  //batched versions of the energy window queries above, taking arrays of
+  //energies and errors; the results of window i are those from offsets[i]
+  //up to offsets[i+1]
+  std::vector<int> ecbp_parent(const std::vector<double>& energy,
+   const std::vector<double>& error, std::vector<int>& offsets);
+  std::vector<int> ecbp_child(const std::vector<double>& energy,
+   const std::vector<double>& error, std::vector<int>& offsets);
   //returns a list of electron capture /beta plus decay children from input
   //parent nuclide
   std::vector<int> ecbp_child(int parent);
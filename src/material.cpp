@@ -1205,6 +1205,49 @@ pyne::comp_map pyne::Material::mult_by_mass() {
 
 
 
+void pyne::Material::update(const std::vector<int>& nucs,
+                            const std::vector<double>& values) {
+  // Same arithmetic as Material(mult_by_mass() with nucs set, -1, -1),
+  // but on this composition map.
+  if (nucs.size() != values.size())
+    throw pyne::ValueError("nucs and values must have the same length.");
+  if (nucs.empty())
+    return;
+
+  if (mass != 1.0) {
+    for (pyne::comp_iter i = comp.begin(); i != comp.end(); i++)
+      i->second = (i->second) * mass;
+  }
+  for (int n = 0; n < nucs.size(); n++)
+    comp[nucs[n]] = values[n];
+  mass = -1.0;
+  norm_comp();
+}
+
+
+
+void pyne::Material::remove(const std::vector<int>& nucs) {
+  // Same arithmetic as Material(mult_by_mass() less nucs, -1, -1),
+  // but on this composition map.
+  bool found = false;
+  for (int n = 0; n < nucs.size() && !found; n++)
+    found = 0 < comp.count(nucs[n]);
+  if (!found)
+    return;
+
+  if (mass != 1.0) {
+    for (pyne::comp_iter i = comp.begin(); i != comp.end(); i++)
+      i->second = (i->second) * mass;
+  }
+  for (int n = 0; n < nucs.size(); n++)
+    comp.erase(nucs[n]);
+  mass = -1.0;
+  if (!comp.empty())
+    norm_comp();
+}
+
+
+
 pyne::comp_map pyne::Material::activity() {
   pyne::comp_map act;
   double masspermole = mass * pyne::N_A;
@@ -1801,3 +1844,123 @@ pyne::Material pyne::Material::operator/ (double y) {
   // Overloads x / y
   return pyne::Material(comp, mass / y, density );
 }
+
+
+
+/*--- Mixing ---*/
+
+pyne::Material pyne::mix(const std::vector<Material>& mats,
+                         const std::vector<double>& fracs, bool by_volume) {
+  std::vector<std::vector<int> > indices (1);
+  for (int i = 0; i < mats.size(); i++)
+    indices[0].push_back(i);
+  std::vector<std::vector<double> > fracs_many (1, fracs);
+  return mix_many(mats, indices, fracs_many, by_volume)[0];
+}
+
+
+
+std::vector<pyne::Material> pyne::mix_many(const std::vector<Material>& mats,
+                                 const std::vector<std::vector<int> >& indices,
+                                 const std::vector<std::vector<double> >& fracs,
+                                 bool by_volume) {
+  int nmats = mats.size();
+  if (indices.size() != fracs.size())
+    throw pyne::ValueError("indices and fracs must hold the same number of "
+                           "mixtures.");
+
+  // Merge the nuclides of all materials into one sorted column index.
+  // Mixing renormalizes each scaled material, once for mat * frac and again
+  // for * density when mixing by volume, so do that here up front.
+  std::map<int, int> cols;
+  std::vector<comp_map> unit_comps (nmats);
+  for (int k = 0; k < nmats; k++) {
+    unit_comps[k] = Material(mats[k].comp, 1.0).comp;
+    if (by_volume)
+      unit_comps[k] = Material(unit_comps[k], 1.0).comp;
+    for (comp_iter i = unit_comps[k].begin(); i != unit_comps[k].end(); i++)
+      cols[i->first] = 0;
+  }
+  std::vector<int> nucs;
+  for (std::map<int, int>::iterator c = cols.begin(); c != cols.end(); c++) {
+    c->second = nucs.size();
+    nucs.push_back(c->first);
+  }
+  std::vector<std::vector<std::pair<int, double> > > rows (nmats);
+  for (int k = 0; k < nmats; k++) {
+    for (comp_iter i = unit_comps[k].begin(); i != unit_comps[k].end(); i++)
+      rows[k].push_back(std::make_pair(cols[i->first], i->second));
+  }
+
+  // Accumulate each mixture in dense storage, repeating the arithmetic of
+  // mix = mix + mat * frac exactly, but without building intermediate maps.
+  std::vector<double> acc (nucs.size(), 0.0);
+  std::vector<char> present (nucs.size(), 0);
+  std::vector<int> used;
+  std::vector<Material> mixed;
+  mixed.reserve(indices.size());
+  for (int j = 0; j < indices.size(); j++) {
+    const std::vector<int>& idx = indices[j];
+    if (idx.size() != fracs[j].size())
+      throw pyne::ValueError("each mixture must have one fraction per "
+                             "material index.");
+    double mix_mass = -1.0;
+    double total = 0.0;
+    double total_frac = 0.0;
+    for (int m = 0; m < idx.size(); m++) {
+      int k = idx[m];
+      if (k < 0 || nmats <= k)
+        throw pyne::ValueError("material index out of range.");
+      double frac = fracs[j][m];
+      double wgt = mats[k].mass * frac;
+      if (by_volume) {
+        wgt = wgt * mats[k].density;
+        total += mats[k].density * frac;
+      } else {
+        total_frac += frac;
+        total += frac / mats[k].density;
+      }
+
+      for (int u = 0; u < used.size(); u++)
+        acc[used[u]] = acc[used[u]] * mix_mass;
+      bool grew = false;
+      for (int r = 0; r < rows[k].size(); r++) {
+        int c = rows[k][r].first;
+        acc[c] += rows[k][r].second * wgt;
+        if (!present[c]) {
+          present[c] = 1;
+          used.push_back(c);
+          grew = true;
+        }
+      }
+      if (grew)
+        std::sort(used.begin(), used.end());
+
+      // normalize as the Material constructor does, except for the last
+      // step, which the constructor below takes care of.
+      if (m == idx.size() - 1 || used.empty())
+        continue;
+      double sum = 0.0;
+      for (int u = 0; u < used.size(); u++)
+        sum = sum + acc[used[u]];
+      if (sum != 1.0 && sum != 0.0) {
+        for (int u = 0; u < used.size(); u++)
+          acc[used[u]] = acc[used[u]] / sum;
+      }
+      mix_mass = sum;
+    }
+
+    comp_map cm;
+    for (int u = 0; u < used.size(); u++) {
+      cm.insert(cm.end(), std::make_pair(nucs[used[u]], acc[used[u]]));
+      acc[used[u]] = 0.0;
+      present[used[u]] = 0;
+    }
+    used.clear();
+    Material mat (cm, -1, -1);
+    mat.mass = 1.0;
+    mat.density = by_volume ? total : total_frac / total;
+    mixed.push_back(mat);
+  }
+  return mixed;
+}
@@ -13,6 +13,7 @@
 #include <string>
 #include <map>
 #include <set>
+#include <vector>
 #include <stdio.h>
 #include <stdlib.h>
 #include <sstream>	// std::ostringstream
@@ -226,6 +227,13 @@ namespace pyne
     /// Returns a composition map that has been unnormalized by multiplying each
     /// mass weight by the actual mass of the material.
     comp_map mult_by_mass();
+    /// Sets the mass weights of the nuclides in \a nucs to \a values in place,
+    /// adding nuclides that are not yet present, and renormalizes only once.
+    /// The mass becomes the new total mass, as when rebuilding the material
+    /// from mult_by_mass().
+    void update(const std::vector<int>& nucs, const std::vector<double>& values);
+    /// Removes the nuclides in \a nucs in place and renormalizes only once.
+    void remove(const std::vector<int>& nucs);
     /// Calculates the atomic weight of this material based on the composition
     /// and the number of atoms per mol.  If \a apm is non-negative then it is
     /// used (and stored on the instance) as the atoms_per_molecule for this calculation.
@@ -368,6 +376,32 @@ namespace pyne
   /// This operator is also defined on inheritors of std::ostream
   std::ostream& operator<< (std::ostream& os, Material mat);
 
+  /// Mixes materials together in a single pass over their merged nuclides.
+  /// The result is identical to summing \a mats[i] * \a fracs[i] in order
+  /// with operator+, then setting the mass to 1 and the density of the mix.
+  /// \param mats The materials to mix.
+  /// \param fracs The mass fraction (or volume fraction if \a by_volume)
+  ///        of each material in the mix.
+  /// \param by_volume Whether \a fracs are volume fractions, in which case
+  ///        each material is weighted by fraction times density.
+  /// \return The mixed material, with a mass of 1.
+  Material mix(const std::vector<Material>& mats,
+               const std::vector<double>& fracs, bool by_volume=false);
+
+  /// Mixes many sets of materials at once, merging the nuclides of \a mats
+  /// only once. Mixture j is the mix() of the materials indexed by
+  /// \a indices[j] with fractions \a fracs[j].
+  /// \param mats The materials the mixtures are made of.
+  /// \param indices The indices into \a mats of the materials in each mixture.
+  /// \param fracs The mass or volume fractions of the materials in each
+  ///        mixture, matching \a indices.
+  /// \param by_volume Whether \a fracs are volume fractions.
+  /// \return The mixed materials, with masses of 1.
+  std::vector<Material> mix_many(const std::vector<Material>& mats,
+                                 const std::vector<std::vector<int> >& indices,
+                                 const std::vector<std::vector<double> >& fracs,
+                                 bool by_volume=false);
+
   /// A stuct for reprensenting fundemental data in a material.
   /// Useful for HDF5 representations.
   typedef struct material_data {
@@ -4,6 +4,72 @@ extern "C" {
 #include "utils.h"
 #include "transmuters.h"
 
+#include <thread>
+
+
+namespace {
+
+// Checks that the CRAM order is one that has been generated.
+void check_order(const int order) {
+  switch(order) {
+    case 6:
+    case 8:
+    case 10:
+    case 12:
+    case 14:
+    case 16:
+    case 18:
+      break;
+    default:
+      throw pyne::ValueError("Order selected not available for CRAM, please use"
+                             " order 6, 8, 10, 12, 14, 16, or 18.");
+      break;
+  }
+}
+
+// Dispatches to the CRAM solver of the given order.
+void expm_multiply(const int order, double* A, double* b, double* x) {
+  check_order(order);
+  switch(order) {
+    case 6:
+      pyne_cram_expm_multiply6(A, b, x);
+      break;
+    case 8:
+      pyne_cram_expm_multiply8(A, b, x);
+      break;
+    case 10:
+      pyne_cram_expm_multiply10(A, b, x);
+      break;
+    case 12:
+      pyne_cram_expm_multiply12(A, b, x);
+      break;
+    case 14:
+      pyne_cram_expm_multiply14(A, b, x);
+      break;
+    case 16:
+      pyne_cram_expm_multiply16(A, b, x);
+      break;
+    case 18:
+      pyne_cram_expm_multiply18(A, b, x);
+      break;
+  }
+}
+
+// Transmutes the compositions in the half-open range [start, stop).
+void cram_rows(const double* A, const int* mat_idx, const double* n0,
+               double* n1, int start, int stop, const int order) {
+  int n = pyne_cram_transmute_info.n;
+  int nnz = pyne_cram_transmute_info.nnz;
+  for (int r = start; r < stop; ++r) {
+    int m = (mat_idx == NULL) ? 0 : mat_idx[r];
+    // the generated solvers do not modify their inputs
+    expm_multiply(order, const_cast<double*>(A + m * nnz),
+                  const_cast<double*>(n0 + r * n), n1 + r * n);
+  }
+}
+
+} // namespace
+
 
 std::map<int, double> pyne::transmuters::cram(std::vector<double>& A,
                                               const std::map<int, double>& n0,
@@ -24,33 +90,7 @@ std::map<int, double> pyne::transmuters::cram(std::vector<double>& A,
 
   // perform decay
   vector<double> x (pyne_cram_transmute_info.n);
-  switch(order) {
-    case 6:
-      pyne_cram_expm_multiply6(A.data(), b.data(), x.data());
-      break;
-    case 8:
-      pyne_cram_expm_multiply8(A.data(), b.data(), x.data());
-      break;
-    case 10:
-      pyne_cram_expm_multiply10(A.data(), b.data(), x.data());
-      break;
-    case 12:
-      pyne_cram_expm_multiply12(A.data(), b.data(), x.data());
-      break;
-    case 14:
-      pyne_cram_expm_multiply14(A.data(), b.data(), x.data());
-      break;
-    case 16:
-      pyne_cram_expm_multiply16(A.data(), b.data(), x.data());
-      break;
-    case 18:
-      pyne_cram_expm_multiply18(A.data(), b.data(), x.data());
-      break;
-    default:
-      throw pyne::ValueError("Order selected not available for CRAM, please use"
-                             " order 6, 8, 10, 12, 14, 16, or 18.");
-      break;
-  }
+  expm_multiply(order, A.data(), b.data(), x.data());
 
   // convert back to map
   map<int, double> n1;
@@ -60,4 +100,35 @@ std::map<int, double> pyne::transmuters::cram(std::vector<double>& A,
     }
   }
   return n1;
-}
\ No newline at end of file
+}
+
+void pyne::transmuters::cram_batch(const double* A, int nmats,
+                                   const int* mat_idx, const double* n0,
+                                   double* n1, int ncomps, const int order,
+                                   int nthreads) {
+  check_order(order);
+  if (mat_idx != NULL) {
+    for (int r = 0; r < ncomps; ++r) {
+      if (mat_idx[r] < 0 || nmats <= mat_idx[r])
+        throw pyne::ValueError("Transmutation matrix index out of range.");
+    }
+  }
+  if (nthreads > ncomps)
+    nthreads = ncomps;
+  if (nthreads <= 1) {
+    cram_rows(A, mat_idx, n0, n1, 0, ncomps, order);
+    return;
+  }
+  // split the compositions into nearly equal contiguous blocks
+  std::vector<std::thread> threads;
+  threads.reserve(nthreads);
+  int start = 0;
+  for (int t = 0; t < nthreads; ++t) {
+    int stop = start + ncomps / nthreads + (t < ncomps % nthreads ? 1 : 0);
+    threads.push_back(std::thread(cram_rows, A, mat_idx, n0, n1, start, stop,
+                                  order));
+    start = stop;
+  }
+  for (int t = 0; t < nthreads; ++t)
+    threads[t].join();
+}
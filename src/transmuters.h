@@ -18,6 +18,24 @@ std::map<int, double> cram(std::vector<double>& A,
                            const std::map<int, double>& n0,
                            const int order=14);
 
+/// Batched CRAM solver that transmutes many compositions at once. The
+/// compositions are split across threads, each of which calls the CRAM
+/// solver for its rows in turn.
+/// \param A The flat transmutation matrices, nmats rows of
+///           pyne_cram_transmute_info.nnz values each [unitless]
+/// \param nmats The number of transmutation matrices in A
+/// \param mat_idx The row of A to use for each composition, may be NULL
+///                if all compositions share the first matrix
+/// \param n0 The initial compositions, ncomps rows of
+///           pyne_cram_transmute_info.n values each [atom fraction]
+/// \param n1 The output array, the same shape as n0 [atom fraction]
+/// \param ncomps The number of compositions
+/// \param order The order of approximation, default 14.
+/// \param nthreads The number of threads to use, default 1.
+void cram_batch(const double* A, int nmats, const int* mat_idx,
+                const double* n0, double* n1, int ncomps,
+                const int order=14, int nthreads=1);
+
 } // namespace transmuters
 } // namespace pyne
 #endif // PYNE_DQKIQSJ4SNG7VAB5LX36BLIYMA
\ No newline at end of file
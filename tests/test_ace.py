@@ -1,10 +1,14 @@
 #!/usr/bin/env python
 from __future__ import unicode_literals
 import os
+import shutil
+import numpy as np
 
-from nose.tools import assert_equal, assert_in, assert_almost_equal
+from nose.tools import assert_equal, assert_in, assert_almost_equal, \
+    assert_true, assert_false
 
 import pyne.ace
+import pyne.ace_cache
 
 def setup():
     try:
@@ -95,6 +99,102 @@ def test_read_c12_binary():
     assert_equal(table.reactions[2].sigma[0], 78.04874)
     assert_equal(table.reactions[2].sigma[-1], 1.00772)
 
+def test_read_c12_binary_lazy():
+    eager = pyne.ace.Library('C12-binary.ace')
+    eager.read()
+    c12 = pyne.ace.Library('C12-binary.ace')
+    c12.read('6000.00c', lazy=True)
+
+    assert_equal(c12.offsets['6000.00c'], 0)
+    table = c12.tables['6000.00c']
+    assert_equal(table.xss[0], 0.0)
+    assert_equal(len(table.xss), len(eager.tables['6000.00c'].xss))
+    assert_in('cross_sections', table._unread)
+
+    assert_almost_equal(table.energy[0], 1.0e-11)
+    assert_equal(table.reactions[2].sigma[0], 78.04874)
+    assert_equal(table.reactions[2].sigma[-1], 1.00772)
+    assert_in('angular', table._unread)
+
+    exp = eager.tables['6000.00c']
+    for mt, rxn in exp.reactions.items():
+        if hasattr(rxn, 'ang_energy_in'):
+            assert_equal(list(table.reactions[mt].ang_energy_in),
+                         list(rxn.ang_energy_in))
+    assert_equal(list(table.sigma_t), list(exp.sigma_t))
+
+    # tables stay readable once the library and its memory map are closed
+    with pyne.ace.Library('C12-binary.ace') as c12:
+        c12.read('6000.00c', lazy=True)
+        table = c12.tables['6000.00c']
+    assert_true(c12._mmap is None)
+    assert_in('angular', table._unread)
+    assert_equal(table.reactions[2].sigma[0], 78.04874)
+
+def test_read_c12_ascii_lazy():
+    c12 = pyne.ace.Library('C012-n.ace')
+    c12.read(lazy=True)
+    table = c12.tables['6000.00c']
+    assert_in(444, table.reactions)
+    assert_equal(table.reactions[2].sigma[0], 78.04874)
+
+def test_lazy_attribute_parity():
+    eager = pyne.ace.Library('C012-n.ace')
+    eager.read()
+    exp = eager.tables['6000.00c']
+    lazy = pyne.ace.Library('C012-n.ace')
+    lazy.read(lazy=True)
+    table = lazy.tables['6000.00c']
+    for name in dir(exp):
+        if name.startswith('_'):
+            continue
+        assert_true(hasattr(table, name), name)
+        if name.startswith('e_dist_'):
+            assert_equal(np.asarray(getattr(table, name)).tolist(),
+                         np.asarray(getattr(exp, name)).tolist())
+
+def test_read_c12_ascii_cache():
+    cache = pyne.ace_cache.AceCache('ace_cache_test')
+    cache.clear()
+    c12 = pyne.ace.Library('C012-n.ace', cache=cache)
+    c12.read()
+    assert_true(cache.has_tables('C012-n.ace'))
+    assert_true(cache.has_tables('C012-n.ace', ['6000.00c']))
+
+    cached = pyne.ace.Library('C012-n.ace', cache='ace_cache_test')
+    cached.read('6000.00c')
+    table = cached.tables['6000.00c']
+    assert_equal(table.nxs[1], 38937)
+    assert_equal(list(table.xss), list(c12.tables['6000.00c'].xss))
+    assert_equal(table.reactions[2].sigma[0], 78.04874)
+    assert_equal(table.reactions[2].sigma[-1], 1.00772)
+
+    cache.max_size = 0
+    cache.prune()
+    assert_false(cache.has_tables('C012-n.ace'))
+
+    # an entry directory without an index entry is reused, and the entries
+    # stored by another cache on the same directory are kept
+    other = pyne.ace_cache.AceCache('ace_cache_test')
+    os.makedirs(os.path.join(cache.directory, cache.key('C012-n.ace')))
+    cache.store('C012-n.ace', c12.tables.values(), complete=True)
+    assert_true(cache.has_tables('C012-n.ace'))
+    other.store('C012-n.ace', [])
+    assert_true(pyne.ace_cache.AceCache('ace_cache_test').has_tables(
+        'C012-n.ace'))
+
+    # an entry evicted by another cache on the same directory is parsed again
+    stale = pyne.ace_cache.AceCache('ace_cache_test')
+    cache.clear()
+    reread = pyne.ace.Library('C012-n.ace', cache=stale)
+    reread.read()
+    assert_equal(list(reread.tables['6000.00c'].xss),
+                 list(c12.tables['6000.00c'].xss))
+    assert_true(pyne.ace_cache.AceCache('ace_cache_test').has_tables(
+        'C012-n.ace'))
+
 def teardown():
     if os.path.exists('C12-binary.ace'):
         os.remove('C12-binary.ace')
+    if os.path.exists('ace_cache_test'):
+        shutil.rmtree('ace_cache_test')
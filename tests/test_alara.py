@@ -5,7 +5,7 @@ import subprocess
 
 from nose.tools import assert_almost_equal
 from nose.tools import assert_equal, assert_true, with_setup
-from numpy.testing import assert_array_equal
+from numpy.testing import assert_array_equal, assert_array_almost_equal
 import numpy as np
 import tables as tb
 import warnings
@@ -27,7 +27,10 @@ from pyne.mesh import Mesh, StatMesh, MeshError
 from pyne.material import Material
 from pyne.alara import mesh_to_fluxin, photon_source_to_hdf5, \
     photon_source_hdf5_to_mesh, mesh_to_geom, num_density_to_mesh, \
-    irradiation_blocks, record_to_geom, phtn_src_energy_bounds
+    irradiation_blocks, record_to_geom, phtn_src_energy_bounds, cram, \
+    clear_cram_cache
+from pyne import alara
+from pyne import data
 
 thisdir = os.path.dirname(__file__)
 
@@ -644,3 +647,24 @@ def test_phtn_src_energy_bounds():
                          1.00E7, 1.20E7, 1.40E7, 2.00E7]
 
     assert_array_equal(e_bounds, expected_e_bounds)
+
+def test_build_matrix():
+    A = alara._build_matrix(['H3', 'He3', 10010000])
+    lam = data.decay_const('H3')
+    exp = np.array([[-lam, 0.0, 0.0], [lam, 0.0, 0.0], [0.0, 0.0, 0.0]])
+    assert_array_almost_equal(A.toarray(), exp)
+
+def test_cram():
+    clear_cram_cache()
+    N = ['H3', 'He3']
+    t = data.half_life('H3')
+    for order in (14, 16):
+        n = cram(N, t, [1.0, 0.0], order)
+        assert_array_almost_equal(n, [0.5, 0.5])
+    # the factorizations are reused, also for several initial vectors
+    assert_equal(len(alara._cram_lu_cache), 2)
+    n = cram(N, t, [[1.0, 2.0], [0.0, 1.0]], 14)
+    assert_array_almost_equal(n, [[0.5, 1.0], [0.5, 2.0]])
+    assert_equal(len(alara._cram_lu_cache), 2)
+    clear_cram_cache()
+    assert_equal(len(alara._cram_lu_cache), 0)
@@ -1,8 +1,10 @@
 #!/usr/bin/env python
 
+import os
 from unittest import TestCase
 import warnings
-from nose.tools import assert_equal, assert_raises
+from nose.tools import assert_equal, assert_raises, assert_true, \
+    assert_false
 from nose.plugins.skip import SkipTest
 import numpy as np
 from numpy.testing import assert_array_almost_equal
@@ -62,6 +64,45 @@ class TestIsotxs(TestCase):
         assert nuc == nuc2
 
 
+def test_isotxs_lazy():
+    iso = Isotxs('ISOTXS')
+    try:
+        iso.read()
+    except:
+        raise SkipTest
+    lazy = Isotxs('ISOTXS')
+    lazy.read(lazy=True)
+    assert_equal(lazy.nuclides, [])
+    assert_false(os.path.isfile(lazy.index_file))
+    indexed = Isotxs('ISOTXS')
+    indexed.read(lazy=True, index=True)
+    assert_true(os.path.isfile(lazy.index_file))
+    assert_equal(indexed._records, lazy._records)
+    cached = Isotxs('ISOTXS')
+    cached.read(lazy=True, index=True)
+    assert_equal(cached._records, lazy._records)
+    os.remove(lazy.index_file)
+
+    nuc = iso.nuclides[20]
+    lazy_nuc = lazy.nuclide(20)
+    assert_equal(lazy_nuc.libParams, nuc.libParams)
+    assert_equal(lazy_nuc.micros, nuc.micros)
+    assert_true(lazy.find_nuclide('MNbl 0') is lazy_nuc)
+
+    ng = iso.fc['ngroup']
+    xs = cached.nuclide_xs(20)
+    assert_equal(xs['transport'].shape, (nuc.libParams['ltrn'], ng))
+    assert_array_almost_equal(xs['n,g'], [nuc.micros['n,g', g]
+                                          for g in range(ng)])
+    scat = cached.nuclide_scatter(20, block=0, order=1)
+    exp = np.zeros((ng, ng))
+    for key, value in nuc.micros.items():
+        if key[0] == 'scat' and key[1] == 0 and key[4] == 1:
+            exp[key[2], key[3]] = value
+    assert_array_almost_equal(scat, exp)
+    assert_raises(ValueError, cached.nuclide_scatter, 20, 3, 0)
+
+
 def test_rtflux_basics():
     rt = Rtflux("files_test_cccc/rtflux_3D")
     assert_equal(rt.hname, "rtflux")
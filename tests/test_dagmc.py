@@ -230,6 +230,35 @@ def discretize_geom_mix():
 
     return [results1, results2]
 
+def discretize_geom_parallel(queue):
+    from pyne import dagmc
+    dagmc.load(path)
+
+    coords = [-4, -1, 1, 4]
+    mesh = Mesh(structured=True, structured_coords=[coords, coords, coords])
+    serial_grid = dagmc.discretize_geom(mesh, num_rays=49, grid=True)
+    parallel_grid = dagmc.discretize_geom(mesh, num_rays=49, grid=True,
+                                          num_procs=2)
+    serial_rand = dagmc.discretize_geom(mesh, num_rays=10, seed=42)
+    parallel_rand = dagmc.discretize_geom(mesh, num_rays=10, seed=42,
+                                          num_procs=2)
+
+    pool = multiprocessing.Pool(1, dagmc._init_ray_worker, (path,))
+    try:
+        worker_geom = pool.apply(_worker_geometry)
+    finally:
+        pool.close()
+        pool.join()
+
+    queue.put([serial_grid, parallel_grid, serial_rand, parallel_rand,
+               _worker_geometry(), worker_geom])
+
+def _worker_geometry():
+    # query DagMC itself rather than the module dicts a fork inherits
+    from pyne import dagmc
+    count, vol_ids = dagmc.geom_id_list(3)
+    return [(i, int(dagmc.handle_from_id(3, i))) for i in sorted(vol_ids)]
+
 def discretize_non_square():
     from pyne import dagmc
     dagmc.load(path)
@@ -542,6 +571,26 @@ def test_discretize_geom_mix():
     assert(results2[0]['rel_error'] < results1[0]['rel_error'])
     assert(results2[1]['rel_error'] < results1[1]['rel_error'])
 
+def test_discretize_geom_parallel():
+    """Distributing mesh rows over worker processes gives the same results
+    as evaluating them serially.
+    """
+    if not HAVE_IMESH:
+        raise SkipTest
+
+    # pool workers may not start pools of their own, so use a plain process
+    queue = multiprocessing.Queue()
+    p = multiprocessing.Process(target=discretize_geom_parallel, args=(queue,))
+    p.start()
+    (serial_grid, parallel_grid, serial_rand, parallel_rand, parent_geom,
+     worker_geom) = queue.get()
+    p.join()
+
+    assert_array_equal(serial_grid, parallel_grid)
+    assert_array_equal(serial_rand, parallel_rand)
+    # workers see the same volumes as the parent, neither missing nor doubled
+    assert_equal(parent_geom, worker_geom)
+
 def test_descritize_non_square():
     """Test to make sure requesting a grid with a num_rays that is not a
     perfect square raises ValueError.
@@ -153,6 +153,43 @@ def test_branch_ratio():
     assert_equal(data.branch_ratio(932400001, 932400000), 0.0012)
 
 
+def test_array_lookups():
+    nucs = np.array([['H1', 'U235'], ['U235', 'H3']])
+    ids = nucname.id_array(nucs)
+    for func in (data.atomic_mass, data.half_life, data.decay_const,
+                 data.q_val, data.gamma_frac):
+        obs = func(nucs)
+        assert_equal(obs.shape, (2, 2))
+        exp = [[func(int(nuc)) for nuc in row] for row in ids]
+        npt.assert_array_equal(obs, exp)
+    npt.assert_array_equal(data.decay_const(np.array([922350001]),
+                                            use_metastable=False),
+                           [data.decay_const(922350001, False)])
+    npt.assert_array_equal(data.ingest_dose(np.array(['H3']), 1),
+                           [data.ingest_dose('H3', 1)])
+    # integer nuclides in other forms are normalized once and memoized
+    npt.assert_array_equal(data.atomic_mass(np.array([92235, 922350000])),
+                           [data.atomic_mass(922350000)] * 2)
+    table = data._dense_tables['atomic_mass',]
+    assert_true(92235 in table.raw)
+    assert_true(922350000 in table.raw)
+
+
+def test_branch_ratio_array():
+    obs = data.branch_ratio(np.array([922350001, 611460000, 922350001]),
+                            np.array([922350000, 621460000, 922350000]))
+    npt.assert_array_equal(obs, [1.0, 0.34299999999999997, 1.0])
+    obs = data.branch_ratio('H1', np.array(['H1', 'H2']))
+    npt.assert_array_equal(obs, [1.0, 0.0])
+
+
+def test_preload():
+    data.preload()
+    table = data._dense_tables['decay_const', True]
+    assert_true(len(table.ids) > 1000)
+    assert_equal(data.decay_const(np.array(['H1']))[0], 0.0)
+
+
 def test_state_energy():
     assert_equal(data.state_energy('H1'), 0.0)
     assert_equal(data.state_energy(922350001), 7.6e-5)
@@ -386,6 +423,30 @@ def test_alpha_child_byen():
     assert_equal(data.alpha_child_byen(5322.0, 0.1), [932370008, -952450000])
 
 
+def test_energy_windows():
+    en = np.array([661.65, 103.5])
+    obs = data.gamma_parent(en, np.array([0.1, 0.05]))
+    assert_equal([o.tolist() for o in obs],
+                 [data.gamma_parent(661.65, 0.1),
+                  data.gamma_parent(103.5, 0.05)])
+    obs = data.alpha_parent(np.array([5322.0, 5322.0]), 0.1)
+    assert_equal([o.tolist() for o in obs], [[952410000, 972490000]] * 2)
+    obs = data.beta_parent(np.array([5000.0]))
+    assert_equal([o.tolist() for o in obs], [data.beta_parent(5000.0)])
+    # overlapping windows given out of energy order
+    en = np.array([661.65, 103.5, 661.6])
+    obs = data.gamma_energy_byen(en, 0.1)
+    assert_equal([o.shape[1] for o in obs], [2, 2, 2])
+    assert_equal([[tuple(row) for row in o] for o in obs],
+                 [data.gamma_energy_byen(e, 0.1) for e in en.tolist()])
+    obs = data.gamma_from_to_byen(en, 0.1)
+    assert_equal([[tuple(row) for row in o] for o in obs],
+                 [data.gamma_from_to_byen(e, 0.1) for e in en.tolist()])
+    # no windows give no results
+    assert_equal(data.gamma_parent(np.array([])), [])
+    assert_equal(data.gamma_energy_byen(np.array([]), 0.1), [])
+
+
 def test_alpha_child_byparent():
     assert_equal(data.alpha_child_byparent(952410000),
                  [932370047, 932370043, 932370041, 932370038, 932370034,
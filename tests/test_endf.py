@@ -14,7 +14,7 @@ from numpy.testing import assert_array_equal, assert_allclose, \
 from pyne.utils import QAWarning
 warnings.simplefilter("ignore", QAWarning)
 
-from pyne.endf import Library, Evaluation
+from pyne.endf import Library, Evaluation, read_many
 from pyne.utils import endftod
 from pyne.rxdata import DoubleSpinDict
 from pyne.xs.data_source import ENDFDataSource
@@ -98,6 +98,38 @@ def test_get():
     assert_array_equal(exp, obs)
 
 
+def test_index():
+    tape = "sampletape1_index"
+    idx = tape + ".pyneidx"
+    with open(tape1path) as src, open(tape, "w") as dst:
+        dst.write(src.read())
+    if os.path.exists(idx):
+        os.remove(idx)
+    try:
+        Library(tape)
+        assert not os.path.exists(idx)
+        scanned = Library(tape, index=True)
+        assert os.path.isfile(idx)
+        with Library(tape, index=True) as indexed:
+            assert_equal(scanned.mat_dict, indexed.mat_dict)
+            assert_equal(scanned.structure, indexed.structure)
+            assert_array_equal(indexed.get_rx(nuc40000, 4, 2),
+                               library.get_rx(nuc40000, 4, 2))
+        assert indexed._mmap is None
+        # a stale index is rebuilt
+        with open(idx) as f:
+            saved = f.read()
+        with open(tape, "a") as f:
+            f.write(" ")
+        Library(tape, index=True)
+        with open(idx) as f:
+            assert saved != f.read()
+    finally:
+        for f in (tape, idx):
+            if os.path.exists(f):
+                os.remove(f)
+
+
 def test_unresolved_resonances_a():
     # Case A (ENDF Manual p.70)
     obs = library.structure[nuc1003]['data'][nuc1003]['unresolved']
@@ -660,6 +692,13 @@ def test_discretize():
            312.62178192130619, 590.40136068709603, 724.64216445611373]
     assert_array_almost_equal(nonelastic_c, exp)
 
+    # Ni59 has no fission channel, which is left at zero
+    reactions = [("Ni59", "fission"), ("Ni59", "nonelastic")]
+    obs = endfds.discretize_many(reactions, src_phi_g=np.ones((2, 32)))
+    assert_equal(obs.shape, (2, 2, 32))
+    assert_array_almost_equal(obs[1, 1], exp)
+    assert_array_equal(obs[:, 0], 0.0)
+
 
 def test_photoatomic():
     download_file("https://www-nds.iaea.org/fendl30/data/atom/endf/ph_3000_30-Zn.txt",
@@ -742,6 +781,26 @@ def test_evaluation_neutron():
     assert_array_almost_equal(r.angular_distribution.probability[5](mu), p)
 
 
+def test_read_many():
+    download_file('http://t2.lanl.gov/nis/data/endf/decayVII.1/092_U_233',
+                  'U233.txt', '3db23dc650bae28eabb92942dd7d0de5')
+    download_file('http://t2.lanl.gov/nis/data/data/ENDFB-VII.1-neutron/U/235',
+                  'U235.txt', "1b71da3769d8b1e675c3c579ba5cb2d3")
+    u233, u235 = read_many(['U233.txt', ('U235.txt', 9228)], skip_mf=[4, 5, 6],
+                           workers=2)
+    assert u233.material == 3513
+    assert u233.decay['half_life'] == (5023970000000.0, 6311520000.0)
+    assert u235.material == 9228
+    assert 80 in u235.reactions
+    assert u235.reactions[80].angular_distribution is None
+
+    exp = Evaluation('U235.txt', verbose=False)
+    exp.read(skip_mf=[4, 5, 6])
+    assert_array_equal(u235.reactions[80].xs.y, exp.reactions[80].xs.y)
+    assert_equal(read_many(['U233.txt'], workers=1)[0].decay['half_life'],
+                 u233.decay['half_life'])
+
+
 def test_evaluation_decay():
     download_file('http://t2.lanl.gov/nis/data/endf/decayVII.1/092_U_233',
                   'U233.txt', '3db23dc650bae28eabb92942dd7d0de5')
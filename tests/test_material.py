@@ -13,7 +13,8 @@ from pyne.utils import QAWarning
 warnings.simplefilter("ignore", QAWarning)
 from pyne import nuc_data
 from pyne.material import Material, from_atom_frac, from_hdf5, from_text, \
-    MapStrMaterial, MultiMaterial, MaterialLibrary
+    MapStrMaterial, MultiMaterial, MaterialLibrary, MaterialMatrix, mix, \
+    mix_many
 from pyne import jsoncpp
 from pyne import data
 from pyne import nucname
@@ -846,6 +847,44 @@ def test_delitem_int():
     assert_raises(KeyError, lambda: mat[922350000])
 
 
+def test_setitem_in_place():
+    mat = Material(leu, density=19.1, metadata={'name': 'leu'})
+    comp = mat.comp
+    mat[922340000] = 17.0
+    del mat[922350000]
+    assert_almost_equal(mat.mass, 17.96)
+    assert_equal(mat.density, 19.1)
+    assert_equal(mat.metadata['name'], 'leu')
+    assert_equal(comp[922380000], mat.comp[922380000])
+
+
+def test_update():
+    exp = Material(nucvec)
+    exp['U235'] = 2.0
+    exp[922380000] = 3.0
+    exp[10010000] = 0.5
+    updates = [
+        lambda mat: mat.update_many(np.array([922350000, 922380000, 10010000]),
+                                    [2.0, 3.0, 0.5]),
+        lambda mat: mat.update_many(['U235', 'U238', 'H1'],
+                                    np.array([2.0, 3.0, 0.5])),
+        lambda mat: mat.update({'U235': 2.0, 922380000: 3.0, 'H1': 0.5}),
+        lambda mat: mat.update([('U235', 2.0), (922380000, 3.0)], H1=0.5),
+        lambda mat: mat.update(U235=2.0, U238=3.0, H1=0.5)]
+    for update in updates:
+        mat = Material(nucvec)
+        update(mat)
+        assert_equal(set(mat.comp.keys()), set(exp.comp.keys()))
+        for nuc in exp.comp:
+            assert_almost_equal(mat.comp[nuc], exp.comp[nuc])
+        assert_almost_equal(mat.mass, exp.mass)
+    mass = mat.mass
+    mat.update([])
+    mat.update_many([], [])
+    assert_equal(mat.mass, mass)
+    assert_raises(ValueError, mat.update_many, ['U235'], [1.0, 2.0])
+
+
 def test_delitem_str():
     mat = Material(nucvec)
     assert_equal(mat[922350000], 1.0)
@@ -1104,6 +1143,40 @@ def test_multimaterial_mix_density():
 
     assert_equal(mat3.density, mat4.density)
 
+def test_mix_many():
+    mat1 = Material(nucvec={120240000:0.3, 300000000:0.2, 10010000:0.1}, density=2.71)
+    mat2 = Material(nucvec={60120000:0.2, 280640000:0.5, 10010000:0.12}, density=8.0)
+    mat3 = Material(nucvec={80160000:1.0}, density=1.0)
+    mats = [mat1, mat2, mat3]
+    for mat in mats:
+        mat.mass = 1
+    fracs = [[0.25, 0.75], [0.5, 0.3, 0.2], [1.0], [0.6, 0.4]]
+    indices = [[0, 1], [2, 0, 1], [1], [2, 0]]
+    for by_volume in (False, True):
+        mixed = mix_many(mats, indices, fracs, by_volume=by_volume)
+        assert_equal(len(mixed), len(fracs))
+        for idx, frac, obs in zip(indices, fracs, mixed):
+            # the result of the original pairwise mixing loop
+            exp = Material()
+            total = 0.0
+            total_frac = 0.0
+            for i, f in zip(idx, frac):
+                if by_volume:
+                    exp = exp + mats[i]*f*mats[i].density
+                    total += mats[i].density*f
+                else:
+                    exp = exp + mats[i]*f
+                    total_frac += f
+                    total += f/mats[i].density
+            assert_equal(obs.comp, exp.comp)
+            assert_equal(obs.mass, 1.0)
+            assert_equal(obs.density, total if by_volume else total_frac/total)
+            single = mix([mats[i] for i in idx], frac, by_volume)
+            assert_equal(single.comp, obs.comp)
+            assert_equal(single.density, obs.density)
+    assert_raises(ValueError, mix_many, mats, indices, fracs[:-1])
+
+
 def test_deepcopy():
     x = Material({'H1': 1.0}, mass=2.0, density=3.0, atoms_per_molecule=4.0,
                  metadata={'name': 'loki'})
@@ -1592,6 +1665,72 @@ def test_matlib_hdf5():
         assert_mat_almost_equal(wmatlib[key], rmatlib[key])
     os.remove(filename)
 
+def test_matlib_hdf5_lazy():
+    filename = "matlib_lazy.h5"
+    if filename in os.listdir('.'):
+        os.remove(filename)
+    water = Material()
+    water.from_atom_frac({10000000: 2.0, 80000000: 1.0})
+    water.metadata["name"] = "Aqua sera."
+    lib = {"leu": Material(leu), "nucvec": nucvec, "aqua": water}
+    wmatlib = MaterialLibrary(lib)
+    wmatlib.write_hdf5(filename)
+    rmatlib = MaterialLibrary(filename, lazy=True)
+    assert_equal(set(wmatlib), set(rmatlib))
+    assert_mat_almost_equal(wmatlib["Aqua sera."], rmatlib["Aqua sera."])
+    for i in range(len(rmatlib)):
+        mat = rmatlib.row(i)
+        assert_mat_almost_equal(wmatlib[mat.metadata["name"]], mat)
+    # a single-material write reads back through the same table
+    leu_mat = Material(leu)
+    leu_mat.metadata["name"] = "leu2"
+    leu_mat.write_hdf5(filename, datapath="/materials", nucpath="/nucid")
+    rmatlib = MaterialLibrary(filename)
+    assert_equal(len(rmatlib), 4)
+    assert_mat_almost_equal(rmatlib.row(3), leu_mat)
+    os.remove(filename)
+
+
+def test_material_matrix():
+    water = Material()
+    water.from_atom_frac({10010000: 2.0, 80160000: 1.0})
+    water.density = 1.0
+    water.metadata["name"] = "water"
+    fuel = Material({'U235': 0.04, 'U238': 0.96, 'Pu239': 0.0}, 42.0, 10.4)
+    mats = [water, fuel, Material({'H': 1.0}, 1.0, 2.0, 1.0)]
+    mm = MaterialMatrix.from_materials(mats)
+    assert_equal(mm.comp.shape, (3, 5))
+    assert_array_equal(mm.nucs, sorted(mm.nucs))
+
+    # round trip
+    for mat, mmat in zip(mats, mm):
+        nucs = set(nuc for nuc, frac in mat.comp.items() if frac != 0.0)
+        assert_equal(set(mmat.comp), nucs)
+        for nuc in nucs:
+            assert_almost_equal(mat.comp[nuc], mmat.comp[nuc])
+        assert_equal(mat.metadata, mmat.metadata)
+    lib = MaterialLibrary({"water": water, "fuel": fuel})
+    assert_equal(set(MaterialMatrix.from_library(lib).to_library()), set(lib))
+
+    # vectorized operations agree with the single material versions
+    atom_fracs = mm.to_atom_frac()
+    number_dens = mm.number_density()
+    activity = mm.activity()
+    for i, mat in enumerate(mats):
+        for nuc, af in mat.to_atom_frac().items():
+            if af != 0.0:
+                assert_almost_equal(atom_fracs[i, mm.index(nuc)], af)
+        for nuc, act in mat.activity().items():
+            if act != 0.0:
+                assert_almost_equal(activity[i, mm.index(nuc)] / act, 1.0)
+        assert_almost_equal(number_dens[i] / mat.number_density(), 1.0)
+    assert_array_almost_equal(mm.dot({'U235': 2.0}), [0.0, 0.08, 0.0])
+
+    collapsed = mm.collapse_elements(set(['U235']))
+    assert_array_equal(collapsed.nucs, [10000000, 80000000, 920000000,
+                                        922350000])
+    assert_array_almost_equal(collapsed.comp[1], [0.0, 0.0, 0.96, 0.04])
+
 
 def test_material_gammas():
     leu = {"U238": 0.96, "U235": 0.04}
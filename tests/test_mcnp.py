@@ -656,6 +656,44 @@ def test_read_events():
     del evt
 
 
+def test_read_chunks():
+    for test_file in ["mcnp_ptrac_i4_little.ptrac",
+                      "mcnp_ptrac_i8_little.ptrac"]:
+        p = mcnp.PtracReader(test_file)
+        expected = []
+        while True:
+            try:
+                p.read_nps_line()
+            except EOFError:
+                break
+            while p.next_event != 9000:
+                evt = {}
+                p.read_event_line(evt)
+                expected.append(evt)
+        del p
+
+        # use a tiny buffer so that records straddle buffer boundaries
+        p = mcnp.PtracReader(test_file)
+        chunks = list(p.read_chunks(chunk_size=4, buffer_size=50))
+        assert_true(all(len(chunk) <= 4 for chunk in chunks))
+        events = np.concatenate(chunks)
+        assert_equal(len(events), len(expected))
+        for evt, row in zip(expected, events):
+            for key, value in evt.items():
+                assert_equal(np.float32(value), row[key])
+        del p
+
+        # a record cut short at the end of the file is an error
+        with open(test_file, 'rb') as f:
+            truncated = f.read()[:-3]
+        with open("mcnp_ptrac_truncated.ptrac", 'wb') as f:
+            f.write(truncated)
+        p = mcnp.PtracReader("mcnp_ptrac_truncated.ptrac")
+        assert_raises(ValueError, list, p.read_chunks(buffer_size=50))
+        del p
+        os.remove("mcnp_ptrac_truncated.ptrac")
+
+
 def test_write_to_hdf5():
     test_files = ["mcnp_ptrac_i4_little.ptrac",
                   "mcnp_ptrac_i8_little.ptrac"]
@@ -1194,6 +1232,77 @@ def test_multiple_meshtally_meshtal():
         assert_array_equal(written, expected)
 
 
+def test_skip_meshtally():
+    """Test skipping the table of a mesh tally without reading it.
+    """
+    thisdir = os.path.dirname(__file__)
+    meshtal_file = os.path.join(thisdir, "mcnp_meshtal_multiple_meshtal.txt")
+    with open(meshtal_file, 'r') as f:
+        line = f.readline()
+        while not line.strip().startswith('Mesh Tally Number'):
+            line = f.readline()
+        mcnp._skip_meshtally(f)
+        # only a blank line separates the table from the next tally
+        assert_equal(f.readline().strip(), '')
+        assert_equal(f.readline().split(), ['Mesh', 'Tally', 'Number', '14'])
+
+
+def test_meshtal_select_tallies():
+    """Test reading only some of the mesh tallies of a meshtal file.
+    """
+
+    if not HAVE_PYTAPS:
+        raise SkipTest
+
+    thisdir = os.path.dirname(__file__)
+    meshtal_file = os.path.join(thisdir, "mcnp_meshtal_multiple_meshtal.txt")
+
+    expected_h5m_24 = os.path.join(thisdir, "mcnp_meshtal_tally_24.h5m")
+    expected_sm_24 = Mesh(mesh=expected_h5m_24, structured=True)
+
+    tags = {24: ["p_result", "p_rel_error",
+                 "p_total_result", "p_total_rel_error"]}
+    meshtal_object = mcnp.Meshtal(meshtal_file, tags, tally_numbers=[24])
+    assert_equal(list(meshtal_object.tally.keys()), [24])
+
+    for tag in tags[24][:2]:
+        for v_e, expected_v_e in zip(
+                meshtal_object.tally[24].structured_iterate_hex("xyz"),
+                expected_sm_24.structured_iterate_hex("xyz")):
+            written = meshtal_object.tally[24].mesh.getTagHandle(tag)[v_e]
+            expected = expected_sm_24.mesh.getTagHandle(tag)[expected_v_e]
+            assert_array_equal(written, expected)
+
+
+def test_malformed_meshtal_table():
+    """Test that tables with too many or too few entries are rejected.
+    """
+
+    if not HAVE_PYTAPS:
+        raise SkipTest
+
+    thisdir = os.path.dirname(__file__)
+    meshtal_file = os.path.join(thisdir, "mcnp_meshtal_single_meshtal.txt")
+    with open(meshtal_file, 'r') as f:
+        lines = f.readlines()
+    row = [i for i, line in enumerate(lines)
+           if line.strip().startswith('Energy')][0] + 1
+    tags = {4: ["n_result", "n_rel_error",
+                "n_total_result", "n_total_rel_error"]}
+
+    for extra in (" 1.00000E-01 2.00000E-01", ""):
+        malformed = list(lines)
+        if extra:
+            malformed[row] = malformed[row].rstrip() + extra + "\n"
+        else:
+            malformed[row] = malformed[row].rsplit(None, 1)[0] + "\n"
+        with open("mcnp_meshtal_malformed.txt", 'w') as f:
+            f.writelines(malformed)
+        assert_raises(ValueError, mcnp.Meshtal, "mcnp_meshtal_malformed.txt",
+                      tags)
+    os.remove("mcnp_meshtal_malformed.txt")
+
+
 def test_mesh_to_geom():
     if not HAVE_PYTAPS:
         raise SkipTest
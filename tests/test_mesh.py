@@ -4,6 +4,7 @@ import time
 import shutil
 import warnings
 import itertools
+import copy
 from operator import itemgetter
 from nose.tools import assert_true, assert_equal, assert_raises, with_setup, \
     assert_is, assert_is_instance, assert_in, assert_not_in, assert_almost_equal
@@ -19,7 +20,7 @@ except ImportError:
 from pyne.utils import QAWarning
 warnings.simplefilter("ignore", QAWarning)
 from pyne.mesh import Mesh, StatMesh, MeshError, Tag, MetadataTag, IMeshTag, \
-    ComputedTag
+    ComputedTag, ColumnarTag, CellFracs, MixtureCache
 from pyne.material import Material, MaterialLibrary
 
 def try_rm_file(filename):
@@ -239,6 +240,38 @@ class TestArithmetic():
                    for vol in self.mesh_1.structured_iterate_hex("xyz")]
         assert_array_almost_equal(exp_res, obs_res)
 
+    def test_add_mesh_columnar(self):
+        self.arithmetic_mesh_setup()
+        for m, data in ((self.mesh_1, [1.0, 2.0, 3.0, 4.0]),
+                        (self.mesh_2, [0.5, 0.5, 1.0, 1.0])):
+            m.f = ColumnarTag(mesh=m, name='f')
+            m.f[:] = data
+        mesh_3 = self.mesh_1 + self.mesh_2
+        assert_array_almost_equal(mesh_3.f[:], [1.5, 2.5, 4.0, 5.0])
+        assert_array_almost_equal(self.mesh_1.f[:], [1.0, 2.0, 3.0, 4.0])
+        self.mesh_1 += self.mesh_2
+        assert_array_almost_equal(self.mesh_1.f[:], [1.5, 2.5, 4.0, 5.0])
+        obs_res = [self.mesh_1.mesh.getTagHandle("flux")[vol]
+                   for vol in self.mesh_1.structured_iterate_hex("xyz")]
+        assert_array_almost_equal(obs_res, [2.1, 4.2, 6.3, 8.4])
+
+    def test_add_mesh_keeps_mats(self):
+        self.arithmetic_mesh_setup()
+        for i in range(len(self.mesh_1)):
+            self.mesh_1.mats[i] = Material({'H1': 1.0}, density=float(i),
+                                           metadata={'comment': 'h'})
+        mesh_3 = self.mesh_1 + self.mesh_2
+        for i in range(len(mesh_3)):
+            assert_equal(mesh_3.mats[i].comp, {10010000: 1.0})
+            assert_equal(mesh_3.mats[i].density, float(i))
+            assert_equal(mesh_3.mats[i].metadata['comment'], 'h')
+            assert_true(mesh_3.mats[i] is not self.mesh_1.mats[i])
+        assert_array_almost_equal(mesh_3.flux[:], [2.1, 4.2, 6.3, 8.4])
+
+        mesh_4 = Mesh(structured_coords=[[-1,0,1],[-1,0,1],[0,1]],
+                      structured=True, mats=None)
+        assert_true(copy.copy(mesh_4).mats is None)
+
     def test_subtract_mesh(self):
         self.arithmetic_mesh_setup()
         self.mesh_1 -= self.mesh_2
@@ -312,6 +345,35 @@ class TestArithmetic():
         assert_array_almost_equal(exp_res, obs_res)
         assert_array_almost_equal(exp_err, obs_err)
 
+    def test_add_statmesh_chunked(self):
+        self.arithmetic_statmesh_setup()
+        self.statmesh_1.arithmetic(self.statmesh_2, "+", chunk_size=3)
+        exp_res = [2.1, 4.2, 6.3, 8.4]
+        exp_err = [0.070790803558659549, 0.1415816071173191,
+                   0.21237241067597862, 0.28316321423463819]
+        obs_res = [self.statmesh_1.mesh.getTagHandle("flux")[vol]
+                   for vol in self.statmesh_1.structured_iterate_hex("xyz")]
+        obs_err = [self.statmesh_1.mesh.getTagHandle("flux_rel_error")[vol]
+                   for vol in self.statmesh_1.structured_iterate_hex("xyz")]
+        assert_array_almost_equal(exp_res, obs_res)
+        assert_array_almost_equal(exp_err, obs_err)
+
+    def test_multiply_statmesh_out_of_place(self):
+        self.arithmetic_statmesh_setup()
+        statmesh_3 = self.statmesh_1 * self.statmesh_2
+        exp_res = [1.1, 4.4, 9.9, 17.6]
+        exp_err = [0.1414213562, 0.2828427125, 0.4242640687, 0.5656854249]
+        obs_res = [statmesh_3.mesh.getTagHandle("flux")[vol]
+                   for vol in statmesh_3.structured_iterate_hex("xyz")]
+        obs_err = [statmesh_3.mesh.getTagHandle("flux_rel_error")[vol]
+                   for vol in statmesh_3.structured_iterate_hex("xyz")]
+        assert_array_almost_equal(exp_res, obs_res)
+        assert_array_almost_equal(exp_err, obs_err)
+        # the operands are untouched
+        obs_res = [self.statmesh_1.mesh.getTagHandle("flux")[vol]
+                   for vol in self.statmesh_1.structured_iterate_hex("xyz")]
+        assert_array_almost_equal([1.0, 2.0, 3.0, 4.0], obs_res)
+
 #############################################
 #Test Structured mesh iteration functionality
 #############################################
@@ -676,6 +738,62 @@ def test_imeshtag_expand():
     m.clam_001 = IMeshTag(1, float)
     assert_array_equal(m.clam_001[:], 2.2)
 
+def test_columnartag():
+    m = gen_mesh()
+    m.f = ColumnarTag(mesh=m, name='f')
+    m.f[:] = [1.0, 2.0, 3.0, 4.0]
+
+    # Getting tags
+    assert_equal(m.f[0], 1.0)
+    assert_array_equal(m.f[::2], [1.0, 3.0])
+    mask = np.array([True, False, True, True], dtype=bool)
+    assert_array_equal(m.f[mask], [1.0, 3.0, 4.0])
+    assert_array_equal(m.f[1, 0, 1, 3], [2.0, 1.0, 2.0, 4.0])
+    assert_raises(IndexError, m.f.__getitem__, 4)
+
+    # setting tags
+    m.f[::2] = 18.0
+    m.f[1::2] = [36.0, 54.0]
+    assert_array_equal(m.f[:], np.array([18.0, 36.0, 18.0, 54.0]))
+    mask = np.array([True, True, False, False], dtype=bool)
+    m.f[mask] = (19.0, 29.0)
+    m.f[3, 2] = 6.0, 28.0
+    assert_array_equal(m.f[:], np.array([19.0, 29.0, 28.0, 6.0]))
+
+    # vector tags
+    m.grape = ColumnarTag(2, float)
+    m.grape[[2, 0]] = [7.0, 8.0]
+    assert_array_equal(m.grape[:], [[7.0, 8.0], [0.0, 0.0], [7.0, 8.0],
+                                    [0.0, 0.0]])
+
+def test_columnartag_sync():
+    m = gen_mesh()
+    m.f = ColumnarTag(mesh=m, name='f')
+    m.f[:] = [1.0, 2.0, 3.0, 4.0]
+    assert_raises(iBase.TagNotFoundError, m.mesh.getTagHandle, 'f')
+    m.sync_tags()
+    assert_array_equal(m.mesh.getTagHandle('f')[list(m.iter_ve())],
+                       [1.0, 2.0, 3.0, 4.0])
+
+    # existing iMesh tags are loaded on creation
+    exp = IMeshTag(mesh=m, name='flux')[:]
+    m.flux = ColumnarTag(1, float)
+    assert_array_equal(m.flux[:], exp)
+
+    m.tag('g', value=[[1, 2]] * 4, tagtype='columnar', size=2, dtype=int)
+    assert_is_instance(m.g, ColumnarTag)
+    assert_array_equal(m.g[3], [1, 2])
+
+def test_columnartag_write_hdf5():
+    filename = "test_columnartag_write_hdf5.h5m"
+    m = gen_mesh()
+    m.f = ColumnarTag(1, float)
+    m.f[:] = [1.0, 2.0, 3.0, 4.0]
+    m.write_hdf5(filename)
+    m2 = Mesh(mesh=filename, structured=True, structured_ordering='zyx')
+    assert_array_equal(m2.f[:], [1.0, 2.0, 3.0, 4.0])
+    os.remove(filename)
+
 def test_comptag():
     mats = {
         0: Material({'H1': 1.0, 'K39': 1.0}, density=42.0),
@@ -785,6 +903,49 @@ def test_cell_fracs_to_mats():
         assert_equal(mat.density, 1.0)
 
 
+def test_cell_fracs_to_mats_cache():
+    m = Mesh(structured=True, structured_coords=[[0, 1, 2, 3], [0, 1], [0, 1]])
+    cell_fracs = np.zeros(5, dtype=[('idx', np.int64),
+                                    ('cell', np.int64),
+                                    ('vol_frac', np.float64),
+                                    ('rel_error', np.float64)])
+    cell_mats = {11: Material({'H': 1.0}, density = 1.0),
+                 12: Material({'He': 1.0}, density = 1.0)}
+    cell_fracs[:] = [(0, 11, 0.5, 0.0), (0, 12, 0.5, 0.0),
+                     (1, 11, 0.5000001, 0.0), (1, 12, 0.4999999, 0.0),
+                     (2, 11, 1.0, 0.0)]
+
+    cache = m.cell_fracs_to_mats(cell_fracs, cell_mats)
+    assert_equal((cache.hits, cache.misses), (0, 3))
+
+    cache = MixtureCache(sig_figs=4)
+    m.cell_fracs_to_mats(cell_fracs, cell_mats, cache=cache)
+    assert_equal((cache.hits, cache.misses), (1, 2))
+    assert_equal(len(cache), 2)
+    assert_equal(m.mats[1].comp, {10000000: 0.5, 20000000: 0.5})
+    assert_equal(m.mats[2].comp, {10000000: 1.0})
+    # volume elements do not share material objects unless asked to
+    assert_true(m.mats[0] is not m.mats[1])
+    m.cell_fracs_to_mats(cell_fracs, cell_mats,
+                         cache=MixtureCache(sig_figs=4, share=True))
+    assert_true(m.mats[0] is m.mats[1])
+
+    # volume fractions are rounded to significant figures, not decimals
+    rows = cell_fracs[4:5].copy()
+    rows['vol_frac'] = 1e-4
+    small = cache.key(rows, cell_mats)
+    rows['vol_frac'] = 4e-4
+    assert_true(small != cache.key(rows, cell_mats))
+    rows['vol_frac'] = 1.00001e-4
+    assert_equal(small, cache.key(rows, cell_mats))
+
+    # reusing the cache with other cell materials does not reuse mixtures
+    other_mats = {11: Material({'Li': 1.0}, density = 1.0),
+                  12: Material({'He': 1.0}, density = 1.0)}
+    m.cell_fracs_to_mats(cell_fracs, other_mats, cache=cache)
+    assert_equal((cache.hits, cache.misses), (2, 4))
+    assert_equal(m.mats[2].comp, {30000000: 1.0})
+
 def test_tag_cell_fracs():
     m = gen_mesh()
     cell_fracs = np.zeros(7, dtype=[('idx', np.int64),
@@ -814,6 +975,27 @@ def test_tag_cell_fracs():
         assert_equal(m.cell_largest_frac[i],
                            exp_cell_largest_frac[i])
 
+def test_cell_fracs_index():
+    cell_fracs = np.zeros(7, dtype=[('idx', np.int64),
+                                    ('cell', np.int64),
+                                    ('vol_frac', np.float64),
+                                    ('rel_error', np.float64)])
+    cell_fracs[:] = [(0, 11, 0.55, 0.0), (0, 12, 0.45, 0.0), (1, 11, 0.2, 0.0),
+                     (1, 12, 0.3, 0.0), (1, 13, 0.5, 0.0), (3, 11, 1.0, 0.0),
+                     (4, 12, 1.0, 0.0)]
+    cf = CellFracs(cell_fracs)
+    assert_equal(len(cf), 5)
+    for i in range(5):
+        assert_array_equal(cf[i], cell_fracs[cell_fracs['idx'] == i])
+    assert_array_equal(cf.counts(), [2, 3, 0, 1, 1])
+    assert_array_equal(cf.positions(), [0, 1, 0, 1, 2, 0, 0])
+
+    # unsorted input and extra volume elements
+    cf = CellFracs(cell_fracs[::-1], num_ve=6)
+    assert_equal(len(cf), 6)
+    assert_array_equal(cf[1]['cell'], [13, 12, 11])
+    assert_equal(len(cf[5]), 0)
+
 def test_tag_cell_fracs_subvoxel_equal_voxel():
     m = Mesh(structured=True,
              structured_coords=[[0, 0.5, 1], [0, 0.5, 1], [0, 0.5, 1]],
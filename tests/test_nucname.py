@@ -7,6 +7,9 @@ import warnings
 from nose.tools import assert_equal, assert_not_equal, assert_raises, raises, assert_in, \
     assert_true, assert_false
 
+import numpy as np
+from numpy.testing import assert_array_equal
+
 from pyne.utils import QAWarning
 warnings.simplefilter("ignore", QAWarning)
 from pyne import nucname
@@ -580,6 +583,37 @@ def test_ensdf_to_id():
     assert_equal(nucname.ensdf_to_id('269Hs'), 1082690000)
 
 
+def test_id_cache():
+    nucname._id_cache.clear()
+    assert_equal(nucname.id('U235'), 922350000)
+    assert_in('U235', nucname._id_cache)
+    assert_equal(nucname.id('U235'), 922350000)
+    assert_raises(RuntimeError, nucname.id, 'Q235')
+    assert_false('Q235' in nucname._id_cache)
+
+
+def test_id_array():
+    obs = nucname.id_array(np.array([['U235', 'H1'], ['U235', 'Am242m']]))
+    exp = np.array([[922350000, 10010000], [922350000, 952420001]])
+    assert_array_equal(obs, exp)
+    assert_equal(obs.shape, (2, 2))
+    assert_array_equal(nucname.id_array(np.array([b'U235', b'H1'])),
+                       [922350000, 10010000])
+    assert_array_equal(nucname.id_array([92235, 10010]),
+                       [922350000, 10010000])
+    assert_equal(nucname.id_array([]).shape, (0,))
+
+
+def test_name_array():
+    assert_array_equal(nucname.name_array([922350000, 10010000, 922350000]),
+                       ['U235', 'H1', 'U235'])
+
+
+def test_mcnp_to_id_array():
+    assert_array_equal(nucname.mcnp_to_id_array(np.array([92235, 95642, 95242])),
+                       [922350000, 952420000, 952420001])
+
+
 if __name__ == "__main__":
     nose.runmodule()
 
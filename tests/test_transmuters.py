@@ -1,5 +1,6 @@
 """Transmuter tests"""
-from nose.tools import assert_equal, assert_almost_equal
+import numpy as np
+from nose.tools import assert_equal, assert_almost_equal, assert_raises
 
 from pyne import data
 from pyne import cram
@@ -15,6 +16,28 @@ def test_transmuters_cram():
     assert_almost_equal(0.5, n1[nucname.id('He3')])
 
 
+def test_transmuters_cram_batch():
+    h3 = cram.NUCS_IDX['H3']
+    he3 = cram.NUCS_IDX['He3']
+    A = -cram.DECAY_MATRIX * data.half_life('H3')
+    n0 = np.zeros((5, cram.N))
+    n0[:, h3] = np.arange(1, 6)
+    # one shared matrix
+    n1 = transmuters.cram_batch(A, n0, order=16, nthreads=2)
+    assert_equal(n0.shape, n1.shape)
+    for i in range(5):
+        assert_almost_equal(0.5 * (i + 1), n1[i, h3])
+        assert_almost_equal(0.5 * (i + 1), n1[i, he3])
+    # distinct matrices selected per composition
+    As = np.array([A, 2 * A])
+    n1 = transmuters.cram_batch(As, n0, order=16, mat_idx=[0, 1, 0, 1, 1])
+    assert_almost_equal(0.5, n1[0, h3])
+    assert_almost_equal(0.5, n1[1, h3])
+    assert_almost_equal(0.75, n1[3, he3] / 4)
+    assert_raises(ValueError, transmuters.cram_batch, As, n0)
+    assert_raises(ValueError, transmuters.cram_batch, A, n0, order=15)
+
+
 # Run as script
 #
 if __name__ == "__main__":
@@ -189,6 +189,23 @@ def test_toggle_warnings():
     observed = utils.toggle_warnings()
     assert_equal(state, not observed)
 
+def test_index():
+    fname = 'utils_index_test.dat'
+    with open(fname, 'w') as f:
+        f.write('data')
+    try:
+        assert_equal(utils.load_index(fname), None)
+        utils.save_index(fname, {'offsets': [0, 2]})
+        utils.save_index(fname, {'offsets': [0, 3]})
+        assert_equal(utils.load_index(fname)['offsets'], [0, 3])
+        with open(fname, 'a') as f:
+            f.write('more data')
+        assert_equal(utils.load_index(fname), None)
+    finally:
+        for name in (fname, fname + utils.INDEX_SUFFIX):
+            if os.path.exists(name):
+                os.remove(name)
+
 if __name__ == "__main__":
     nose.runmodule()
 
@@ -18,6 +18,7 @@ warnings.simplefilter("ignore", QAWarning)
 from pyne import nuc_data
 from pyne import nucname as nn
 from pyne import data
+from pyne import rxname
 from pyne.material import Material
 from pyne.transmute.chainsolve import Transmuter
 
@@ -135,6 +136,49 @@ def test_tm171_decay():
     obs = tm.transmute(inp, t=t_sim, phi=0.0, tol=1e-7)
     assert_equal(exp, obs['TM171'])
 
+def test_chain_end_density():
+    """Tests the Bateman chain solution against the matrix exponential."""
+    t = tm.t
+    tm.t = 10.0
+    try:
+        for dests in ([0.1, 0.02, 0.5], [0.1, 0.1, 0.1], [0.3, 0.0]):
+            prods = [0.05] * (len(dests) - 1)
+            A = np.diag(-np.array(dests)) + np.diag(prods, -1)
+            N0 = np.zeros(len(dests))
+            N0[0] = 1.0
+            exp = np.dot(linalg.expm(A * tm.t), N0)[-1]
+            obs = tm._chain_end_density(dests, prods)
+            assert_almost_equal(exp / obs, 1.0)
+    finally:
+        tm.t = t
+
+def test_bateman_method():
+    """Tests that the Bateman method agrees with the dense method and caches
+    its results."""
+    t_sim = 1.2119E+8
+    inp = Material({'TM171': 0.5, 'SR90': 0.5}, mass=1.0)
+    exp = tm.transmute(inp, t=t_sim, phi=0.0, tol=1e-7)
+    btm = Transmuter(method='bateman')
+    obs = btm.transmute(inp, t=t_sim, phi=0.0, tol=1e-7)
+    assert_equal(set(exp.comp), set(obs.comp))
+    for nuc in exp.comp:
+        assert_almost_equal(exp.comp[nuc] / obs.comp[nuc], 1.0)
+    assert_equal(btm.cache_misses, 2)
+    assert_equal(btm.cache_hits, 0)
+    btm.transmute(inp, t=t_sim, phi=0.0, tol=1e-7)
+    assert_equal(btm.cache_hits, 2)
+    btm.clear_cache()
+    assert_equal(btm.cache_hits, 0)
+    # reassigning the reactions discards the memoized chains
+    btm.transmute(inp, t=t_sim, phi=0.0, tol=1e-7)
+    btm.rxs = btm.rxs - set([rxname.id('gamma')])
+    assert_equal(len(btm._partials), 0)
+    assert_equal(len(btm._graphs), 0)
+    assert_raises(ValueError, Transmuter, method='sparse')
+    # extra positional arguments are ignored rather than taken as the method
+    assert_equal(Transmuter(0.0, 0.0, 300.0, 1e-7, None, None, 'x').method,
+                 'expm')
+
 #
 # Run as script
 #
@@ -1,4 +1,5 @@
 import os
+import shutil
 
 import numpy as np
 import tables as tb
@@ -8,7 +9,7 @@ from nose.tools import assert_equal, assert_not_equal, assert_almost_equal, \
 from numpy.testing import assert_array_equal, assert_array_almost_equal
 
 from pyne.xs import data_source
-from pyne.xs.cache import xs_cache
+from pyne.xs.cache import xs_cache, XSCache
 from pyne.pyne_config import pyne_conf
 
 nuc_data = pyne_conf.NUC_DATA_PATH
@@ -85,3 +86,52 @@ def test_xs_cache_get_phi_g():
     assert_array_equal(phi_g, expected)    
 
 
+def test_xs_cache_contexts():
+    xsc = XSCache(group_struct=[10.0, 1.0, 1E-2], max_size=48,
+                  data_sources=[data_source.NullDataSource])
+    xsc['phi_g'] = [1.0, 2.0]
+    sigma_f = xsc[10010, 'fiss']
+    xsc['phi_g'] = [2.0, 1.0]
+    assert_false((10010, 'fiss') in xsc)
+    xsc[10010, 'fiss']
+
+    # switching back reuses the cross sections of the first flux
+    xsc['phi_g'] = [1.0, 2.0]
+    assert_equal(id(sigma_f), id(xsc[10010, 'fiss']))
+    assert_equal((xsc.hits, xsc.misses, xsc.evictions), (1, 2, 0))
+
+    # three 16 byte cross sections fit the budget
+    for nuc in (20040, 30060, 30070):
+        xsc[nuc, 'fiss']
+    assert_equal(xsc.evictions, 2)
+    assert_equal(xsc.nbytes, 48)
+    assert_true((10010, 'fiss') not in xsc)
+
+
+def test_xs_cache_store():
+    store = 'xs_cache_store'
+    if os.path.exists(store):
+        shutil.rmtree(store)
+    try:
+        xsc = XSCache(group_struct=[10.0, 1.0, 1E-2], store=store,
+                      data_sources=[data_source.NullDataSource])
+        xsc[10010, 'fiss'] = np.array([1.0, 2.0])
+        shared = XSCache(group_struct=[10.0, 1.0, 1E-2], store=store,
+                         store_readonly=True,
+                         data_sources=[data_source.NullDataSource])
+        assert_array_equal(shared[10010, 'fiss'], [1.0, 2.0])
+        assert_equal(shared.store_hits, 1)
+        # equivalent keys share a stored cross section
+        assert_array_equal(shared['H1', 'fiss'], [1.0, 2.0])
+        assert_equal(shared.store_hits, 2)
+        # cross sections from other data sources are stored apart
+        if cinderds.exists:
+            other = XSCache(group_struct=[10.0, 1.0, 1E-2], store=store,
+                            store_readonly=True,
+                            data_sources=[data_source.CinderDataSource,
+                                          data_source.NullDataSource])
+            other[10010, 'fiss']
+            assert_equal(other.store_hits, 0)
+    finally:
+        if os.path.exists(store):
+            shutil.rmtree(store)
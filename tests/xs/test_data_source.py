@@ -12,7 +12,7 @@ import numpy as np
 import tables as tb
 
 from nose.tools import assert_equal, assert_not_equal, assert_almost_equal, \
-    assert_true, assert_is
+    assert_true, assert_is, assert_raises
 from numpy.testing import assert_array_equal, assert_array_almost_equal
 
 from pyne.utils import QAWarning
@@ -390,6 +390,31 @@ def test_eaf_invalid_str_RX():
     assert_array_equal(observed, expected)
 
 
+def test_eaf_load():
+    if not eafds.exists:
+        return
+    eafds.load()
+    with tb.open_file(nuc_data, 'r') as f:
+        rows = f.root.neutron.eaf_xs.eaf_xs.read_where('nuc_zz == 250550')
+    obs = eafds.reaction(250550, 'absorption')
+    assert_array_almost_equal(rows['xs'].sum(axis=0), obs)
+    assert_true(obs.base is eafds._table.xs)
+    assert_true(eafds.reaction(250550, 'na').base is eafds._table.xs)
+
+
+def test_eaf_discretize_many():
+    if not eafds.exists:
+        return
+    ds = data_source.EAFDataSource(dst_group_struct=np.logspace(1, -9, 4))
+    reactions = [(250550, 'na'), (250550, 'absorption'), (10010, 'fission')]
+    phi = np.random.random((5, ds.src_ngroups))
+    observed = ds.discretize_many(reactions, src_phi_g=phi)
+    assert_equal(observed.shape, (5, 3, 3))
+    assert_array_almost_equal(observed[2, 0],
+                              ds.discretize(250550, 'na', src_phi_g=phi[2]))
+    assert_array_equal(observed[:, 2], 0.0)
+
+
 def test_eaf_multiple_xs():
     # Currently no case where multiple rows from nuc_data should be combined...
     pass
@@ -420,6 +445,19 @@ def test_openmc():
     assert_equal(10, len(obs))
     assert_true(np.all(obs >= 0.0))
 
+def test_openmc_discretize_many():
+    sample_xs_openmc.seek(0)
+    ods = data_source.OpenMCDataSource(cross_sections=sample_xs_openmc,
+                                       src_group_struct=np.logspace(1, -9, 11))
+    reactions = [('W180', 2), ('W180', 'total'), ('U-235', 42)]
+    assert_raises(ValueError, ods.discretize_many, reactions)
+    ods.dst_group_struct = np.logspace(1, -9, 5)
+    obs = ods.discretize_many(reactions)
+    assert_equal(obs.shape, (1, 3, 4))
+    assert_array_almost_equal(obs[0, 0], ods.discretize('W180', 2))
+    assert_array_almost_equal(obs[0, 2], 0.0)
+
+
 def test_openmc_bkg_none():
     C_12 = 60120000
     W_180 = 741800000
@@ -11,7 +11,8 @@ import pyne
 from pyne.xs.models import partial_energy_matrix, partial_energy_matrix_mono, chi, \
                            alpha, k, m_n, beta, alpha_at_theta_0, alpha_at_theta_pi, \
                            one_over_gamma_squared, E_prime_min, sigma_s_const, \
-                           sigma_s, phi_g, group_collapse, thermspect, fastspect 
+                           sigma_s, phi_g, group_collapse, group_collapse_many, \
+                           thermspect, fastspect
 from pyne.pyne_config import pyne_conf
 
 nuc_data = pyne_conf.NUC_DATA_PATH
@@ -341,6 +342,26 @@ def test_wgt_group_collapse1():
     expected = group_collapse(sigma_n, phi_n, E_g=E_g, E_n=E_n)
     assert_array_almost_equal(observed, expected)
 
+def test_group_collapse_many():
+    E_g = np.array([0.0, 4.0, 8.0])
+    E_n = np.array([0.0, 2.5, 5.0, 7.5, 10.0])
+
+    phi_n = np.array([[0.0, 2.0, 1.0, 0.5],
+                      [1.0, 1.0, 1.0, 1.0],
+                      [0.0, 0.0, 0.0, 0.0]])
+    sigma_n = np.array([[1.0, 2.0, 3.0, 4.0],
+                        [4.0, 3.0, 2.0, 1.0]])
+
+    observed = group_collapse_many(sigma_n, phi_n, E_g=E_g, E_n=E_n)
+    assert_equal(observed.shape, (3, 2, 2))
+    for s in range(3):
+        for r in range(2):
+            expected = group_collapse(sigma_n[r], phi_n[s], E_g=E_g, E_n=E_n)
+            assert_array_almost_equal(observed[s, r], expected)
+
+    # bad call
+    assert_raises(ValueError, group_collapse_many, sigma_n, phi_n)
+
 #
 # Test physical models
 #